@@ -18,15 +18,22 @@
 from strategy import Strategy
 from board import ReversiBoard
 import math
-import heuristics
+from heuristics import gameHeuristics
 import time
+from evaluationCache import sharedEvaluationCache
 
 
 maximixingPlayer = None
 
+
 class MinMaxStrategy(Strategy):
     difficulty = None
 
+    # The cache of the values of the leaves, shared with the alpha-beta strategy (see evaluationCache.py).
+    # It can be turned off with useEvaluationCache.
+    evaluationCache = sharedEvaluationCache
+    useEvaluationCache = True
+
 
     ##############################################################################################################################    
     
@@ -49,33 +56,18 @@ class MinMaxStrategy(Strategy):
         if(MinMaxStrategy.difficulty == "easy"):
             return board.getScore(maximixingPlayer) - board.getScore(board.getOpponent(maximixingPlayer))
         
-        hueristicsObj = heuristics.GameHeuristics()
-        coin_parity = hueristicsObj.coinParity(board,maximixingPlayer)
-        
-        mobility = hueristicsObj.mobility(board,maximixingPlayer)
-        cornersCaptured = hueristicsObj.cornersCaptured(board,maximixingPlayer)
-        stability = hueristicsObj.stability(board,maximixingPlayer)
-        utility = hueristicsObj.utility(board,maximixingPlayer)
-        
-        combinedHeuristic = hueristicsObj.combinedHeuristics(board,maximixingPlayer)
-        
-        if(utility > 100 or utility < -100):
-            raise Exception("Utility is greater than 100 or less than -100")
-        
-        if(coin_parity > 100 or coin_parity < -100):
-            raise Exception("Coin Parity is greater than 100 or less than -100")
-        
-        if(stability > 100 or stability < -100):
-            raise Exception("Stability is greater than 100 or less than -100")
-        
-        if(mobility > 100 or mobility < -100):
-            raise Exception("Mobility is greater than 100 or less than -100")
-        
-        if(cornersCaptured > 100 or cornersCaptured < -100):
-            raise Exception("Corners Captured is greater than 100 or less than -100")
-        
-        # return utility
-        return combinedHeuristic
+        if(not MinMaxStrategy.useEvaluationCache):
+            return gameHeuristics.evaluate(board,maximixingPlayer)
+
+        # The fused evaluator computes every heuristic in one pass (the range checks only run in the debug mode of GameHeuristics)
+        # The value is looked up in the evaluation cache first, since the same leaves are reached again by the next searches.
+        evaluationCache = MinMaxStrategy.evaluationCache
+        key = evaluationCache.getKey(board,maximixingPlayer,gameHeuristics.getConfiguration())
+        value = evaluationCache.probe(key)
+        if(value is None):
+            value = gameHeuristics.evaluate(board,maximixingPlayer)
+            evaluationCache.store(key,value)
+        return value
         
     #     return combinedHeuristic
 
@@ -100,7 +92,6 @@ class MinMaxStrategy(Strategy):
         print(f"Maximizing Player = {maximixingPlayer}")
         maximixingPlayer = player
         print(f"Maximizing Player = {maximixingPlayer}")
-        super().getBestMove(boardToGetBestMove,player,depth)
 
 
         if (boardToGetBestMove.isGameOver()):
@@ -117,11 +108,12 @@ class MinMaxStrategy(Strategy):
         
         # If there are valid moves, then find the best move using MinMax algorithm.
 
+        # The moves are made and undone on a single copy of the board, so the game board is never modified.
+        newBoard = boardToGetBestMove.getCopy()
+
         for move in validMoves:
             
 
-            newBoard = ReversiBoard()
-            newBoard = boardToGetBestMove.getCopy()
             # print(newBoard == boardToGetBestMove)
             # print(id(newBoard) == id(boardToGetBestMove))
             # print(id(newBoard.board) == id(boardToGetBestMove.board))
@@ -132,6 +124,7 @@ class MinMaxStrategy(Strategy):
 
             # print("Move: ",move)
             score = MinMaxStrategy.minMax(newBoard,player,depth-1,False)
+            newBoard.undoMove()
             # print("Score: ",score)
 
 
@@ -173,9 +166,9 @@ class MinMaxStrategy(Strategy):
             validMoves = boardtoGetMinMax.getValidMoves(player)
             # print("Valid Moves: ",validMoves)
             for move in validMoves:
-                newBoard = boardtoGetMinMax.getCopy()
-                newBoard.makeMove(player,move[0],move[1])
-                eval = MinMaxStrategy.minMax(newBoard,player,depth-1,False)
+                boardtoGetMinMax.makeMove(player,move[0],move[1])
+                eval = MinMaxStrategy.minMax(boardtoGetMinMax,player,depth-1,False)
+                boardtoGetMinMax.undoMove()
                 if(maxEval == None or eval > maxEval):
                     maxEval = eval
             return maxEval
@@ -185,9 +178,21 @@ class MinMaxStrategy(Strategy):
             validMoves = boardtoGetMinMax.getValidMoves(boardtoGetMinMax.getOpponent(player))
             # print("Valid Moves: ",validMoves)
             for move in validMoves:
-                newBoard = boardtoGetMinMax.getCopy()
-                newBoard.makeMove(boardtoGetMinMax.getOpponent(player),move[0],move[1])
-                eval = MinMaxStrategy.minMax(newBoard,player,depth-1,True)
+                boardtoGetMinMax.makeMove(boardtoGetMinMax.getOpponent(player),move[0],move[1])
+                eval = MinMaxStrategy.minMax(boardtoGetMinMax,player,depth-1,True)
+                boardtoGetMinMax.undoMove()
                 if(minEval == None or eval < minEval):
                     minEval = eval
-            return minEval
\ No newline at end of file
+            return minEval
+
+
+    # Method Name: setUseEvaluationCache
+    # Turns the evaluation cache on or off (see useEvaluationCache).
+    def setUseEvaluationCache(isUsed):
+        MinMaxStrategy.useEvaluationCache = isUsed
+
+    # Method Name: getEvaluationCacheHitRate
+    # Returns the share of the cache probes that found their leaf in the evaluation cache since it was last cleared (between 0 and 1).
+    # The cache is shared with the alpha-beta strategy, so the counters are the ones of both strategies.
+    def getEvaluationCacheHitRate():
+        return MinMaxStrategy.evaluationCache.getHitRate()
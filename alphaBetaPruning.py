@@ -25,16 +25,100 @@
 
 from board import ReversiBoard
 from strategy import Strategy
+from transpositionTable import TranspositionTable, EXACT, LOWER_BOUND, UPPER_BOUND
+from moveOrdering import MoveOrdering
 import math
+import time
 import heuristics
+from heuristics import gameHeuristics
+import multiprocessing
+from evaluationCache import sharedEvaluationCache
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 
 maximixingPlayer = None
 
+
+# The scores in the transposition table are calculated for the maximizing player,
+# so the key of the maximizing player is XORed into the hash to keep the entries of the two players apart.
+PERSPECTIVE_KEYS = {"B": 0, "W": 0x9E3779B97F4A7C15}
+
+# The width of the zero windows of MTD(f). The scores are floats, so a test "is the score at least beta?" is searched with the window (beta - NULL_WINDOW, beta).
+NULL_WINDOW = 1e-6
+
+# When the aspiration window doubles to this half width, the side that failed is opened completely.
+ASPIRATION_MAX_WINDOW = 100
+
+# This exception is raised inside the search when its time or nodes budget runs out, to stop it right away.
+class SearchTimeout(Exception):
+    pass
+
+# The pool of worker processes of the parallel search and the alpha value that they share (see setParallelWorkers).
+parallelPool = None
+parallelSharedAlpha = None
+
 class AlphaBetaPruningStrategy(Strategy):
     
     difficulty = None
     
+    # The transposition table that is shared by all the searches (it is kept between the moves of a game).
+    # It can be turned off with useTranspositionTable, and its memory cap can be changed with setTranspositionTableSize.
+    transpositionTable = TranspositionTable()
+    useTranspositionTable = True
+    
+    # The move ordering stage, which sorts the moves before they are searched (see moveOrdering.py).
+    # It can be replaced by any object with the same methods, or set to None to search the moves in the order of getValidMoves.
+    moveOrdering = MoveOrdering()
+    
+    # Statistics of the last search, reset by getBestMove:
+    # nodes: The number of nodes visited.
+    # ttCutoffs: The number of nodes that were answered by the transposition table.
+    # cutoffs: The number of nodes that were pruned (beta cutoffs).
+    # firstMoveCutoffs: The number of those cutoffs that were caused by the first move searched, which shows how good the move ordering is.
+    # evaluations: The number of leaves evaluated with the heuristics.
+    # lazySkips: The number of those evaluations that skipped stability because the window was already decided (see lazyEvaluation),
+    # and lazyMobilitySkips the number of them that skipped mobility too.
+    searchStats = {"nodes": 0, "ttCutoffs": 0, "cutoffs": 0, "firstMoveCutoffs": 0, "evaluations": 0, "lazySkips": 0, "lazyMobilitySkips": 0}
+    
+    # The budget of the running search, set by getBestMoveIterative (None means no limit).
+    # deadline is a time.time() value, and nodesLimit is the number of nodes that the current getBestMove call is allowed to visit.
+    deadline = None
+    nodesLimit = None
+    
+    # A shared value that another process can set to a non zero value to stop the search (used by the Lazy SMP helpers).
+    # It is checked with the deadline, so a deadline must be set for it to work.
+    stopSignal = None
+    
+    # The scores of the root moves of the last getBestMove call, as a list of (move, score) in the order they were searched.
+    rootScores = []
+    
+    # The number of worker processes that search the root moves in parallel (0 means that the search runs in this process).
+    # It is changed with setParallelWorkers.
+    parallelWorkers = 0
+    
+    # The half width of the aspiration window of each difficulty (None means that every depth is searched with the full window).
+    # The scores of easy are discs, the other difficulties use the heuristics (between -100 and 100). Changed with setAspirationWindow.
+    # They are not used with parallelWorkers, since the workers only search the root with the full window.
+    aspirationWindows = {"easy": 2, "medium": 8, "hard": 8}
+    
+    # When True, the leaves are evaluated lazily with the window of the search (see GameHeuristics.evaluateLazy):
+    # the expensive heuristics are skipped when the cheap ones are enough to know that the value is outside the window.
+    # The result of the search is the same, changed with setLazyEvaluation.
+    lazyEvaluation = True
+    
+    # The cache of the values of the leaves, shared with the MinMax strategy (see evaluationCache.py).
+    # Only exact values are stored in it (not the ones of the lazy evaluations that skipped a heuristic).
+    # It can be turned off with setUseEvaluationCache, and its memory cap can be changed with setEvaluationCacheSize.
+    evaluationCache = sharedEvaluationCache
+    useEvaluationCache = True
+    
+    # The root driver used by getBestMoveIterative: "alphaBeta" (getBestMove) or "mtdf" (getBestMoveMTDF), changed with setSearchDriver.
+    searchDriver = "alphaBeta"
+    
+    # In a worker process, the alpha value of the root that is shared by all the workers.
+    # Every node raises its alpha to it (when it is inside the window of the node), so the moves are pruned with the best score found by any worker so far.
+    sharedAlpha = None
+    
     
     ##############################################################################################################################    
     
@@ -53,39 +137,40 @@ class AlphaBetaPruningStrategy(Strategy):
     ##############################################################################################################################    
     
 
-    def __evaluateBoard(board: ReversiBoard,player):
+    def __evaluateBoard(board: ReversiBoard,player,alpha = -math.inf,beta = math.inf):
         
             if(AlphaBetaPruningStrategy.difficulty == "easy"):
                 return board.getScore(maximixingPlayer) - board.getScore(board.getOpponent(maximixingPlayer))
                 
 
-            hueristicsObj = heuristics.GameHeuristics()
-            coin_parity = hueristicsObj.coinParity(board,maximixingPlayer)
-            
-            mobility = hueristicsObj.mobility(board,maximixingPlayer)
-            cornersCaptured = hueristicsObj.cornersCaptured(board,maximixingPlayer)
-            stability = hueristicsObj.stability(board,maximixingPlayer)
-            utility = hueristicsObj.utility(board,maximixingPlayer)
-            
-            combinedHeuristic = hueristicsObj.combinedHeuristics(board,maximixingPlayer)
-            
-            if(utility > 100 or utility < -100):
-                raise Exception("Utility is greater than 100 or less than -100")
-            
-            if(coin_parity > 100 or coin_parity < -100):
-                raise Exception("Coin Parity is greater than 100 or less than -100")
-            
-            if(stability > 100 or stability < -100):
-                raise Exception("Stability is greater than 100 or less than -100")
+            # The fused evaluator computes every heuristic in one pass (the range checks only run in the debug mode of GameHeuristics)
+            searchStats = AlphaBetaPruningStrategy.searchStats
+            searchStats["evaluations"] += 1
             
-            if(mobility > 100 or mobility < -100):
-                raise Exception("Mobility is greater than 100 or less than -100")
+            # The exact value of a leaf that was already evaluated is taken from the evaluation cache.
+            isCached = AlphaBetaPruningStrategy.useEvaluationCache
+            if(isCached):
+                evaluationCache = AlphaBetaPruningStrategy.evaluationCache
+                key = evaluationCache.getKey(board,maximixingPlayer,gameHeuristics.getConfiguration())
+                value = evaluationCache.probe(key)
+                if(value is not None):
+                    return value
             
-            if(cornersCaptured > 100 or cornersCaptured < -100):
-                raise Exception("Corners Captured is greater than 100 or less than -100")
+            if(not AlphaBetaPruningStrategy.lazyEvaluation):
+                value = gameHeuristics.evaluate(board,maximixingPlayer)
+                if(isCached):
+                    evaluationCache.store(key,value)
+                return value
             
-            # return utility
-            return combinedHeuristic
+            # The window is the one of the maximizing player, like the scores, so a value outside of it is enough.
+            value, skippedSteps = gameHeuristics.evaluateLazy(board,maximixingPlayer,alpha,beta)
+            if(skippedSteps > 0):
+                searchStats["lazySkips"] += 1
+                if(skippedSteps == 2):
+                    searchStats["lazyMobilitySkips"] += 1
+            elif(isCached):
+                evaluationCache.store(key,value)
+            return value
 
         
     ##############################################################################################################################
@@ -103,11 +188,15 @@ class AlphaBetaPruningStrategy(Strategy):
     #boardToGetBestMove: The current state of the game.
     #player: The player for whom we are calculating the score W or B.
     #depth: The depth of the game tree.
+    #rootMoves: The valid moves in the order they should be searched (by default, the order of getValidMoves).
+    #alpha, beta: The window of the root (by default the full window). With a narrower window, the best score is only exact if it is inside it:
+    #             if every move scores alpha or less the search failed low, and if a move scores beta or more it failed high.
+    #             The scores of the moves are in rootScores.
     
     ##############################################################################################################################    
     
     
-    def getBestMove(boardToGetBestMove : ReversiBoard,player,depth):
+    def getBestMove(boardToGetBestMove : ReversiBoard,player,depth,rootMoves = None,alpha = -math.inf,beta = math.inf):
         
         global maximixingPlayer
         # print(f"Maximizing Player = {maximixingPlayer}")
@@ -115,6 +204,13 @@ class AlphaBetaPruningStrategy(Strategy):
         # print(f"Maximizing Player = {maximixingPlayer}")
         # super().getBestMove(boardToGetBestMove,player,depth)
         
+        # Reset the statistics of the search.
+        AlphaBetaPruningStrategy.searchStats = {"nodes": 0, "ttCutoffs": 0, "cutoffs": 0, "firstMoveCutoffs": 0, "evaluations": 0, "lazySkips": 0, "lazyMobilitySkips": 0}
+        
+        moveOrdering = AlphaBetaPruningStrategy.moveOrdering
+        if(moveOrdering is not None):
+            moveOrdering.newSearch()
+        
         # If the game is over, then return None.
         if (boardToGetBestMove.isGameOver()):
             return None
@@ -128,17 +224,26 @@ class AlphaBetaPruningStrategy(Strategy):
         # If there are no valid moves, then return None.
         bestMove = None
         bestScore = None
+        AlphaBetaPruningStrategy.rootScores = []
+        
+        if(rootMoves is not None):
+            validMoves = rootMoves
+        elif(moveOrdering is not None):
+            validMoves = moveOrdering.orderMoves(validMoves,player,64 - boardToGetBestMove.getScore("W") - boardToGetBestMove.getScore("B"))
         
         # If there are valid moves, then find the best move using alphabeta pruning algorithm.
         
-        # For each valid move, create a new board and make the move on the new board.
+        # The root moves can be searched by the worker processes instead (only with the full window).
+        if(AlphaBetaPruningStrategy.parallelWorkers > 0 and len(validMoves) > 1 and alpha == -math.inf and beta == math.inf):
+            return AlphaBetaPruningStrategy.__getBestMoveInParallel(boardToGetBestMove,player,depth,validMoves)
+        
+        # The search makes and undoes the moves on a single copy of the board, so the game board is never modified.
+        newBoard = boardToGetBestMove.getCopy()
+
+        # For each valid move, make the move on the copy of the board.
         for move in validMoves:
             
-            # Create a new board
-            newBoard = ReversiBoard()
-            newBoard = boardToGetBestMove.getCopy()
-
-            # Make the move on the new board.
+            # Make the move on the board.
             newBoard.makeMove(player,move[0],move[1])
             
 
@@ -153,13 +258,25 @@ class AlphaBetaPruningStrategy(Strategy):
             # print("*****************************************************************************************************")
             
             
-            # Call the alphabeta pruning algorithm to get the score for the move (The heuristics ).               
-            score = AlphaBetaPruningStrategy.alphaBetaPruning(newBoard,boardToGetBestMove.getOpponent(player),depth-1,False,-math.inf,math.inf)
+            # Call the alphabeta pruning algorithm to get the score for the move (The heuristics ).
+            # The best score so far is used as alpha: a move that cannot beat it is pruned as soon as that is known,
+            # and its score is then only an upper bound, which is never better than the best score.
+            moveAlpha = alpha if bestScore is None else max(alpha,bestScore)
+            score = AlphaBetaPruningStrategy.alphaBetaPruning(newBoard,boardToGetBestMove.getOpponent(player),depth-1,False,moveAlpha,beta)
+            
+            # Undo the move to get the board back to its previous state.
+            newBoard.undoMove()
+            
+            AlphaBetaPruningStrategy.rootScores.append((move,score))
             
             # If the score is better than the best score, then update the best score and the best move.
             if(bestScore == None or score > bestScore):
                 bestScore = score
                 bestMove = move
+            
+            # The search failed high, the other moves do not matter.
+            if(bestScore >= beta):
+                break
         
         # Return the best move.        
         return bestMove
@@ -168,6 +285,300 @@ class AlphaBetaPruningStrategy(Strategy):
     
     
 
+    ##############################################################################################################################    
+    # Method Name: getBestMoveInParallel
+    
+    # Purpose: This method is used to search the root moves in parallel, in the worker processes.
+    
+    # Method Description:
+    # Every root move is sent to the pool of workers, which search them at the same time.
+    # The workers share the alpha value of the root: whenever a move gets an exact score, the alpha is raised to it,
+    # so the moves that are still being searched are pruned with it as if they were searched one after the other.
+    # The best move is the same as the one of the serial search:
+    # The best score is exact, and the first move (in the order of validMoves) with that score is chosen.
+    # A move that only got an upper bound equal to the best score may be just as good, so it is searched again to know its exact score.
+    
+    #function Arguments:
+    #boardToGetBestMove: The current state of the game.
+    #player: The player for whom we are calculating the score W or B.
+    #depth: The depth of the game tree.
+    #validMoves: The valid moves of the player, in the order the serial search would search them.
+    
+    ##############################################################################################################################    
+    
+    def __getBestMoveInParallel(boardToGetBestMove : ReversiBoard,player,depth,validMoves):
+        
+        parallelSharedAlpha.value = -math.inf
+        searchStats = AlphaBetaPruningStrategy.searchStats
+        
+        # The board is sent as its 2D array, which is small to send to the other processes.
+        board = boardToGetBestMove.getBoard()
+        settings = getParallelSettings()
+        futures = {}
+        for index, move in enumerate(validMoves):
+            future = parallelPool.submit(searchRootMoveInWorker,board,boardToGetBestMove.whoseTurn,player,move,depth,AlphaBetaPruningStrategy.difficulty,AlphaBetaPruningStrategy.deadline,AlphaBetaPruningStrategy.nodesLimit,settings)
+            futures[future] = index
+        
+        # Collect the results as the workers finish them.
+        results = [None] * len(validMoves)
+        timedOut = False
+        for future in as_completed(futures):
+            score, isExact, workerStats = future.result()
+            for statName, value in workerStats.items():
+                searchStats[statName] = searchStats.get(statName, 0) + value
+            
+            # The worker ran out of budget.
+            if(score is None):
+                timedOut = True
+                continue
+            
+            results[futures[future]] = (score, isExact)
+            if(isExact and score > parallelSharedAlpha.value):
+                parallelSharedAlpha.value = score
+        
+        if(timedOut):
+            raise SearchTimeout()
+        
+        AlphaBetaPruningStrategy.rootScores = [(validMoves[index], results[index][0]) for index in range(len(validMoves))]
+        bestScore = max(score for score, isExact in results)
+        
+        # Choose the first move with the best score, like the serial search.
+        for index, (score, isExact) in enumerate(results):
+            if(score != bestScore):
+                continue
+            
+            if(not isExact):
+                newBoard = boardToGetBestMove.getCopy()
+                newBoard.makeMove(player,validMoves[index][0],validMoves[index][1])
+                score = AlphaBetaPruningStrategy.alphaBetaPruning(newBoard,boardToGetBestMove.getOpponent(player),depth-1,False,-math.inf,math.inf)
+                if(score != bestScore):
+                    continue
+            
+            return validMoves[index]
+    
+    ##############################################################################################################################
+    
+    
+
+    ##############################################################################################################################    
+    # Method Name: getBestMoveMTDF
+    
+    # Purpose: This method is used to get the best move for the given player and its score with the MTD(f) algorithm.
+    
+    # Method Description:
+    # MTD(f) finds the score of the root with a series of zero window searches instead of one search with the full window.
+    # Each search only tells if the score is above or below a test value, and the test value moves towards the score:
+    # A search that fails high gives a lower bound of the score, and one that fails low gives an upper bound.
+    # When the bounds meet, the score is known. The first test value is a guess (usually the score of the previous depth),
+    # and the searches after the first one are cheap because the transposition table holds the results of the previous ones.
+    # The best move is the move that proved the final lower bound. Among the moves with the same score, it may not be
+    # the first one in the order of the moves, unlike getBestMove.
+    
+    #function Arguments:
+    #boardToGetBestMove: The current state of the game.
+    #player: The player for whom we are calculating the score W or B.
+    #depth: The depth of the game tree.
+    #firstGuess: The first test value.
+    #rootMoves: The valid moves in the order they should be searched (by default, the order of the move ordering).
+    
+    # Returns the best move and its score (None and None if there is no move to search for).
+    ##############################################################################################################################
+    
+    def getBestMoveMTDF(boardToGetBestMove : ReversiBoard,player,depth,firstGuess = 0,rootMoves = None):
+        
+        global maximixingPlayer
+        maximixingPlayer = player
+        
+        AlphaBetaPruningStrategy.searchStats = {"nodes": 0, "ttCutoffs": 0, "cutoffs": 0, "firstMoveCutoffs": 0, "evaluations": 0, "lazySkips": 0, "lazyMobilitySkips": 0, "mtdfPasses": 0}
+        
+        moveOrdering = AlphaBetaPruningStrategy.moveOrdering
+        if(moveOrdering is not None):
+            moveOrdering.newSearch()
+        
+        if(boardToGetBestMove.isGameOver()):
+            return None, None
+        
+        validMoves = boardToGetBestMove.getValidMoves(player)
+        if(validMoves == []):
+            return None, None
+        
+        if(rootMoves is not None):
+            validMoves = rootMoves
+        elif(moveOrdering is not None):
+            validMoves = moveOrdering.orderMoves(validMoves,player,64 - boardToGetBestMove.getScore("W") - boardToGetBestMove.getScore("B"))
+        
+        newBoard = boardToGetBestMove.getCopy()
+        opponent = boardToGetBestMove.getOpponent(player)
+        
+        score = firstGuess
+        lowerBound = -math.inf
+        upperBound = math.inf
+        bestMove = validMoves[0]
+        
+        # The test values follow the bounds returned by the passes, and the lazy evaluation loosens them (a skipped leaf returns a bound),
+        # which takes more passes than it saves, so MTD(f) evaluates the leaves exactly.
+        isLazy = AlphaBetaPruningStrategy.lazyEvaluation
+        AlphaBetaPruningStrategy.lazyEvaluation = False
+        try:
+            while(lowerBound < upperBound):
+                # The test value: the guess, or just above the lower bound if the guess is the lower bound itself.
+                beta = score + NULL_WINDOW if score == lowerBound else score
+                AlphaBetaPruningStrategy.searchStats["mtdfPasses"] += 1
+            
+                # The root of the zero window search.
+                passBestMove = None
+                score = -math.inf
+                for move in validMoves:
+                    newBoard.makeMove(player,move[0],move[1])
+                    moveScore = AlphaBetaPruningStrategy.alphaBetaPruning(newBoard,opponent,depth-1,False,max(beta - NULL_WINDOW,score),beta)
+                    newBoard.undoMove()
+                
+                    if(moveScore > score):
+                        score = moveScore
+                        passBestMove = move
+                    if(score >= beta):
+                        break
+            
+                if(score >= beta):
+                    lowerBound = score
+                    bestMove = passBestMove
+                else:
+                    upperBound = score
+        finally:
+            AlphaBetaPruningStrategy.lazyEvaluation = isLazy
+        
+        return bestMove, lowerBound
+    
+    ##############################################################################################################################
+    
+    
+    
+    ##############################################################################################################################    
+    # Method Name: getBestMoveIterative
+    
+    # Purpose: This method is used to get the best move for the given player within a time (and nodes) budget.
+    
+    # Method Description:
+    # This method runs getBestMove (or getBestMoveMTDF, see searchDriver) with depth 1, 2, 3, ... until the budget runs out (iterative deepening).
+    # The search that runs out of budget is stopped right away and thrown away, and the best move of the last completed depth is returned.
+    # Each depth searches the root moves best first, according to the scores of the previous depth,
+    # and the transposition table still holds the results of the previous depths.
+    # Depth 1 is always completed, so there is always a move to return.
+    # With the alpha-beta driver, every depth starts with an aspiration window around the score of the previous depth (see aspirationWindows).
+    
+    #function Arguments:
+    #boardToGetBestMove: The current state of the game.
+    #player: The player for whom we are calculating the score W or B.
+    #timeLimit: The time budget of the search in seconds.
+    #maxNodes: The maximum number of nodes that the search can visit (None means no limit).
+    #maxDepth: The maximum depth of the search (by default, the number of empty squares, which is the end of the game).
+    
+    # Returns the best move and the depth of the last completed search.
+    ##############################################################################################################################
+    
+    def getBestMoveIterative(boardToGetBestMove : ReversiBoard,player,timeLimit,maxNodes = None,maxDepth = None):
+        
+        deadline = time.time() + timeLimit
+        emptySquares = 64 - boardToGetBestMove.getScore("W") - boardToGetBestMove.getScore("B")
+        if(maxDepth is None or maxDepth > emptySquares):
+            maxDepth = max(emptySquares,1)
+        
+        bestMove = None
+        completedDepth = 0
+        rootMoves = None
+        score = 0
+        depthScores = {}
+        totalNodes = 0
+        totalStats = {}
+        
+        try:
+            for depth in range(1, maxDepth + 1):
+                
+                # Stop when the budget ran out between two depths.
+                if(depth > 1 and (time.time() >= deadline or (maxNodes is not None and totalNodes >= maxNodes))):
+                    break
+                
+                # The first depth has no budget, so that there is always a move.
+                if(depth > 1):
+                    AlphaBetaPruningStrategy.deadline = deadline
+                
+                if(AlphaBetaPruningStrategy.searchDriver == "mtdf"):
+                    if(depth > 1 and maxNodes is not None):
+                        AlphaBetaPruningStrategy.nodesLimit = maxNodes - totalNodes
+                    
+                    # The score of the previous depth is the first guess of the next one.
+                    try:
+                        move, score = AlphaBetaPruningStrategy.getBestMoveMTDF(boardToGetBestMove,player,depth,score,rootMoves)
+                    finally:
+                        totalNodes += AlphaBetaPruningStrategy.searchStats["nodes"]
+                        AlphaBetaPruningStrategy.__addStats(totalStats,AlphaBetaPruningStrategy.searchStats)
+                else:
+                    # The window is centered on the score of two depths before: the scores of the odd and the even depths
+                    # are often far apart (the last move of the search is made by a different player), so this score is the closest.
+                    # The worker processes only search the root with the full window, so there is no aspiration window with parallelWorkers.
+                    window = AlphaBetaPruningStrategy.aspirationWindows.get(AlphaBetaPruningStrategy.difficulty)
+                    if(depth <= 2 or window is None or AlphaBetaPruningStrategy.parallelWorkers > 0):
+                        alpha, beta = -math.inf, math.inf
+                    else:
+                        alpha, beta = depthScores[depth - 2] - window, depthScores[depth - 2] + window
+                    
+                    # Search again with a wider window (on the side that failed) until the score is inside the window.
+                    while True:
+                        # Every search of the depth (the re-searches too) only gets the nodes that are left of the budget.
+                        if(depth > 1 and maxNodes is not None):
+                            if(totalNodes >= maxNodes):
+                                raise SearchTimeout()
+                            AlphaBetaPruningStrategy.nodesLimit = maxNodes - totalNodes
+                        try:
+                            move = AlphaBetaPruningStrategy.getBestMove(boardToGetBestMove,player,depth,rootMoves,alpha,beta)
+                        finally:
+                            totalNodes += AlphaBetaPruningStrategy.searchStats["nodes"]
+                            AlphaBetaPruningStrategy.__addStats(totalStats,AlphaBetaPruningStrategy.searchStats)
+                        
+                        if(move is None):
+                            break
+                        score = max(moveScore for rootMove, moveScore in AlphaBetaPruningStrategy.rootScores)
+                        if(score > alpha and score < beta):
+                            depthScores[depth] = score
+                            break
+                        
+                        window *= 2
+                        if(score <= alpha):
+                            totalStats["aspirationFailLows"] = totalStats.get("aspirationFailLows", 0) + 1
+                            alpha = score - window if window < ASPIRATION_MAX_WINDOW else -math.inf
+                        else:
+                            totalStats["aspirationFailHighs"] = totalStats.get("aspirationFailHighs", 0) + 1
+                            beta = score + window if window < ASPIRATION_MAX_WINDOW else math.inf
+                
+                # There is no move to search for (the game is over or the player has to pass).
+                if(move is None):
+                    return None, 0
+                
+                bestMove = move
+                completedDepth = depth
+                
+                # The next depth searches the moves best first (sorted is stable, so equal scores keep their order).
+                # MTD(f) only knows bounds of the other moves, so only its best move is moved first.
+                if(AlphaBetaPruningStrategy.searchDriver == "mtdf"):
+                    rootMoves = [move] + [rootMove for rootMove in (rootMoves or boardToGetBestMove.getValidMoves(player)) if rootMove != move]
+                else:
+                    rootMoves = [rootMove for rootMove, rootScore in sorted(AlphaBetaPruningStrategy.rootScores, key = lambda moveScore: -moveScore[1])]
+        except SearchTimeout:
+            pass
+        finally:
+            AlphaBetaPruningStrategy.deadline = None
+            AlphaBetaPruningStrategy.nodesLimit = None
+        
+        # The statistics of all the depths are added up.
+        totalStats["depth"] = completedDepth
+        AlphaBetaPruningStrategy.searchStats = totalStats
+        
+        return bestMove, completedDepth
+    
+    ##############################################################################################################################
+    
+    
+
     ##############################################################################################################################    
     # Method Name: alphaBetaPruning
     
@@ -188,9 +599,29 @@ class AlphaBetaPruningStrategy(Strategy):
     
     def alphaBetaPruning(board :ReversiBoard,player,depth,isMaximizingPlayer,alpha,beta):
         
+        searchStats = AlphaBetaPruningStrategy.searchStats
+        searchStats["nodes"] += 1
+        
+        # Check the budget of the search every 256 nodes.
+        if(searchStats["nodes"] & 255 == 0 and AlphaBetaPruningStrategy.deadline is not None):
+            if(time.time() >= AlphaBetaPruningStrategy.deadline):
+                raise SearchTimeout()
+            if(AlphaBetaPruningStrategy.nodesLimit is not None and searchStats["nodes"] >= AlphaBetaPruningStrategy.nodesLimit):
+                raise SearchTimeout()
+            if(AlphaBetaPruningStrategy.stopSignal is not None and AlphaBetaPruningStrategy.stopSignal.value):
+                raise SearchTimeout()
+        
+        # In a worker process, use the best score found by the other workers (the leaves are left out, it would not save anything there).
+        # The alpha is only raised inside the window: a window closed by the shared alpha would cut the node off after its first move,
+        # and the score of that move is not a bound of the node.
+        if(AlphaBetaPruningStrategy.sharedAlpha is not None and depth >= 2):
+            sharedAlpha = AlphaBetaPruningStrategy.sharedAlpha.value
+            if(sharedAlpha < beta):
+                alpha = max(alpha,sharedAlpha)
+        
         # If the depth is 0 or the game is over, then return the score.
         if(depth == 0 or board.isGameOver()):
-            return AlphaBetaPruningStrategy.__evaluateBoard(board,player)
+            return AlphaBetaPruningStrategy.__evaluateBoard(board,player,alpha,beta)
         
         # Get all the valid moves for the given player.
         validMoves = board.getValidMoves(player)
@@ -199,6 +630,42 @@ class AlphaBetaPruningStrategy(Strategy):
         if(validMoves == []):
             return AlphaBetaPruningStrategy.alphaBetaPruning(board , board.getOpponent(player) , depth , not isMaximizingPlayer , alpha , beta)
         
+        # Look the position up in the transposition table.
+        # The position is hashed with the player of this node as the side to move, so the passes are told apart.
+        useTranspositionTable = AlphaBetaPruningStrategy.useTranspositionTable
+        hashMove = None
+        if(useTranspositionTable):
+            key = board.getHash(player) ^ PERSPECTIVE_KEYS[maximixingPlayer]
+            entry = AlphaBetaPruningStrategy.transpositionTable.probe(key)
+            if(entry is not None):
+                hashMove = entry[4]
+            
+            # Only an entry of the same depth is used, so the result of the search does not depend on what was searched before.
+            if(entry is not None and entry[1] == depth):
+                score, boundType = entry[2], entry[3]
+                if(boundType == EXACT):
+                    searchStats["ttCutoffs"] += 1
+                    return score
+                elif(boundType == LOWER_BOUND):
+                    alpha = max(alpha,score)
+                else:
+                    beta = min(beta,score)
+                
+                # The bound alone is enough to prune the branch.
+                if(beta <= alpha):
+                    searchStats["ttCutoffs"] += 1
+                    return score
+        
+        # The window that the moves are searched with, used to know the bound type of the result.
+        searchAlpha, searchBeta = alpha, beta
+        bestMove = None
+        
+        # Sort the moves so that the most promising ones are searched first.
+        moveOrdering = AlphaBetaPruningStrategy.moveOrdering
+        ply = 64 - board.getScore("W") - board.getScore("B")
+        if(moveOrdering is not None):
+            validMoves = moveOrdering.orderMoves(validMoves,player,ply,hashMove)
+        
         # If the current node is a maximizing node.
         if(isMaximizingPlayer):
             
@@ -208,28 +675,31 @@ class AlphaBetaPruningStrategy(Strategy):
             # Loop through all the valid moves.
             for move in validMoves:
                 
-                # Create a new board.
-                newBoard = ReversiBoard()
-                newBoard = board.getCopy()
-                
-                # Make the move on the new board.
-                newBoard.makeMove(player,move[0],move[1])
+                # Make the move on the board.
+                board.makeMove(player,move[0],move[1])
                 
                 # Call the alphabeta pruning algorithm to get the score for the move (The heuristics ).
-                score = AlphaBetaPruningStrategy.alphaBetaPruning(newBoard,board.getOpponent(player),depth-1,False,alpha,beta)
+                score = AlphaBetaPruningStrategy.alphaBetaPruning(board,board.getOpponent(player),depth-1,False,alpha,beta)
+                
+                # Undo the move before pruning or moving to the next one.
+                board.undoMove()
                 
-                # Update the best score.
-                bestScore = max(bestScore,score)
+                # Update the best score and the best move.
+                if(score > bestScore):
+                    bestScore = score
+                    bestMove = move
                 
                 # Update the alpha value.
                 alpha = max(alpha,score)
                 
                 # If alpha >= beta, then prune the branch.
                 if(beta <= alpha):
+                    searchStats["cutoffs"] += 1
+                    if(move is validMoves[0]):
+                        searchStats["firstMoveCutoffs"] += 1
+                    if(moveOrdering is not None):
+                        moveOrdering.recordCutoff(move,player,ply,depth)
                     break
-             
-            # Return the best score.    
-            return bestScore
         
         
         # If the current node is a minimizing node.
@@ -240,28 +710,48 @@ class AlphaBetaPruningStrategy(Strategy):
             # Loop through all the valid moves.
             for move in validMoves:
                 
-                # Create a new board.
-                newBoard = ReversiBoard()
-                newBoard = board.getCopy()
-                
-                # Make the move on the new board.
-                newBoard.makeMove(player,move[0],move[1])
+                # Make the move on the board.
+                board.makeMove(player,move[0],move[1])
                 
                 # Call the alphabeta pruning algorithm to get the score for the move (The heuristics ).
-                score = AlphaBetaPruningStrategy.alphaBetaPruning(newBoard,board.getOpponent(player),depth-1,True,alpha,beta)
+                score = AlphaBetaPruningStrategy.alphaBetaPruning(board,board.getOpponent(player),depth-1,True,alpha,beta)
+                
+                # Undo the move before pruning or moving to the next one.
+                board.undoMove()
                 
-                # Update the best score to the minimum of the current best score and the score.
-                bestScore = min(bestScore,score)
+                # Update the best score to the minimum of the current best score and the score, and the best move.
+                if(score < bestScore):
+                    bestScore = score
+                    bestMove = move
                 
                 # Update the beta value to the minimum of the current beta value and the score.
                 beta = min(beta,score)
                 
                 # If alpha >= beta, then prune the branch.
                 if(beta <= alpha):
+                    searchStats["cutoffs"] += 1
+                    if(move is validMoves[0]):
+                        searchStats["firstMoveCutoffs"] += 1
+                    if(moveOrdering is not None):
+                        moveOrdering.recordCutoff(move,player,ply,depth)
                     break
-                
-            # Return the best score.
-            return bestScore
+        
+        # Store the result in the transposition table.
+        if(useTranspositionTable):
+            # In a worker process, the nodes below may have raised their alpha to a newer shared alpha, so a score up to it
+            # may only be an upper bound. The shared alpha only grows, so its value after the moves covers every alpha that was used.
+            if(AlphaBetaPruningStrategy.sharedAlpha is not None):
+                searchAlpha = max(searchAlpha,AlphaBetaPruningStrategy.sharedAlpha.value)
+            if(bestScore >= searchBeta):
+                boundType = LOWER_BOUND
+            elif(bestScore <= searchAlpha):
+                boundType = UPPER_BOUND
+            else:
+                boundType = EXACT
+            AlphaBetaPruningStrategy.transpositionTable.store(key,depth,bestScore,boundType,bestMove)
+            
+        # Return the best score.
+        return bestScore
         
         
         
@@ -269,12 +759,180 @@ class AlphaBetaPruningStrategy(Strategy):
     
     ##############################################################################################################################
     
+    # This private method adds the statistics of a search to the totals.
+    def __addStats(totalStats,searchStats):
+        for statName, value in searchStats.items():
+            totalStats[statName] = totalStats.get(statName, 0) + value
+    
+    # Method Name: getCutoffRate
+    # Returns the share of the cutoffs of the last search that were caused by the first move searched (between 0 and 1).
+    # The closer it is to 1, the better the move ordering.
+    def getCutoffRate():
+        searchStats = AlphaBetaPruningStrategy.searchStats
+        if(searchStats.get("cutoffs", 0) == 0):
+            return 0
+        return searchStats["firstMoveCutoffs"] / searchStats["cutoffs"]
+    
+    # Method Name: getLazySkipRate
+    # Returns the share of the heuristic evaluations of the last search that skipped the expensive heuristics (between 0 and 1).
+    def getLazySkipRate():
+        searchStats = AlphaBetaPruningStrategy.searchStats
+        if(searchStats.get("evaluations", 0) == 0):
+            return 0
+        return searchStats["lazySkips"] / searchStats["evaluations"]
+    
     # Method Name: getDifficulty
     def getDifficulty():
         return AlphaBetaPruningStrategy.difficulty
     
     # Method Name: setDifficulty
+    # The evaluation function depends on the difficulty, so the stored scores are not valid anymore when it changes.
     
     def setDifficulty(difficulty):
+        if(difficulty != AlphaBetaPruningStrategy.difficulty):
+            AlphaBetaPruningStrategy.transpositionTable.clear()
         AlphaBetaPruningStrategy.difficulty = difficulty
-    
\ No newline at end of file
+    
+    # Method Name: setParallelWorkers
+    # Sets the number of worker processes that search the root moves in parallel, 0 to search in this process.
+    # The workers are started once and kept for the next searches (each one keeps its own transposition table).
+    
+    def setParallelWorkers(workersCount):
+        global parallelPool, parallelSharedAlpha
+        
+        if(workersCount < 0):
+            raise ValueError("The number of workers cannot be negative")
+        
+        if(parallelPool is not None):
+            parallelPool.shutdown()
+            parallelPool = None
+        
+        if(workersCount > 0):
+            # The alpha value is only written by this process, so it does not need a lock.
+            parallelSharedAlpha = multiprocessing.RawValue("d", -math.inf)
+            parallelPool = ProcessPoolExecutor(max_workers = workersCount, initializer = initParallelWorker, initargs = (parallelSharedAlpha, getParallelSettings()))
+        
+        AlphaBetaPruningStrategy.parallelWorkers = workersCount
+    
+    # Method Name: setAspirationWindow
+    # Sets the half width of the aspiration window of the difficulty, None to search every depth with the full window.
+    
+    def setAspirationWindow(difficulty,window):
+        if(window is not None and window <= 0):
+            raise ValueError("The aspiration window must be positive")
+        AlphaBetaPruningStrategy.aspirationWindows[difficulty] = window
+    
+    # Method Name: setSearchDriver
+    # Sets the root driver of getBestMoveIterative: "alphaBeta" or "mtdf".
+    
+    def setSearchDriver(searchDriver):
+        if(searchDriver not in ["alphaBeta", "mtdf"]):
+            raise ValueError("Invalid search driver")
+        AlphaBetaPruningStrategy.searchDriver = searchDriver
+    
+    # Method Name: setLazyEvaluation
+    # Turns the lazy evaluation of the leaves on or off (see lazyEvaluation).
+    
+    def setLazyEvaluation(isLazy):
+        AlphaBetaPruningStrategy.lazyEvaluation = isLazy
+    
+    # Method Name: setTranspositionTableSize
+    # Sets the memory cap of the transposition table in megabytes (the table is cleared).
+    
+    def setTranspositionTableSize(maxMemoryMB):
+        AlphaBetaPruningStrategy.transpositionTable.setMaxMemory(maxMemoryMB)
+    
+    # Method Name: setUseEvaluationCache
+    # Turns the evaluation cache on or off (see useEvaluationCache).
+    
+    def setUseEvaluationCache(isUsed):
+        AlphaBetaPruningStrategy.useEvaluationCache = isUsed
+    
+    # Method Name: setEvaluationCacheSize
+    # Sets the memory cap of the evaluation cache in megabytes (the cache is cleared).
+    # The cache is shared with the MinMax strategy, so its size changes for both.
+    
+    def setEvaluationCacheSize(maxMemoryMB):
+        AlphaBetaPruningStrategy.evaluationCache.setMaxMemory(maxMemoryMB)
+    
+    # Method Name: getEvaluationCacheHitRate
+    # Returns the share of the cache probes that found their leaf in the evaluation cache since it was last cleared (between 0 and 1).
+    # The hits and misses counters are in evaluationCache (shared with the MinMax strategy).
+    
+    def getEvaluationCacheHitRate():
+        return AlphaBetaPruningStrategy.evaluationCache.getHitRate()
+    
+
+
+
+##############################################################################################################################
+# The following functions run in the worker processes of the parallel search.
+##############################################################################################################################
+
+# This function returns the settings of the search that the worker processes need to search like this process:
+# the lazy evaluation, the transposition table, the move ordering, the evaluation cache and the weights of the heuristics.
+def getParallelSettings():
+    return {
+        "lazyEvaluation": AlphaBetaPruningStrategy.lazyEvaluation,
+        "useTranspositionTable": AlphaBetaPruningStrategy.useTranspositionTable,
+        "transpositionTableMemory": AlphaBetaPruningStrategy.transpositionTable.maxMemoryMB,
+        "useMoveOrdering": AlphaBetaPruningStrategy.moveOrdering is not None,
+        "useEvaluationCache": AlphaBetaPruningStrategy.useEvaluationCache,
+        "evaluationCacheMemory": AlphaBetaPruningStrategy.evaluationCache.maxMemoryMB,
+        "heuristicsWeights": (heuristics.GameHeuristics.coinParity_weight, heuristics.GameHeuristics.mobility_weight,
+                              heuristics.GameHeuristics.stability_weight, heuristics.GameHeuristics.cornersCaptured_weight),
+        "debugMode": heuristics.GameHeuristics.debugMode,
+    }
+
+
+# This function applies the settings of getParallelSettings in a worker process.
+# The tables are only made again when their size changed, so that the worker keeps what it learned from the previous searches.
+def applyParallelSettings(settings):
+    AlphaBetaPruningStrategy.lazyEvaluation = settings["lazyEvaluation"]
+    AlphaBetaPruningStrategy.useTranspositionTable = settings["useTranspositionTable"]
+    if(AlphaBetaPruningStrategy.transpositionTable.maxMemoryMB != settings["transpositionTableMemory"]):
+        AlphaBetaPruningStrategy.transpositionTable.setMaxMemory(settings["transpositionTableMemory"])
+    if(not settings["useMoveOrdering"]):
+        AlphaBetaPruningStrategy.moveOrdering = None
+    elif(AlphaBetaPruningStrategy.moveOrdering is None):
+        AlphaBetaPruningStrategy.moveOrdering = MoveOrdering()
+    AlphaBetaPruningStrategy.useEvaluationCache = settings["useEvaluationCache"]
+    if(AlphaBetaPruningStrategy.evaluationCache.maxMemoryMB != settings["evaluationCacheMemory"]):
+        AlphaBetaPruningStrategy.evaluationCache.setMaxMemory(settings["evaluationCacheMemory"])
+    (heuristics.GameHeuristics.coinParity_weight, heuristics.GameHeuristics.mobility_weight,
+     heuristics.GameHeuristics.stability_weight, heuristics.GameHeuristics.cornersCaptured_weight) = settings["heuristicsWeights"]
+    heuristics.GameHeuristics.debugMode = settings["debugMode"]
+
+
+# This function is called once when a worker process starts, to give it the shared alpha value and the settings of the search.
+# The settings are sent again with every root move (see searchRootMoveInWorker), since they can change after the workers started.
+def initParallelWorker(sharedAlpha, settings):
+    AlphaBetaPruningStrategy.sharedAlpha = sharedAlpha
+    applyParallelSettings(settings)
+
+
+# This function searches one root move in a worker process.
+# It returns the score of the move (None if the budget ran out), whether the score is exact, and the statistics of the search.
+# The score is exact if it is better than every alpha value that the search may have used,
+# otherwise it is only an upper bound of the real score.
+def searchRootMoveInWorker(board, whoseTurn, player, move, depth, difficulty, deadline, nodesLimit, settings):
+    global maximixingPlayer
+    maximixingPlayer = player
+    applyParallelSettings(settings)
+    AlphaBetaPruningStrategy.setDifficulty(difficulty)
+    AlphaBetaPruningStrategy.deadline = deadline
+    AlphaBetaPruningStrategy.nodesLimit = nodesLimit
+    AlphaBetaPruningStrategy.searchStats = {"nodes": 0, "ttCutoffs": 0, "cutoffs": 0, "firstMoveCutoffs": 0, "evaluations": 0, "lazySkips": 0, "lazyMobilitySkips": 0}
+    
+    reversiBoard = ReversiBoard()
+    reversiBoard.board = board
+    reversiBoard.whoseTurn = whoseTurn
+    reversiBoard.makeMove(player,move[0],move[1])
+    
+    sharedAlpha = AlphaBetaPruningStrategy.sharedAlpha
+    try:
+        score = AlphaBetaPruningStrategy.alphaBetaPruning(reversiBoard,reversiBoard.getOpponent(player),depth-1,False,sharedAlpha.value,math.inf)
+    except SearchTimeout:
+        return None, False, AlphaBetaPruningStrategy.searchStats
+    
+    return score, score > sharedAlpha.value, AlphaBetaPruningStrategy.searchStats
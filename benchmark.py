@@ -0,0 +1,94 @@
+##############################################################################################################################
+# Project Name :  Othello                                                                                                    #
+# File Name    :  benchmark.py                                                                                               #
+# Description  :  This file compares the search engines on the same positions: the nodes they visit and the time they take  #
+#                 at the same depth.                                                                                         #
+# Date         :  10/18/2026                                                                                                 #
+#                                                                                                                            #
+##############################################################################################################################
+
+# Usage: python benchmark.py [depth] [difficulty] [positions count]
+# The positions are taken from random games with a fixed seed, so every run searches the same positions.
+# Every engine starts each position with an empty transposition table and a new move ordering, so the positions do not help each other.
+# Every engine searches exactly: Multi-ProbCut (the forward pruning of the principal variation search) and the lazy evaluation of
+# the leaves are turned off during the benchmark, so the engines search the same tree and only their node counts differ.
+# The null windows of the principal variation search save little at shallow depths: with the move ordering of the engines,
+# the first move causes about 80% of the cutoffs, so alpha-beta with a fail-soft window already prunes almost the same tree
+# (both visit about the same number of nodes at depth 4, and the difference grows with the depth, about 10% fewer at depth 5).
+# The Monte Carlo Tree Search has no depth, it runs MCTS_ITERATIONS playouts on every position and its throughput (playouts per second) is printed.
+
+import random
+import sys
+import time
+
+from board import ReversiBoard
+from moveOrdering import MoveOrdering
+from alphaBetaPruning import AlphaBetaPruningStrategy
+from principalVariationSearch import PrincipalVariationSearchStrategy
+from monteCarloTreeSearch import MonteCarloTreeSearchStrategy
+
+
+# The engines, as (name, strategy class, function that searches a position with it).
+ENGINES = [
+    ("alpha-beta", AlphaBetaPruningStrategy, AlphaBetaPruningStrategy.getBestMove),
+    ("mtd(f)", AlphaBetaPruningStrategy, AlphaBetaPruningStrategy.getBestMoveMTDF),
+    ("pvs", PrincipalVariationSearchStrategy, PrincipalVariationSearchStrategy.getBestMove),
+]
+
+# The number of playouts of the Monte Carlo Tree Search on each position.
+MCTS_ITERATIONS = 500
+
+
+# This function returns the given number of positions from random games, with the player to move.
+def getPositions(positionsCount : int, seed : int = 2023):
+    randomGenerator = random.Random(seed)
+    positions = []
+    while len(positions) < positionsCount:
+        board = ReversiBoard()
+        for moveIndex in range(randomGenerator.randint(4, 44)):
+            if(board.isGameOver()):
+                break
+            board.makeMove(board.whoseTurn, *randomGenerator.choice(board.getValidMoves(board.whoseTurn)))
+
+        if(not board.isGameOver() and board.getValidMoves(board.whoseTurn) != []):
+            positions.append((board, board.whoseTurn))
+    return positions
+
+
+# This function searches every position with every engine and prints their totals.
+def runBenchmark(depth : int, difficulty : str, positionsCount : int):
+    positions = getPositions(positionsCount)
+
+    print(f"{positionsCount} positions, depth {depth}, difficulty {difficulty}")
+    isProbCut = PrincipalVariationSearchStrategy.probCutDifficulties.get(difficulty, False)
+    isLazy = AlphaBetaPruningStrategy.lazyEvaluation
+    PrincipalVariationSearchStrategy.setProbCut(difficulty, False)
+    AlphaBetaPruningStrategy.setLazyEvaluation(False)
+    for engineName, engine, search in ENGINES:
+        engine.setDifficulty(difficulty)
+        nodes = 0
+        startTime = time.time()
+        for board, player in positions:
+            engine.transpositionTable.clear()
+            engine.moveOrdering = MoveOrdering()
+            search(board, player, depth)
+            nodes += engine.searchStats["nodes"]
+        elapsedTime = time.time() - startTime
+        print(f"{engineName:>12}: {nodes:>10} nodes {elapsedTime:>8.2f} s {nodes / elapsedTime:>10.0f} nodes/s")
+    PrincipalVariationSearchStrategy.setProbCut(difficulty, isProbCut)
+    AlphaBetaPruningStrategy.setLazyEvaluation(isLazy)
+
+    playouts = 0
+    startTime = time.time()
+    for board, player in positions:
+        MonteCarloTreeSearchStrategy.search(board, player, MCTS_ITERATIONS)
+        playouts += MonteCarloTreeSearchStrategy.searchStats["iterations"]
+    elapsedTime = time.time() - startTime
+    print(f"{'mcts':>12}: {playouts:>10} playouts {elapsedTime:>5.2f} s {playouts / elapsedTime:>10.0f} playouts/s")
+
+
+if __name__ == "__main__":
+    depth = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    difficulty = sys.argv[2] if len(sys.argv) > 2 else "hard"
+    positionsCount = int(sys.argv[3]) if len(sys.argv) > 3 else 20
+    runBenchmark(depth, difficulty, positionsCount)
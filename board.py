@@ -8,51 +8,343 @@
  # Description: This file contains the ReversiBoard class which is used to represent the board of the game.
  ########################################################################################################################################
 
-from copy import deepcopy
+import random
+
+############################################################################################################################################################################
+#                                                    Bitboard Helpers                                                                                                      #
+############################################################################################################################################################################
+
+# The position is stored as two 64-bit integers (bitboards), one for each color.
+# Square (row, col) is mapped to bit number row * 8 + col, so bit 0 is the top left corner and bit 63 is the bottom right corner.
+
+FULL_MASK = 0xFFFFFFFFFFFFFFFF
+NOT_A_FILE = 0xFEFEFEFEFEFEFEFE # Every square except column 0
+NOT_H_FILE = 0x7F7F7F7F7F7F7F7F # Every square except column 7
+
+# The 8 directions as (shift, mask) pairs.
+# A positive shift moves the bits to the left (towards higher squares) and a negative one moves them to the right.
+# The mask removes the bits that wrapped around from one side of the board to the other.
+SHIFTS = [
+    (1, NOT_A_FILE),   # (0, 1)   East
+    (8, FULL_MASK),    # (1, 0)   South
+    (-1, NOT_H_FILE),  # (0, -1)  West
+    (-8, FULL_MASK),   # (-1, 0)  North
+    (9, NOT_A_FILE),   # (1, 1)   South East
+    (-9, NOT_H_FILE),  # (-1, -1) North West
+    (7, NOT_H_FILE),   # (1, -1)  South West
+    (-7, NOT_A_FILE)   # (-1, 1)  North East
+]
+
+# The initial position of the game.
+INITIAL_WHITE = (1 << 27) | (1 << 36)
+INITIAL_BLACK = (1 << 28) | (1 << 35)
+
+
+# This function counts the number of set bits in the given bitboard.
+def popCount(bits : int):
+    return bin(bits).count("1")
+
+
+# This function returns a bitboard of the given squares and of all the squares next to them.
+def spread(bits : int):
+    horizontal = bits | ((bits << 1) & NOT_A_FILE) | ((bits >> 1) & NOT_H_FILE)
+    return (horizontal | (horizontal << 8) | (horizontal >> 8)) & FULL_MASK
+
+
+# The frontier squares of the initial position: the empty squares next to the 4 center discs.
+INITIAL_FRONTIER = spread(INITIAL_BLACK | INITIAL_WHITE) & ~(INITIAL_BLACK | INITIAL_WHITE)
+
+
+# This function returns a bitboard of the squares where the player owning "own" can play.
+# It floods from the player's discs over the opponent's discs in each direction (at most 6 discs can be jumped on an 8x8 board).
+# Only the squares in "targets" are considered. By default those are all the empty squares, but passing the frontier
+# (the empty squares next to a disc) gives the same result, since a legal move is always next to a disc.
+def generateMoves(own : int, opp : int, targets : int = None):
+    empty = ~(own | opp) & FULL_MASK if targets is None else targets
+    moves = 0
+    for shift, mask in SHIFTS:
+        maskedOpp = opp & mask
+        if shift > 0:
+            x = (own << shift) & maskedOpp
+            x |= (x << shift) & maskedOpp
+            x |= (x << shift) & maskedOpp
+            x |= (x << shift) & maskedOpp
+            x |= (x << shift) & maskedOpp
+            x |= (x << shift) & maskedOpp
+            moves |= (x << shift) & mask & empty
+        else:
+            shift = -shift
+            x = (own >> shift) & maskedOpp
+            x |= (x >> shift) & maskedOpp
+            x |= (x >> shift) & maskedOpp
+            x |= (x >> shift) & maskedOpp
+            x |= (x >> shift) & maskedOpp
+            x |= (x >> shift) & maskedOpp
+            moves |= (x >> shift) & mask & empty
+    return moves
+
+
+# The 8 directions as (row step, col step) pairs, used to build the ray tables below.
+DIRECTIONS = [(0,1),(1,0),(0,-1),(-1,0),(1,1),(-1,-1),(1,-1),(-1,1)]
+
+
+# This function builds the tables that are used to compute the flips of a move.
+# RAYS[square] is the list of rays that start next to the square and go towards the edge of the board, one per direction.
+# Each ray is a tuple of square bits in order, and rays shorter than 2 squares are left out because they can never flip a disc.
+# NEIGHBOURS[square] is a bitboard of the (up to 8) squares around the square.
+def buildRayTables():
+    rays = []
+    neighbours = []
+    for square in range(64):
+        row, col = square >> 3, square & 7
+        squareRays = []
+        squareNeighbours = 0
+        for rowStep, colStep in DIRECTIONS:
+            ray = []
+            newRow, newCol = row + rowStep, col + colStep
+            while(0 <= newRow <= 7 and 0 <= newCol <= 7):
+                ray.append(1 << (newRow * 8 + newCol))
+                newRow += rowStep
+                newCol += colStep
+            if(ray != []):
+                squareNeighbours |= ray[0]
+            if(len(ray) >= 2):
+                squareRays.append(tuple(ray))
+        rays.append(tuple(squareRays))
+        neighbours.append(squareNeighbours)
+    return rays, neighbours
+
+RAYS, NEIGHBOURS = buildRayTables()
+
+
+# This function returns a bitboard of the discs that would be flipped if the player owning "own" plays on the given square.
+# An empty result means that the move is not valid (the caller must make sure the square is empty).
+def computeFlips(own : int, opp : int, square : int):
+    # A move can only flip discs if it has at least one of the opponent's discs next to it
+    if(not NEIGHBOURS[square] & opp):
+        return 0
+
+    flips = 0
+    for ray in RAYS[square]:
+        line = 0
+        for bit in ray:
+            if(bit & opp):
+                line |= bit
+            else:
+                # The line is only flipped if it is closed by one of the player's discs
+                if(bit & own):
+                    flips |= line
+                break
+    return flips
+
+
+# Zobrist keys used to hash the positions.
+# Every (color, square) pair has a random 64-bit key and the hash of a position is the XOR of the keys of its discs,
+# so placing or flipping a disc only takes one XOR. The random generator is seeded so the keys are the same in every run and process.
+zobristRandom = random.Random(20220510)
+ZOBRIST_BLACK = [zobristRandom.getrandbits(64) for square in range(64)]
+ZOBRIST_WHITE = [zobristRandom.getrandbits(64) for square in range(64)]
+ZOBRIST_FLIP = [ZOBRIST_BLACK[square] ^ ZOBRIST_WHITE[square] for square in range(64)] # Changes a disc from one color to the other
+ZOBRIST_TURN = {"B": zobristRandom.getrandbits(64), "W": zobristRandom.getrandbits(64), " ": 0}
+
+
+# This function computes the hash of the discs of a position from scratch (without the side to move).
+def computeDiscsHash(black : int, white : int):
+    discsHash = 0
+    for square in range(64):
+        if((black >> square) & 1):
+            discsHash ^= ZOBRIST_BLACK[square]
+        elif((white >> square) & 1):
+            discsHash ^= ZOBRIST_WHITE[square]
+    return discsHash
+
+INITIAL_HASH = computeDiscsHash(INITIAL_BLACK, INITIAL_WHITE)
+
+
+# The static weight of each square, used by the utility heuristic and the move ordering.
+# The board keeps the sum of the weights of the discs of each color up to date (one addition per placed or flipped disc),
+# so the heuristic never has to scan the board.
+STATIC_WEIGHTS = [
+    [4, -3, 2, 2, 2, 2, -3, 4],
+    [-3, -4, -1, -1, -1, -1, -4, -3],
+    [2, -1, 1, 0, 0, 1, -1, 2],
+    [2, -1, 0, 1, 1, 0, -1, 2],
+    [2, -1, 0, 1, 1, 0, -1, 2],
+    [2, -1, 1, 0, 0, 1, -1, 2],
+    [-3, -4, -1, -1, -1, -1, -4, -3],
+    [4, -3, 2, 2, 2, 2, -3, 4]
+]
+SQUARE_WEIGHTS = [STATIC_WEIGHTS[square >> 3][square & 7] for square in range(64)]
+
+
+# This function computes the sum of the static weights of the given discs from scratch.
+def computeWeightSum(bits : int):
+    return sum(SQUARE_WEIGHTS[square] for square in range(64) if (bits >> square) & 1)
+
+INITIAL_WEIGHT_SUM = computeWeightSum(INITIAL_BLACK) # The same for both colors
+
+
+# The patterns used by the pattern evaluator (see patternEvaluator.py), as (name, squares) in one orientation.
+# Every pattern is used in all its orientations on the board (its instances), and all the instances of a pattern share its table.
+PATTERN_TYPES = [
+    ("edge", [(0, col) for col in range(8)]),
+    ("corner3x3", [(row, col) for row in range(3) for col in range(3)]),
+    ("corner2x5", [(row, col) for row in range(2) for col in range(5)]),
+    ("diagonal8", [(i, i) for i in range(8)]),
+    ("diagonal7", [(i, i + 1) for i in range(7)]),
+    ("diagonal6", [(i, i + 2) for i in range(6)]),
+    ("diagonal5", [(i, i + 3) for i in range(5)]),
+    ("diagonal4", [(i, i + 4) for i in range(4)]),
+]
+
+# The 8 symmetries of the board, as functions of (row, col).
+SYMMETRIES = [
+    lambda row, col: (row, col), lambda row, col: (col, row), lambda row, col: (row, 7 - col), lambda row, col: (7 - col, row),
+    lambda row, col: (7 - row, col), lambda row, col: (col, 7 - row), lambda row, col: (7 - row, 7 - col), lambda row, col: (7 - col, 7 - row),
+]
+
+
+# This function builds the instances of the patterns and the table used to update their indices.
+# PATTERN_INSTANCES is the list of (pattern type number, squares) of every instance (the symmetries that give the same squares are kept once).
+# The index of an instance is the base-3 number made of its squares, the k-th square being the k-th digit: 0 for empty, 1 for black and 2 for white.
+# SQUARE_PATTERNS[square] is the list of (instance number, 3 to the power of the digit of the square) of the instances that hold the square.
+def buildPatternTables():
+    instances = []
+    squarePatterns = [[] for square in range(64)]
+    for patternType, (name, squares) in enumerate(PATTERN_TYPES):
+        seenSquares = set()
+        for symmetry in SYMMETRIES:
+            instanceSquares = tuple(row * 8 + col for row, col in (symmetry(row, col) for row, col in squares))
+            if(frozenset(instanceSquares) in seenSquares):
+                continue
+            seenSquares.add(frozenset(instanceSquares))
+            for digit, square in enumerate(instanceSquares):
+                squarePatterns[square].append((len(instances), 3 ** digit))
+            instances.append((patternType, instanceSquares))
+    return instances, [tuple(patterns) for patterns in squarePatterns]
+
+PATTERN_INSTANCES, SQUARE_PATTERNS = buildPatternTables()
+
+
+# This function computes the indices of every pattern instance from scratch.
+def computePatternIndices(black : int, white : int):
+    indices = [0] * len(PATTERN_INSTANCES)
+    for square in range(64):
+        digit = 1 if (black >> square) & 1 else (2 if (white >> square) & 1 else 0)
+        if(digit):
+            for instance, power in SQUARE_PATTERNS[square]:
+                indices[instance] += digit * power
+    return indices
+
+
+# This function converts a bitboard into a list of [row, col] pairs in row-major order.
+def bitsToLocations(bits : int):
+    locations = []
+    while bits:
+        lowestBit = bits & -bits
+        square = lowestBit.bit_length() - 1
+        locations.append([square >> 3, square & 7])
+        bits ^= lowestBit
+    return locations
+
 
 # The ReversiBoard class is used to represent the board of the game.
 class ReversiBoard:
-    # The board is represented as a 2D array of characters.
+    # The board is stored as two bitboards, one for the black discs and one for the white discs.
+    # The "board" property still exposes it as a 2D array of characters.
     # Each character represents a cell in the board.
     # The characters can be " ", "W", or "B".
     # " " means the cell is empty.
     # "W" means the cell is occupied by a white piece.
     # "B" means the cell is occupied by a black piece.
-    board = [
-    [" ", " ", " ", " ", " ", " ", " ", " "],
-    [" ", " ", " ", " ", " ", " ", " ", " "],
-    [" ", " ", " ", " ", " ", " ", " ", " "],
-    [" ", " ", " ", "W", "B", " ", " ", " "],
-    [" ", " ", " ", "B", "W", " ", " ", " "],
-    [" ", " ", " ", " ", " ", " ", " ", " "],
-    [" ", " ", " ", " ", " ", " ", " ", " "],
-    [" ", " ", " ", " ", " ", " ", " ", " "]
-]
+
     # The following parameter keeps track of whose turn it is.
     # It can be either "W" or "B" or " " if the game is over.
     whoseTurn = "B"
 
 
-    # The constructor of the ReversiBoard class.      
+    # The constructor of the ReversiBoard class.
+    # It sets the bitboards to the initial position of the game.
+    # The undo stack holds one entry per move made on the board: (color, placed disc, flipped discs, previous turn, previous moves cache,
+    # previous frontier, previous discs hash, previous weight sums of black and white).
+    # The moves cache holds the valid moves of both colors for the current position: [black moves bitboard, white moves bitboard, black moves list, white moves list].
+    # It is None when the position has changed and the moves were not generated yet, and the lists are only built when they are asked for.
+    # The number of discs of each color is kept up to date by makeMove and undoMove, so the scores never need a board scan.
+    # So is the sum of the static weights of the discs of each color (see STATIC_WEIGHTS).
+    # The frontier is a bitboard of the empty squares that are next to at least one disc, the only squares where a move can be legal.
+    # The discs hash is the Zobrist hash of the discs, updated with one XOR per placed or flipped disc (see getHash for the side to move).
+    # The pattern indices are the base-3 indices of the pattern instances (see computePatternIndices), used by the pattern evaluator.
+    # Keeping them costs some time in every move, so they are None (not kept) until enablePatternIndices is called.
     def __init__(self):
-        pass # The constructor is empty because the board is already initialized.
-   
-        
+        self.blackBits = INITIAL_BLACK
+        self.whiteBits = INITIAL_WHITE
+        self.frontierBits = INITIAL_FRONTIER
+        self.discsHash = INITIAL_HASH
+        self.blackCount = 2
+        self.whiteCount = 2
+        self.blackWeightSum = INITIAL_WEIGHT_SUM
+        self.whiteWeightSum = INITIAL_WEIGHT_SUM
+        self.undoStack = []
+        self.movesCache = None
+        self.patternIndices = None
+
+
     # This private method is used to check if the given cell is inside the board or not.
     def __isInside(self,row : int ,col: int):
         return row >= 0 and row <= 7 and col >= 0 and col <= 7
-    
-    # This method is used to determine whether a cell has neighbours or not.
-    # A cell has neighbours if there is a cell that is not empty in any of the 8 directions.
-    def __hasNeighbours(self,row : int ,col: int):
-        directions = [(0,1),(1,0),(0,-1),(-1,0),(1,1),(-1,-1),(1,-1),(-1,1)]
-        for direction in directions:
-            newRow = row + direction[0]
-            newCol = col + direction[1]
-            if(self.__isInside(newRow,newCol) and self.board[newRow][newCol] != " "):
-                return self.board[row][col] == ' ' 
-        return False
-    
+
+    # This private method returns the bitboards of the given color and of its opponent.
+    def __bitsOf(self, color : str):
+        if(color == "B"):
+            return self.blackBits, self.whiteBits
+        return self.whiteBits, self.blackBits
+
+    # This private method returns the moves cache of the current position, generating the moves of both colors if needed.
+    def __getMovesCache(self):
+        if(self.movesCache is None):
+            self.movesCache = [generateMoves(self.blackBits, self.whiteBits, self.frontierBits), generateMoves(self.whiteBits, self.blackBits, self.frontierBits), None, None]
+        return self.movesCache
+
+    # The 2D array that represents the board, built from the bitboards.
+    # Assigning a 2D array to it sets the bitboards accordingly.
+    @property
+    def board(self):
+        board = []
+        for i in range(8):
+            row = []
+            for j in range(8):
+                bit = 1 << (i * 8 + j)
+                if(self.blackBits & bit):
+                    row.append("B")
+                elif(self.whiteBits & bit):
+                    row.append("W")
+                else:
+                    row.append(" ")
+            board.append(row)
+        return board
+
+    @board.setter
+    def board(self, board):
+        self.blackBits = 0
+        self.whiteBits = 0
+        for i in range(8):
+            for j in range(8):
+                if(board[i][j] == "B"):
+                    self.blackBits |= 1 << (i * 8 + j)
+                elif(board[i][j] == "W"):
+                    self.whiteBits |= 1 << (i * 8 + j)
+        self.blackCount = popCount(self.blackBits)
+        self.whiteCount = popCount(self.whiteBits)
+        self.blackWeightSum = computeWeightSum(self.blackBits)
+        self.whiteWeightSum = computeWeightSum(self.whiteBits)
+        occupied = self.blackBits | self.whiteBits
+        self.frontierBits = spread(occupied) & ~occupied
+        self.discsHash = computeDiscsHash(self.blackBits, self.whiteBits)
+        self.undoStack = [] # The moves made before cannot be undone on a new position
+        self.movesCache = None
+        if(self.patternIndices is not None):
+            self.patternIndices = computePatternIndices(self.blackBits, self.whiteBits)
+
     # This method is used to print the board on the console.
     def print(self):
         for row in self.board:
@@ -60,21 +352,23 @@ class ReversiBoard:
 
     # This method is used to reset the board to its initial state.
     def restart(self):
-        self.board = [
-    [" ", " ", " ", " ", " ", " ", " ", " "],
-    [" ", " ", " ", " ", " ", " ", " ", " "],
-    [" ", " ", " ", " ", " ", " ", " ", " "],
-    [" ", " ", " ", "W", "B", " ", " ", " "],
-    [" ", " ", " ", "B", "W", " ", " ", " "],
-    [" ", " ", " ", " ", " ", " ", " ", " "],
-    [" ", " ", " ", " ", " ", " ", " ", " "],
-    [" ", " ", " ", " ", " ", " ", " ", " "]
-]
+        self.blackBits = INITIAL_BLACK
+        self.whiteBits = INITIAL_WHITE
+        self.frontierBits = INITIAL_FRONTIER
+        self.discsHash = INITIAL_HASH
+        self.blackCount = 2
+        self.whiteCount = 2
+        self.blackWeightSum = INITIAL_WEIGHT_SUM
+        self.whiteWeightSum = INITIAL_WEIGHT_SUM
         self.whoseTurn = "B"
+        self.undoStack = []
+        self.movesCache = None
+        if(self.patternIndices is not None):
+            self.patternIndices = computePatternIndices(self.blackBits, self.whiteBits)
 
     # This method is used as a getter to the 2D array that represents the board.
     def getBoard(self):
-        return deepcopy(self.board) # We use deepcopy to return a copy of the board, not a reference to it.
+        return self.board # The 2D array is built from the bitboards, so it is a copy of the board, not a reference to it.
     
     # This method returns a list of tuples that represent the locations of the cells that are occupied by the given color.
     #Possible Colors: "W" or "B", otherwise it will throw an error.
@@ -83,29 +377,59 @@ class ReversiBoard:
         if(color not in ["W","B"]):
             raise Exception("Invalid Color! Color must be either 'W' or 'B'")
         
-        locations = []
-        for i in range(len(self.board)):
-            for j in range(len(self.board[i])):
-                if self.board[i][j] == color:
-                    locations.append([i,j])
-        return locations
+        return bitsToLocations(self.__bitsOf(color)[0])
+    
+    # This method returns a list of the frontier squares, which are the empty squares next to at least one disc.
+    def getFrontier(self):
+        return bitsToLocations(self.frontierBits)
+
+    # This method returns the number of frontier discs of the given color, which are the discs next to at least one empty square.
+    # Possible Colors: "W" or "B", otherwise it will throw an error.
+    def getFrontierDiscsCount(self, color : str):
+        if(color not in ["W","B"]):
+            raise Exception("Invalid Color! Color must be either 'W' or 'B'")
+
+        #Every empty square next to a disc is a frontier square, so the discs next to the frontier are the frontier discs
+        return popCount(self.__bitsOf(color)[0] & spread(self.frontierBits))
+
+    # This method returns the potential mobility of the given color, which is the number of frontier squares next to an opponent's disc.
+    # These are the squares where the color may be able to play later on.
+    # Possible Colors: "W" or "B", otherwise it will throw an error.
+    def getPotentialMobility(self, color : str):
+        if(color not in ["W","B"]):
+            raise Exception("Invalid Color! Color must be either 'W' or 'B'")
+
+        return popCount(self.frontierBits & spread(self.__bitsOf(color)[1]))
     
 
     # This method is used to get the score of the given color.
     # Possible Colors: "W" or "B", otherwise it will throw an error.
-    # The score is calculated by counting the number of cells that are occupied by the given color.
+    # The score is the number of cells that are occupied by the given color, which is kept as a counter.
     def getScore(self,color : str):
-        if(color not in ["W","B"]):
+        if(color == "B"):
+            return self.blackCount
+        elif(color == "W"):
+            return self.whiteCount
+        else:
             raise Exception("Invalid Color! Color must be either 'W' or 'B'")
-        
-        return len(self.getLocations(color))
     
 
+    # This method is used to get the sum of the static weights of the squares occupied by the given color, which is kept as a counter.
+    # Possible Colors: "W" or "B", otherwise it will throw an error.
+    def getStaticWeightSum(self,color : str):
+        if(color == "B"):
+            return self.blackWeightSum
+        elif(color == "W"):
+            return self.whiteWeightSum
+        else:
+            raise Exception("Invalid Color! Color must be either 'W' or 'B'")
+
+
     # This method is used to check whether the game has begun or not.
     # A game has begun if either player has made a move.
     # Which means that the initial state of the game is that the score of both players is 2.
     def hasGameBegun(self):
-        return not(self.getScore("W") == 2 and  self.getScore("B") == 2)
+        return not(self.whiteCount == 2 and  self.blackCount == 2)
 
 
     # This method is used to check if the given move is valid or not.
@@ -120,32 +444,9 @@ class ReversiBoard:
         if(not self.__isInside(row,col)):
             raise Exception("Invalid row or col! row and col must be between 0 and 7")
 
-        #Check if the cell is not empty
-        if(self.board[row][col] != " "):
-            return False
-
-        #Check if the cell has neighbours
-        if(not self.__hasNeighbours(row,col)):
-            return False
-        
-        #Check if the move is valid in any direction
-        directions = [(0,1),(1,0),(0,-1),(-1,0),(1,1),(-1,-1),(1,-1),(-1,1)]
-
-        for direction in directions:
-            newRow = row + direction[0]
-            newCol = col + direction[1]
-
-            otherColor = "W" if color == "B" else "B"
-
-            #Looping until we find a cell with the same color as the given color
-            while(self.__isInside(newRow,newCol) and self.board[newRow][newCol] == otherColor):
-                newRow += direction[0]
-                newCol += direction[1]
-                if(self.__isInside(newRow,newCol) and self.board[newRow][newCol] == color):
-                    return True
-        
-        #If we didn't find a cell with the same color as the given color, then the move is invalid. 
-        return False
+        #The move is valid if it is one of the cached valid moves of the color
+        moves = self.__getMovesCache()[0 if color == "B" else 1]
+        return (moves >> (row * 8 + col)) & 1 == 1
 
     #This method returns the valid moves for the given color.
     #Possible Colors: "W" or "B", otherwise it will throw an error.
@@ -155,14 +456,22 @@ class ReversiBoard:
         if(color not in ["W","B"]):
             raise Exception("Invalid Color! Color must be either 'W' or 'B'")
 
-        #Looping through the board to find the valid moves
-        validMoves = []
-        for i in range(len(self.board)):
-            for j in range(len(self.board[i])):
-                if(self.isValidMove(color,i,j)):
-                    validMoves.append([i,j])
-        return validMoves
-    
+        #The list is built once per position from the cached moves bitboard.
+        #Every caller gets the same list, so it must not be modified.
+        movesCache = self.__getMovesCache()
+        index = 0 if color == "B" else 1
+        if(movesCache[index + 2] is None):
+            movesCache[index + 2] = bitsToLocations(movesCache[index])
+        return movesCache[index + 2]
+
+    #This method returns the valid moves for the given color as a bitboard (the cached one, so it costs nothing after the first call).
+    #Possible Colors: "W" or "B", otherwise it will throw an error.
+    def getValidMovesBits(self, color : str):
+        if(color not in ["W","B"]):
+            raise Exception("Invalid Color! Color must be either 'W' or 'B'")
+
+        return self.__getMovesCache()[0 if color == "B" else 1]
+
     #This method is used to make a move on the board.
     def makeMove(self, color : str, row : int, col : int):
 
@@ -174,49 +483,101 @@ class ReversiBoard:
         if(self.whoseTurn != color):
             raise Exception("Invalid Move! It's not your turn.")
 
-        #Making the move
-        self.board[row][col] = color
-        directions = [(0,1),(1,0),(0,-1),(-1,0),(1,1),(-1,-1),(1,-1),(-1,1)]
-
-        for direction in directions:
-            newRow = row + direction[0]
-            newCol = col + direction[1]
-
-            otherColor = "W" if color == "B" else "B"
-
-            #Looping until we find a cell with the same color as the given color
-            while(self.__isInside(newRow,newCol) and self.board[newRow][newCol] == otherColor):
-            
-                newRow += direction[0]
-                newCol += direction[1]
-               
-                if(self.__isInside(newRow,newCol) and self.board[newRow][newCol] == color): #If we found a cell with the same color as the given color
-                    #Looping back to the original cell and flipping the pieces
-                    while(newRow != row or newCol != col):
-                        self.board[newRow][newCol] = color
-                        newRow -= direction[0]
-                        newCol -= direction[1]
-                    break
-                #Note: We cannot flip the pieces while looping forward because we don't know if we will find a cell with the same color as the given color or not.
+        #Making the move: placing the disc and flipping the enclosed discs of the other color
+        own, opp = self.__bitsOf(color)
+        placed = 1 << (row * 8 + col)
+        flips = computeFlips(own, opp, row * 8 + col)
+        own |= flips | placed
+        opp &= ~flips
+
+        #Saving what is needed to undo the move
+        self.undoStack.append((color, placed, flips, self.whoseTurn, self.movesCache, self.frontierBits, self.discsHash, self.blackWeightSum, self.whiteWeightSum))
+
+        #Updating the hash: adding the key of the placed disc and switching the keys of the flipped discs (counting them and adding up their weights on the way)
+        discsHash = self.discsHash ^ (ZOBRIST_BLACK if color == "B" else ZOBRIST_WHITE)[row * 8 + col]
+        flipsCount = 0
+        flipsWeight = 0
+        remainingFlips = flips
+        while remainingFlips:
+            lowestBit = remainingFlips & -remainingFlips
+            square = lowestBit.bit_length() - 1
+            discsHash ^= ZOBRIST_FLIP[square]
+            flipsWeight += SQUARE_WEIGHTS[square]
+            remainingFlips ^= lowestBit
+            flipsCount += 1
+        self.discsHash = discsHash
+
+        #Updating the pattern indices, if they are kept
+        if(self.patternIndices is not None):
+            self.__updatePatternIndices(row * 8 + col, flips, color, 1)
+
+        #Only the placed disc changes which squares are empty, so the frontier gains its empty neighbours and loses the placed square
+        self.frontierBits = (self.frontierBits | NEIGHBOURS[row * 8 + col]) & ~(own | opp)
+
+        otherColor = "W" if color == "B" else "B"
+        if(color == "B"):
+            self.blackBits, self.whiteBits = own, opp
+            self.blackCount += flipsCount + 1
+            self.whiteCount -= flipsCount
+            self.blackWeightSum += flipsWeight + SQUARE_WEIGHTS[row * 8 + col]
+            self.whiteWeightSum -= flipsWeight
+        else:
+            self.whiteBits, self.blackBits = own, opp
+            self.whiteCount += flipsCount + 1
+            self.blackCount -= flipsCount
+            self.whiteWeightSum += flipsWeight + SQUARE_WEIGHTS[row * 8 + col]
+            self.blackWeightSum -= flipsWeight
+
+        #Generating the valid moves of both colors once for the new position
+        ownMoves, oppMoves = generateMoves(own, opp, self.frontierBits), generateMoves(opp, own, self.frontierBits)
+        if(color == "B"):
+            self.movesCache = [ownMoves, oppMoves, None, None]
+        else:
+            self.movesCache = [oppMoves, ownMoves, None, None]
         
         #Changing the turn: 
         # If no one can make a move, then the game is over.
-        if(self.getValidMoves(otherColor) == [] and self.getValidMoves(color) == []):
+        if(oppMoves == 0 and ownMoves == 0):
             self.whoseTurn = " "
 
         # If the other player can't make a move, then the current player will play again.
-        elif(self.getValidMoves(otherColor) == []):
+        elif(oppMoves == 0):
             self.whoseTurn = color
 
         else: #Otherwise, the other player will play.
             self.whoseTurn = otherColor
         
+    #This method is used to undo the last move made on the board.
+    #It restores the flipped discs, removes the placed disc and gives the turn back to the previous player.
+    #If there is no move to undo, it will throw an error.
+    def undoMove(self):
+
+        if(self.undoStack == []):
+            raise Exception("There is no move to undo!")
+
+        color, placed, flips, previousTurn, self.movesCache, self.frontierBits, self.discsHash, self.blackWeightSum, self.whiteWeightSum = self.undoStack.pop()
+
+        if(self.patternIndices is not None):
+            self.__updatePatternIndices(placed.bit_length() - 1, flips, color, -1)
+
+        flipsCount = popCount(flips)
+        if(color == "B"):
+            self.blackBits ^= placed | flips
+            self.whiteBits |= flips
+            self.blackCount -= flipsCount + 1
+            self.whiteCount += flipsCount
+        else:
+            self.whiteBits ^= placed | flips
+            self.blackBits |= flips
+            self.whiteCount -= flipsCount + 1
+            self.blackCount += flipsCount
+
+        self.whoseTurn = previousTurn
         
     # This method is used to check the board is full or not.
     def isGameOver(self):
-        WhiteValidMoves = self.getValidMoves("W")
-        BlackValidMoves = self.getValidMoves("B")
-        return len(WhiteValidMoves) == 0 and len(BlackValidMoves) == 0
+        movesCache = self.__getMovesCache()
+        return movesCache[0] == 0 and movesCache[1] == 0
     
     # This method is used to get the winner of the game.
     # Possible return values: "W" or "B" or "Draw"
@@ -250,6 +611,13 @@ class ReversiBoard:
         
         self.whoseTurn = color
 
+    # This method returns the 64-bit Zobrist hash of the position, including the side to move.
+    # The key of the side to move is XORed in here, so the hash stays right even if whoseTurn is set directly.
+    # sideToMove: The color to move to hash the position with, by default the color whose turn it is.
+    # (The search passes it because a node where the player has to pass is searched as the other player's node)
+    def getHash(self, sideToMove : str = None):
+        return self.discsHash ^ ZOBRIST_TURN[self.whoseTurn if sideToMove is None else sideToMove]
+
     # This method is used to get the color of the player whose turn it is.
     def getWhoseTurn(self):
         return self.whoseTurn
@@ -257,11 +625,47 @@ class ReversiBoard:
     def getOpponent(self,player):
         return "W" if player == "B" else "B"
     
+    # This method starts keeping the pattern indices of the board up to date (it does nothing if they are already kept).
+    def enablePatternIndices(self):
+        if(self.patternIndices is None):
+            self.patternIndices = computePatternIndices(self.blackBits, self.whiteBits)
+
+    # This method returns the pattern indices of the board, and starts keeping them if they were not kept.
+    # The list is updated in place by the moves, so it must not be modified.
+    def getPatternIndices(self):
+        self.enablePatternIndices()
+        return self.patternIndices
+
+    # This private method updates the pattern indices with a move of the given color (direction 1) or with its undo (direction -1):
+    # The digit of the placed square goes from 0 to the digit of the color, and the digits of the flipped squares from the other color's digit to it.
+    def __updatePatternIndices(self, square : int, flips : int, color : str, direction : int):
+        indices = self.patternIndices
+        placedDelta = direction if color == "B" else 2 * direction
+        flipDelta = -direction if color == "B" else direction
+        for instance, power in SQUARE_PATTERNS[square]:
+            indices[instance] += placedDelta * power
+        while flips:
+            lowestBit = flips & -flips
+            for instance, power in SQUARE_PATTERNS[lowestBit.bit_length() - 1]:
+                indices[instance] += flipDelta * power
+            flips ^= lowestBit
+
     def getCopy(self):
-        #create new object
+        #create new object (the bitboards are integers, so copying them is enough)
+        #The copy starts with an empty undo stack
         reversedBoard = ReversiBoard()
-        reversedBoard.board = deepcopy(self.board)
-        reversedBoard.whoseTurn = deepcopy(self.whoseTurn)
+        reversedBoard.blackBits = self.blackBits
+        reversedBoard.whiteBits = self.whiteBits
+        reversedBoard.frontierBits = self.frontierBits
+        reversedBoard.discsHash = self.discsHash
+        reversedBoard.blackCount = self.blackCount
+        reversedBoard.whiteCount = self.whiteCount
+        reversedBoard.blackWeightSum = self.blackWeightSum
+        reversedBoard.whiteWeightSum = self.whiteWeightSum
+        reversedBoard.whoseTurn = self.whoseTurn
+        reversedBoard.movesCache = self.movesCache # The copy has the same position, so it can share the cached moves
+        if(self.patternIndices is not None):
+            reversedBoard.patternIndices = list(self.patternIndices)
         return reversedBoard
     
     
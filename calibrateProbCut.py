@@ -0,0 +1,124 @@
+##############################################################################################################################
+# Project Name :  Othello                                                                                                    #
+# File Name    :  calibrateProbCut.py                                                                                        #
+# Description  :  This file fits the Multi-ProbCut parameters of the principal variation search from self-play positions   #
+#                 and writes them to probCutParameters.json.                                                                 #
+# Date         :  10/18/2026                                                                                                 #
+#                                                                                                                            #
+##############################################################################################################################
+
+# Usage: python calibrateProbCut.py [games count] [max depth]
+# The engine plays games against itself (with some random moves, so the games are different), and every few moves
+# the position is searched with every deep depth and its shallow depth. For every game phase and deep depth,
+# a linear regression of the deep scores on the shallow scores gives the slope, the offset and the standard deviation (sigma) of the error.
+# The searches are made without Multi-ProbCut and with the hard heuristics, which are the ones that use it.
+
+import json
+import random
+import sys
+
+from board import ReversiBoard
+from moveOrdering import MoveOrdering
+from principalVariationSearch import PrincipalVariationSearchStrategy, getGamePhase, getProbCutShallowDepth, PROBCUT_PARAMETERS_FILE
+
+
+# The first deep depth that uses Multi-ProbCut (the shallower ones are too cheap to gain anything).
+MIN_DEPTH = 3
+
+# A position is kept every SAMPLE_INTERVAL moves, and a game move is random with RANDOM_MOVE_PROBABILITY.
+SAMPLE_INTERVAL = 3
+RANDOM_MOVE_PROBABILITY = 0.2
+
+# The engine plays the games with this depth.
+GAME_DEPTH = 2
+
+# Each phase and depth needs this number of samples at least to be fitted.
+MIN_SAMPLES = 10
+
+
+# This function returns the score of the position for the player to move, searched with the given depth from scratch.
+def searchScore(board : ReversiBoard, player : str, depth : int):
+    PrincipalVariationSearchStrategy.transpositionTable.clear()
+    PrincipalVariationSearchStrategy.moveOrdering = MoveOrdering()
+    PrincipalVariationSearchStrategy.getBestMove(board, player, depth)
+    return max(score for move, score in PrincipalVariationSearchStrategy.rootScores)
+
+
+# This function plays the self-play games and returns the positions to calibrate with, as (board, player).
+def getSelfPlayPositions(gamesCount : int, randomGenerator : random.Random):
+    positions = []
+    for gameIndex in range(gamesCount):
+        board = ReversiBoard()
+        movesCount = 0
+        while not board.isGameOver():
+            player = board.whoseTurn
+            validMoves = board.getValidMoves(player)
+            if(movesCount % SAMPLE_INTERVAL == 0):
+                positions.append((board.getCopy(), player))
+
+            if(randomGenerator.random() < RANDOM_MOVE_PROBABILITY):
+                move = randomGenerator.choice(validMoves)
+            else:
+                move = PrincipalVariationSearchStrategy.getBestMove(board, player, GAME_DEPTH)
+            board.makeMove(player, move[0], move[1])
+            movesCount += 1
+    return positions
+
+
+# This function returns the slope, the offset and the standard deviation of the error of the least squares line y = slope * x + offset.
+def fitLine(samples):
+    count = len(samples)
+    meanX = sum(x for x, y in samples) / count
+    meanY = sum(y for x, y in samples) / count
+    varianceX = sum((x - meanX) ** 2 for x, y in samples)
+    covariance = sum((x - meanX) * (y - meanY) for x, y in samples)
+
+    slope = covariance / varianceX if varianceX > 0 else 1.0
+    offset = meanY - slope * meanX
+    sigma = (sum((y - slope * x - offset) ** 2 for x, y in samples) / count) ** 0.5
+    return slope, offset, sigma
+
+
+# This function fits the parameters of every phase and depth and returns them as {phase: {depth: [shallow depth, slope, offset, sigma]}}.
+def calibrate(gamesCount : int, maxDepth : int, seed : int = 2023):
+    randomGenerator = random.Random(seed)
+    PrincipalVariationSearchStrategy.setDifficulty("hard")
+    PrincipalVariationSearchStrategy.probCutParameters = {}
+
+    positions = getSelfPlayPositions(gamesCount, randomGenerator)
+    print(f"{len(positions)} positions")
+
+    samples = {}
+    for positionIndex, (board, player) in enumerate(positions):
+        emptySquares = 64 - board.getScore("W") - board.getScore("B")
+        phase = getGamePhase(emptySquares)
+        scores = {}
+        for depth in range(MIN_DEPTH, min(maxDepth, emptySquares) + 1):
+            shallowDepth = getProbCutShallowDepth(depth)
+            for searchDepth in [shallowDepth, depth]:
+                if(searchDepth not in scores):
+                    scores[searchDepth] = searchScore(board, player, searchDepth)
+            samples.setdefault(phase, {}).setdefault(depth, []).append((scores[shallowDepth], scores[depth]))
+
+        if((positionIndex + 1) % 50 == 0):
+            print(f"{positionIndex + 1} positions searched")
+
+    parameters = {}
+    for phase in sorted(samples):
+        for depth in sorted(samples[phase]):
+            if(len(samples[phase][depth]) < MIN_SAMPLES):
+                continue
+            slope, offset, sigma = fitLine(samples[phase][depth])
+            parameters.setdefault(phase, {})[depth] = [getProbCutShallowDepth(depth), round(slope, 4), round(offset, 4), round(sigma, 4)]
+            print(f"phase {phase} depth {depth} (shallow {getProbCutShallowDepth(depth)}): slope {slope:.3f} offset {offset:.3f} sigma {sigma:.3f} ({len(samples[phase][depth])} samples)")
+    return parameters
+
+
+if __name__ == "__main__":
+    gamesCount = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    maxDepth = int(sys.argv[2]) if len(sys.argv) > 2 else 6
+    parameters = calibrate(gamesCount, maxDepth)
+
+    with open(PROBCUT_PARAMETERS_FILE, "w") as parametersFile:
+        json.dump(parameters, parametersFile, indent = 4, sort_keys = True)
+    print(f"The parameters were written to {PROBCUT_PARAMETERS_FILE}")
@@ -0,0 +1,276 @@
+##############################################################################################################################
+# Project Name :  Othello                                                                                                    #
+# File Name    :  endgameSolver.py                                                                                           #
+# Description  :  This file contains the class that solves the end of the game exactly. The class inherits from the         #
+#                 Strategy interface.                                                                                        #
+# Date         :  10/18/2026                                                                                                 #
+#                                                                                                                            #
+##############################################################################################################################
+
+# When only a few empty squares are left, the whole game tree fits in the search, so there is no need for a heuristic:
+# The solver searches every line until the end of the game and scores it with the final disc difference, which gives the exact result.
+# It works directly on the bitboards (the player to move and the opponent) with negamax:
+# The score of a position for the player to move is minus the score of the next position for the opponent.
+
+# The moves are searched in this order:
+# - Fastest first: while many squares are empty, the moves that leave the opponent the fewest replies are searched first,
+#   they lead to the smallest trees and are often the best moves too.
+# - Parity: the board is split into 4 quadrants, and the moves in the quadrants with an odd number of empty squares are searched first
+#   (the player who plays last in a region usually gains from it).
+# The last few empty squares are solved by a special routine that skips the move generation and the sorting.
+
+# When only the result of the game is needed (win, loss or draw), the search uses the window (-1, 1) around 0:
+# Every move that is known to win or to lose is pruned right away, so it can solve positions with a few more empty squares.
+
+from board import ReversiBoard, generateMoves, computeFlips, popCount, FULL_MASK
+from strategy import Strategy
+import math
+
+
+# The 4 quadrants of the board, as bitboards.
+QUADRANTS = [0x000000000F0F0F0F, 0x00000000F0F0F0F0, 0x0F0F0F0F00000000, 0xF0F0F0F000000000]
+
+# The number of empty squares at or below which the special routine is used.
+LAST_EMPTIES = 4
+
+# The number of empty squares above which the moves are sorted fastest first (below it, the parity alone is used, it is cheaper).
+FASTEST_FIRST_EMPTIES = 7
+
+
+class EndgameSolver(Strategy):
+
+    # The solver takes over when the number of empty squares is at or below this threshold (see canSolve).
+    # Every empty square multiplies the time of the solve, it can be changed with setEmptiesThreshold.
+    emptiesThreshold = 12
+
+    # The win/loss/draw search is much cheaper, so it takes over a few empty squares earlier (see canSolveWLD).
+    wldEmptiesThreshold = 14
+
+    # Statistics of the last solve: the number of nodes visited.
+    searchStats = {"nodes": 0}
+
+
+    ##############################################################################################################################
+    # Method Name: getBestMove
+
+    # Purpose: This method is used to get the best move for the given player by solving the game to the end.
+    # depth is not used, the solver always searches to the end of the game.
+    ##############################################################################################################################
+
+    def getBestMove(boardToGetBestMove : ReversiBoard,player,depth = None):
+        bestMove, score = EndgameSolver.solve(boardToGetBestMove,player)
+        return bestMove
+
+    ##############################################################################################################################
+    # Method Name: solve
+
+    # Purpose: This method is used to get the best move for the given player and the exact final score of the game.
+
+    # Method Description:
+    # The score is the number of discs of the player minus the number of discs of the opponent at the end of the game, if both play perfectly.
+    # With a window (alpha, beta), the score is only exact when it is inside the window:
+    # A score <= alpha means that the real score is at most alpha, and a score >= beta that it is at least beta.
+
+    #function Arguments:
+    #boardToSolve: The current state of the game.
+    #player: The player for whom we are solving the game W or B.
+    #alpha, beta: The window of the search (by default, the whole range of the scores, so the score is exact).
+
+    # Returns the best move (None if the player has no move) and the score.
+    ##############################################################################################################################
+
+    def solve(boardToSolve : ReversiBoard,player,alpha = -64,beta = 64):
+
+        EndgameSolver.searchStats = {"nodes": 0}
+
+        own = boardToSolve.blackBits if player == "B" else boardToSolve.whiteBits
+        opp = boardToSolve.whiteBits if player == "B" else boardToSolve.blackBits
+        empties = ~(own | opp) & FULL_MASK
+
+        bestMove = None
+        bestScore = -math.inf
+        for score, square, flips in EndgameSolver.__orderMoves(own,opp,empties,generateMoves(own,opp,empties)):
+            score = -EndgameSolver.__solve(opp & ~flips,own | flips | (1 << square),empties & ~(1 << square),-beta,-max(alpha,bestScore),False)
+            if(score > bestScore):
+                bestScore = score
+                bestMove = [square >> 3, square & 7]
+                if(bestScore >= beta):
+                    break
+
+        # The player has to pass (or the game is over): the score is the one of the opponent's position.
+        if(bestMove is None):
+            bestScore = -EndgameSolver.__solve(opp,own,empties,-beta,-alpha,True)
+
+        return bestMove, bestScore
+
+    ##############################################################################################################################
+    # Method Name: solveWLD
+
+    # Purpose: This method is used to know if the game is won, lost or drawn for the given player, and a move that keeps that result.
+
+    # Method Description:
+    # The game is solved with the window (-1, 1): a score of 1 or more is a win, -1 or less a loss and 0 a draw.
+    # The search stops at the first winning move, so the move wins but not necessarily by the most discs.
+
+    # Returns the move (None if the player has no move) and the result: 1 for a win, 0 for a draw and -1 for a loss.
+    ##############################################################################################################################
+
+    def solveWLD(boardToSolve : ReversiBoard,player):
+        bestMove, score = EndgameSolver.solve(boardToSolve,player,-1,1)
+        return bestMove, (score > 0) - (score < 0)
+
+    ##############################################################################################################################
+    # Method Name: solve (private)
+
+    # Purpose: This method is the negamax search of the solver.
+
+    #function Arguments:
+    #own: The discs of the player to move.
+    #opp: The discs of the opponent.
+    #empties: The empty squares.
+    #alpha, beta: The window of the search.
+    #passed: True if the opponent just passed, so if the player cannot move either the game is over.
+    ##############################################################################################################################
+
+    def __solve(own,opp,empties,alpha,beta,passed):
+
+        if(popCount(empties) <= LAST_EMPTIES):
+            return EndgameSolver.__solveLastEmpties(own,opp,empties,alpha,beta,passed)
+
+        EndgameSolver.searchStats["nodes"] += 1
+
+        moves = generateMoves(own,opp,empties)
+        if(moves == 0):
+            if(passed):
+                return popCount(own) - popCount(opp)
+            return -EndgameSolver.__solve(opp,own,empties,-beta,-alpha,True)
+
+        bestScore = -math.inf
+        for score, square, flips in EndgameSolver.__orderMoves(own,opp,empties,moves):
+            score = -EndgameSolver.__solve(opp & ~flips,own | flips | (1 << square),empties & ~(1 << square),-beta,-max(alpha,bestScore),False)
+            if(score > bestScore):
+                bestScore = score
+                if(bestScore >= beta):
+                    break
+
+        return bestScore
+
+    ##############################################################################################################################
+    # Method Name: orderMoves (private)
+
+    # Purpose: This method returns the moves as a sorted list of (sort key, square, flips).
+    # With many empty squares, the key is the number of replies of the opponent (fastest first), with the parity to break the ties.
+    # With fewer empty squares, the key is only the parity.
+    ##############################################################################################################################
+
+    def __orderMoves(own,opp,empties,moves):
+
+        # The quadrants with an odd number of empty squares.
+        oddQuadrants = 0
+        for quadrant in QUADRANTS:
+            if(popCount(empties & quadrant) & 1):
+                oddQuadrants |= quadrant
+
+        fastestFirst = popCount(empties) > FASTEST_FIRST_EMPTIES
+        orderedMoves = []
+        while moves:
+            lowestBit = moves & -moves
+            moves ^= lowestBit
+            square = lowestBit.bit_length() - 1
+            flips = computeFlips(own,opp,square)
+
+            key = 0 if lowestBit & oddQuadrants else 1
+            if(fastestFirst):
+                key += 2 * popCount(generateMoves(opp & ~flips,own | flips | lowestBit,empties ^ lowestBit))
+            orderedMoves.append((key,square,flips))
+
+        orderedMoves.sort()
+        return orderedMoves
+
+    ##############################################################################################################################
+    # Method Name: solveLastEmpties (private)
+
+    # Purpose: This method solves the positions with LAST_EMPTIES empty squares or fewer.
+    # The moves are found by trying every empty square (odd quadrants first), which is cheaper than generating and sorting them.
+    ##############################################################################################################################
+
+    def __solveLastEmpties(own,opp,empties,alpha,beta,passed):
+
+        EndgameSolver.searchStats["nodes"] += 1
+
+        if(empties & (empties - 1) == 0):
+            if(empties == 0):
+                return popCount(own) - popCount(opp)
+            return EndgameSolver.__solveLastEmpty(own,opp,empties.bit_length() - 1)
+
+        oddQuadrants = 0
+        for quadrant in QUADRANTS:
+            if(popCount(empties & quadrant) & 1):
+                oddQuadrants |= quadrant
+
+        bestScore = -math.inf
+        for squares in (empties & oddQuadrants, empties & ~oddQuadrants):
+            while squares:
+                lowestBit = squares & -squares
+                squares ^= lowestBit
+                flips = computeFlips(own,opp,lowestBit.bit_length() - 1)
+                if(flips == 0):
+                    continue
+
+                score = -EndgameSolver.__solveLastEmpties(opp & ~flips,own | flips | lowestBit,empties ^ lowestBit,-beta,-max(alpha,bestScore),False)
+                if(score > bestScore):
+                    bestScore = score
+                    if(bestScore >= beta):
+                        return bestScore
+
+        # The player has no move.
+        if(bestScore == -math.inf):
+            if(passed):
+                return popCount(own) - popCount(opp)
+            return -EndgameSolver.__solveLastEmpties(opp,own,empties,-beta,-alpha,True)
+
+        return bestScore
+
+    # This private method solves the position with one empty square: the player plays it, or else the opponent, or else nobody can.
+    def __solveLastEmpty(own,opp,square):
+        score = popCount(own) - popCount(opp)
+
+        flips = computeFlips(own,opp,square)
+        if(flips):
+            return score + 1 + 2 * popCount(flips)
+
+        flips = computeFlips(opp,own,square)
+        if(flips):
+            return score - 1 - 2 * popCount(flips)
+
+        return score
+
+    ##############################################################################################################################
+
+    # Method Name: canSolve
+    # Returns True if the position has few enough empty squares for the solver.
+
+    def canSolve(board : ReversiBoard):
+        return 64 - board.getScore("W") - board.getScore("B") <= EndgameSolver.emptiesThreshold
+
+    # Method Name: canSolveWLD
+    # Returns True if the position has few enough empty squares for the win/loss/draw search.
+
+    def canSolveWLD(board : ReversiBoard):
+        return 64 - board.getScore("W") - board.getScore("B") <= EndgameSolver.wldEmptiesThreshold
+
+    # Method Name: setEmptiesThreshold
+    # Sets the number of empty squares at or below which the solver takes over.
+
+    def setEmptiesThreshold(emptiesThreshold):
+        if(emptiesThreshold < 0):
+            raise ValueError("The number of empty squares cannot be negative")
+        EndgameSolver.emptiesThreshold = emptiesThreshold
+
+    # Method Name: setWLDEmptiesThreshold
+    # Sets the number of empty squares at or below which the win/loss/draw search takes over.
+
+    def setWLDEmptiesThreshold(wldEmptiesThreshold):
+        if(wldEmptiesThreshold < 0):
+            raise ValueError("The number of empty squares cannot be negative")
+        EndgameSolver.wldEmptiesThreshold = wldEmptiesThreshold
@@ -0,0 +1,104 @@
+##############################################################################################################################
+# Project Name :  Othello                                                                                                    #
+# File Name    :  evaluationCache.py                                                                                         #
+# Description  :  This file contains the evaluation cache, which remembers the heuristic values of the leaves that were     #
+#                 already evaluated, shared by the MinMax and the alpha-beta strategies.                                     #
+# Date         :  10/18/2026                                                                                                 #
+#                                                                                                                            #
+##############################################################################################################################
+
+from collections import OrderedDict
+import random
+
+# The same leaves are evaluated again and again: through transpositions inside one search, by the iterations of the iterative
+# deepening and by the searches of the next moves of the game. The transposition table does not keep the leaves,
+# so their values are kept here, keyed by the Zobrist hash of the position, the player it is evaluated for and the configuration
+# of the evaluator (the same position has a different value when the weights of the heuristics change).
+
+# The cache has a memory cap: when it is full, the entry that was used the longest time ago is thrown away (LRU eviction).
+
+# The key of each player, XORed into the hash of the position (the values are calculated for one player).
+PLAYER_KEYS = {"B": 0, "W": 0x2545F4914F6CDD1D}
+
+
+class EvaluationCache:
+
+    # A rough estimate of the memory used by one entry (the linked entry of the ordered dictionary, the key and the float value).
+    # It is used to turn the memory cap into a number of entries.
+    bytesPerEntry = 150
+
+    ##############################################################################################################################
+    # The constructor:
+    # maxMemoryMB: The maximum memory that the cache is allowed to use, in megabytes.
+    ##############################################################################################################################
+    def __init__(self, maxMemoryMB : float = 8):
+        # The random key of every configuration of the evaluator that was seen (they are kept when the cache is cleared).
+        self.configurationKeys = {}
+        self.randomGenerator = random.Random(2023)
+        # The last configuration and its key, so the key of a configuration is only looked up when it changes.
+        self.lastConfiguration = None
+        self.lastConfigurationKey = 0
+        self.setMaxMemory(maxMemoryMB)
+
+    # This method sets the memory cap of the cache and clears it.
+    def setMaxMemory(self, maxMemoryMB : float):
+        if(maxMemoryMB <= 0):
+            raise ValueError("The memory of the evaluation cache must be positive")
+
+        self.maxMemoryMB = maxMemoryMB
+        self.maxEntries = max(1, int(maxMemoryMB * 1024 * 1024) // self.bytesPerEntry)
+        self.clear()
+
+    # This method removes all the entries from the cache and resets its counters.
+    def clear(self):
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    # This method returns the key of a position evaluated for the given player with the given configuration.
+    # The configuration is any hashable value that changes when the values of the evaluator change (see GameHeuristics.getConfiguration).
+    def getKey(self, board, player : str, configuration):
+        if(configuration != self.lastConfiguration):
+            configurationKey = self.configurationKeys.get(configuration)
+            if(configurationKey is None):
+                configurationKey = self.randomGenerator.getrandbits(64)
+                self.configurationKeys[configuration] = configurationKey
+            self.lastConfiguration = configuration
+            self.lastConfigurationKey = configurationKey
+        return board.discsHash ^ PLAYER_KEYS[player] ^ self.lastConfigurationKey
+
+    # This method returns the value stored for the given key, or None if there is no such entry.
+    # The entry becomes the most recently used one.
+    def probe(self, key : int):
+        value = self.entries.get(key)
+        if(value is None):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return value
+
+    # This method stores the value of a position, and throws the least recently used entry away if the cache is full.
+    # The values are only stored after a missed probe, so the new entry is already the most recently used one.
+    def store(self, key : int, value):
+        entries = self.entries
+        entries[key] = value
+        if(len(entries) > self.maxEntries):
+            entries.popitem(last = False)
+            self.evictions += 1
+
+    # This method returns the number of entries in the cache.
+    def getSize(self):
+        return len(self.entries)
+
+    # This method returns the share of the probes that found their position in the cache (between 0 and 1).
+    def getHitRate(self):
+        if(self.hits + self.misses == 0):
+            return 0
+        return self.hits / (self.hits + self.misses)
+
+
+# The cache shared by the strategies (every process has its own).
+sharedEvaluationCache = EvaluationCache()
@@ -4,7 +4,7 @@
 # Date: 2022-6-10
 # Description: This file contains all the heuristics that will be used in the game.
 ############################################################################################################
-from board import ReversiBoard
+from board import ReversiBoard, popCount, spread, FULL_MASK, STATIC_WEIGHTS
 
 # Demo for the board shape:
 # 2D list where White is represented as W and Black is represented as B
@@ -22,16 +22,56 @@ from board import ReversiBoard
 
 
 #static weight associated to each coin position
-board_static_weights = [
-    [4, -3, 2, 2, 2, 2, -3, 4],
-    [-3, -4, -1, -1, -1, -1, -4, -3],
-    [2, -1, 1, 0, 0, 1, -1, 2],
-    [2, -1, 0, 1, 1, 0, -1, 2],
-    [2, -1, 0, 1, 1, 0, -1, 2],
-    [2, -1, 1, 0, 0, 1, -1, 2],
-    [-3, -4, -1, -1, -1, -1, -4, -3],
-    [4, -3, 2, 2, 2, 2, -3, 4]
-]
+#(the table is defined in board.py, which keeps the sum of the weights of each color up to date)
+board_static_weights = STATIC_WEIGHTS
+
+
+#bitboards used by the fused evaluator (square (row, col) is bit row * 8 + col, like in the board)
+CORNERS_BITS = 0x8100000000000081
+TOP_EDGE_BITS = 0x000000000000007E     #row 0 without the corners
+BOTTOM_EDGE_BITS = 0x7E00000000000000  #row 7 without the corners
+LEFT_EDGE_BITS = 0x0001010101010100    #column 0 without the corners
+RIGHT_EDGE_BITS = 0x0080808080808000   #column 7 without the corners
+INTERIOR_BITS = 0x007E7E7E7E7E7E00     #every square that is not on an edge
+
+#the weights of the actual and the potential corners in cornersCaptured
+ACTUAL_CORNERS_WEIGHT = 0.8
+POTENTIAL_CORNERS_WEIGHT = 0.2
+
+#the lazy evaluation compares its bounds with the window with this slack, so the rounding of the floats cannot make a bound wrong
+LAZY_SLACK = 1e-9
+
+
+#returns the squares whose neighbour at the given offset (row step * 8 + col step) is in bits
+#the squares whose neighbour would be outside the board get garbage, so the result must be masked by the caller
+def neighbourIn(bits, offset):
+    if(offset > 0):
+        return bits >> offset
+    return (bits << -offset) & FULL_MASK
+
+
+#returns the stability count of the discs in "own", with the same rules as GameHeuristics.stability:
+#+1 for a corner, an edge disc next to an own disc towards the inside, or an inner disc with a full own column beside it
+#(or the own discs above, below and on one side), 0 for an other disc next to an empty square and -1 for the rest
+def stabilityCount(own, empty):
+    up, down, left, right = neighbourIn(own, -8), neighbourIn(own, 8), neighbourIn(own, -1), neighbourIn(own, 1)
+    stableInterior = own & INTERIOR_BITS & (
+        (neighbourIn(own, -9) & left & neighbourIn(own, 7)) |
+        (neighbourIn(own, -7) & right & neighbourIn(own, 9)) |
+        (up & down & (left | right)))
+    stableEdges = own & ((TOP_EDGE_BITS & down) | (BOTTOM_EDGE_BITS & up) | (LEFT_EDGE_BITS & right) | (RIGHT_EDGE_BITS & left))
+    unstableInterior = own & INTERIOR_BITS & ~stableInterior & ~spread(empty)
+    return popCount(own & CORNERS_BITS) + popCount(stableEdges) + popCount(stableInterior) - popCount(unstableInterior)
+
+
+#returns 100 * (own - opp) / (own + opp), or 0 when both are 0 (the scale of most of the heuristics)
+#coin parity and stability divide before multiplying by 100, so they pass isRatioFirst to get exactly the same values as their methods
+def relativeValue(own, opp, isRatioFirst = False):
+    if(own + opp == 0):
+        return 0
+    if(isRatioFirst):
+        return 100 * ((own - opp) / (own + opp))
+    return 100 * (own - opp) / (own + opp)
 
 
 class GameHeuristics():
@@ -42,28 +82,25 @@ class GameHeuristics():
     mobility_weight = 0.40
     stability_weight = 0.05
     cornersCaptured_weight = 0.45  #one of the most important heuristics so we assigned to it the maximum weight
+
+    #when True, evaluate checks that every heuristic is between -100 and 100 (it costs a full evaluation of every term, so it is off by default)
+    debugMode = False
     def _init_(self):
         pass
 
 
+    #returns the configuration of the evaluator (the weights of the heuristics), the values of evaluate change when it changes
+    #it is part of the key of the evaluation cache (see evaluationCache.py)
+    def getConfiguration(self):
+        return ("heuristics", self.coinParity_weight, self.mobility_weight, self.stability_weight, self.cornersCaptured_weight)
+
+
     #alternative function to calculate the utility value of heuristic
     #calculate the value based on adding together the weights of the squares in which the player’s coins are present.
     def utility(self,board ,player):
-        #get the white coins locations
-        white_locations = board.getLocations("W")
-        #get the black coins locations
-        black_locations = board.getLocations("B")
-        #initialized white and black values
-        white_coins_value =0
-        black_coins_value =0
-        #calculate the white coins values
-        for location in white_locations:
-            row, col = location
-            white_coins_value += board_static_weights[row][col]
-        #calculate the black coins values
-        for location in black_locations:
-            row, col = location
-            black_coins_value += board_static_weights[row][col]
+        #the white and black coins values are kept up to date by the board as the moves are made and undone
+        white_coins_value = board.getStaticWeightSum("W")
+        black_coins_value = board.getStaticWeightSum("B")
         #calculate white & black coins total utlity value
         white_utility_value = white_coins_value - black_coins_value
         black_utility_value = black_coins_value - white_coins_value
@@ -93,22 +130,11 @@ class GameHeuristics():
     #This method is used to calculate the heuristics based on the coin parity
     #The player who has the most coins on the board has higher value
     def coinParity(self, board : ReversiBoard, player):
-        black_coins = 0
-        white_coins = 0
         coinParityValue = 0
 
-        # getting the current board
-        board_coins = board.getBoard()
-
-        #iterate through the whole board to count the number of black coins and white coins
-        for row in board_coins: #rows
-            for item in row: #columns (items)
-                if (item == "B"):
-                    #counting the black coins
-                    black_coins = black_coins + 1
-                elif (item == "W"):
-                    # counting the white coins
-                    white_coins = white_coins + 1
+        #the board keeps the number of coins of each color, so there is no need to scan it
+        black_coins = board.getScore("B")
+        white_coins = board.getScore("W")
 
         #Assume that the max player plays with white coins
         #the value returned is in range of -100 to 100
@@ -142,6 +168,39 @@ class GameHeuristics():
         return mobility_value
 
 
+    #method is used to calculate the heuristic value based on the potential mobility.
+    #the potential mobility of a player is the number of empty squares next to the opponent's coins,
+    #which are the squares where the player may be able to play in the next moves
+    def potentialMobility(self, board : ReversiBoard, player):
+        #the board keeps track of the frontier squares, so there is no need to scan it
+        white_potential_mobility = board.getPotentialMobility("W")
+        black_potential_mobility = board.getPotentialMobility("B")
+
+        if white_potential_mobility + black_potential_mobility == 0:
+            return 0
+
+        if(player == "W"):
+            return 100*(white_potential_mobility - black_potential_mobility)/(white_potential_mobility + black_potential_mobility)
+        elif (player == "B"):
+            return 100*(black_potential_mobility - white_potential_mobility)/(black_potential_mobility + white_potential_mobility)
+
+
+    #method is used to calculate the heuristic value based on the frontier coins.
+    #a frontier coin is a coin next to an empty square, it can be flipped in the next moves
+    #so the player with less frontier coins has higher value
+    def frontierCoins(self, board : ReversiBoard, player):
+        white_frontier_coins = board.getFrontierDiscsCount("W")
+        black_frontier_coins = board.getFrontierDiscsCount("B")
+
+        if white_frontier_coins + black_frontier_coins == 0:
+            return 0
+
+        if(player == "W"):
+            return 100*(black_frontier_coins - white_frontier_coins)/(white_frontier_coins + black_frontier_coins)
+        elif (player == "B"):
+            return 100*(white_frontier_coins - black_frontier_coins)/(black_frontier_coins + white_frontier_coins)
+
+
     #method is used to calculate the heuristic value based on the corner captured.
     #by determining the actual captured corners and the potential captured corners
     def cornersCaptured(self,board:ReversiBoard ,player):
@@ -386,6 +445,99 @@ class GameHeuristics():
 
         return value
 
+
+    #fused version of the heuristics above, used by the search engines at the leaves:
+    #it reads the bitboards and the cached moves of the board once and computes every term from them,
+    #instead of building the 2D board and generating the moves again for each heuristic.
+    #the values are the same as the ones of the separate methods.
+    #returns a dictionary with every heuristic and the weighted total ("combined", the same as combinedHeuristics)
+    #the utility is not part of the total, so it can be left out (None) with includeUtility = False
+    def evaluateTerms(self, board : ReversiBoard, player, includeUtility = True):
+        own = board.blackBits if player == "B" else board.whiteBits
+        opp = board.whiteBits if player == "B" else board.blackBits
+        ownMoves = board.getValidMovesBits(player)
+        oppMoves = board.getValidMovesBits("W" if player == "B" else "B")
+
+        coinParity_value = relativeValue(board.getScore(player), board.getScore("W" if player == "B" else "B"), True)
+        mobility_value = relativeValue(popCount(ownMoves), popCount(oppMoves))
+        corners_value = ACTUAL_CORNERS_WEIGHT * relativeValue(popCount(own & CORNERS_BITS), popCount(opp & CORNERS_BITS)) + POTENTIAL_CORNERS_WEIGHT * relativeValue(popCount(ownMoves & CORNERS_BITS), popCount(oppMoves & CORNERS_BITS))
+
+        empty = ~(own | opp) & FULL_MASK
+        stability_value = relativeValue(stabilityCount(own, empty), stabilityCount(opp, empty), True)
+        stability_value = max(-100, min(100, stability_value))
+
+        #the utility is scaled from the difference of the static weights, capped at 14
+        utility_value = None
+        if(includeUtility):
+            utility_difference = board.getStaticWeightSum(player) - board.getStaticWeightSum("W" if player == "B" else "B")
+            utility_value = (100 * max(-14, min(14, utility_difference))) / 14 if utility_difference != 0 else 0
+
+        combined_value = self.coinParity_weight * coinParity_value + self.mobility_weight * mobility_value + self.stability_weight * stability_value + self.cornersCaptured_weight * corners_value
+
+        return {"coinParity": coinParity_value, "mobility": mobility_value, "cornersCaptured": corners_value,
+                "stability": stability_value, "utility": utility_value, "combined": combined_value}
+
+
+    #returns the weighted total of the fused evaluator (the same value as combinedHeuristics)
+    #in debug mode, it also checks that every heuristic is in range, and raises an exception if one is not
+    def evaluate(self, board : ReversiBoard, player):
+        terms = self.evaluateTerms(board, player, GameHeuristics.debugMode)
+
+        if(GameHeuristics.debugMode):
+            for name, message in [("utility", "Utility"), ("coinParity", "Coin Parity"), ("stability", "Stability"), ("mobility", "Mobility"), ("cornersCaptured", "Corners Captured")]:
+                if(terms[name] > 100 or terms[name] < -100):
+                    raise Exception(message + " is greater than 100 or less than -100")
+
+        return terms["combined"]
+
+
+    #lazy version of evaluate, for a search that only needs to know the value inside its window (alpha, beta):
+    #the cheap terms (coin parity and actual corners) are computed first, then mobility and potential corners (from the cached moves),
+    #and stability last. After each step, if the partial total plus (or minus) the largest value that the remaining weighted terms
+    #can add is still outside the window, the remaining terms are skipped and that bound is returned instead:
+    #a value <= alpha is an upper bound of the total and a value >= beta a lower bound, which is all that alpha-beta needs from it.
+    #(the static weights are not part of the total, so they are not computed.)
+    #returns the value and the number of steps that were skipped: 0 (the exact total), 1 (stability) or 2 (mobility, potential corners and stability)
+    def evaluateLazy(self, board : ReversiBoard, player, alpha, beta):
+        if(GameHeuristics.debugMode):
+            return self.evaluate(board, player), 0
+
+        opponent = "W" if player == "B" else "B"
+        own = board.blackBits if player == "B" else board.whiteBits
+        opp = board.whiteBits if player == "B" else board.blackBits
+
+        #the largest contribution of the weighted terms that are not computed yet (every heuristic is between -100 and 100)
+        stabilityMargin = self.stability_weight * 100 + LAZY_SLACK
+        movesMargin = self.mobility_weight * 100 + self.cornersCaptured_weight * POTENTIAL_CORNERS_WEIGHT * 100 + stabilityMargin
+
+        coinParity_value = relativeValue(board.getScore(player), board.getScore(opponent), True)
+        actualCorners_value = relativeValue(popCount(own & CORNERS_BITS), popCount(opp & CORNERS_BITS))
+        partial = self.coinParity_weight * coinParity_value + self.cornersCaptured_weight * ACTUAL_CORNERS_WEIGHT * actualCorners_value
+        if(partial + movesMargin <= alpha):
+            return partial + movesMargin, 2
+        if(partial - movesMargin >= beta):
+            return partial - movesMargin, 2
+
+        ownMoves = board.getValidMovesBits(player)
+        oppMoves = board.getValidMovesBits(opponent)
+        mobility_value = relativeValue(popCount(ownMoves), popCount(oppMoves))
+        corners_value = ACTUAL_CORNERS_WEIGHT * actualCorners_value + POTENTIAL_CORNERS_WEIGHT * relativeValue(popCount(ownMoves & CORNERS_BITS), popCount(oppMoves & CORNERS_BITS))
+        partial = self.coinParity_weight * coinParity_value + self.mobility_weight * mobility_value + self.cornersCaptured_weight * corners_value
+        if(partial + stabilityMargin <= alpha):
+            return partial + stabilityMargin, 1
+        if(partial - stabilityMargin >= beta):
+            return partial - stabilityMargin, 1
+
+        #the total is summed in the same order as combinedHeuristics, so it is exactly the same value
+        empty = ~(own | opp) & FULL_MASK
+        stability_value = max(-100, min(100, relativeValue(stabilityCount(own, empty), stabilityCount(opp, empty), True)))
+        return self.coinParity_weight * coinParity_value + self.mobility_weight * mobility_value + self.stability_weight * stability_value + self.cornersCaptured_weight * corners_value, 0
+
+
+#the evaluator used by the search engines at the leaves
+#GameHeuristics has no state (the weights and the debug mode are class attributes), so one object is shared by every engine and every evaluation
+gameHeuristics = GameHeuristics()
+
 #     ###############################################################################################################
 #     # Testing the heuristic functions
 #     ###############################################################################################################
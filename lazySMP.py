@@ -0,0 +1,230 @@
+##############################################################################################################################
+# Project Name :  Othello                                                                                                    #
+# File Name    :  lazySMP.py                                                                                                 #
+# Description  :  This file contains the class that implements the Lazy SMP search. The class inherits from the Strategy    #
+#                 interface.                                                                                                 #
+# Date         :  10/18/2026                                                                                                 #
+#                                                                                                                            #
+##############################################################################################################################
+
+# Lazy SMP (Symmetric Multi Processing) is a simple way to search one position with many processes:
+# Every helper process searches the whole position, like the main search, but at different depths and with the root moves in a different order.
+# They do not talk to each other directly: they all read and write one transposition table in shared memory,
+# so the helpers fill the table with results and best moves that the main search then finds instead of searching them again.
+# Unlike splitting the root moves between the processes, the number of processes is not limited by the number of moves.
+
+# The main search is the alpha-beta search of AlphaBetaPruningStrategy running in this process, and the table only reuses
+# the scores of searches of the same depth, so at a fixed depth the best score is the same as the one of AlphaBetaPruningStrategy
+# (only a move that ties with the best one may be chosen instead, like when the move ordering changes).
+
+import atexit
+import math
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from alphaBetaPruning import AlphaBetaPruningStrategy, SearchTimeout, getParallelSettings, applyParallelSettings
+from board import ReversiBoard
+from strategy import Strategy
+from transpositionTable import SharedTranspositionTable
+
+
+class LazySMPStrategy(Strategy):
+
+    # The number of helper processes (0 means that only the main search runs), changed with setWorkers.
+    workersCount = 0
+
+    # The pool of helper processes, the transposition table that they share with the main search,
+    # and the flag that the main search sets to stop the helpers when it is done.
+    pool = None
+    sharedTable = None
+    stopSignal = None
+
+    # The statistics of the last search: the ones of the main search, plus helperNodes, the number of nodes visited by the helpers.
+    searchStats = {}
+
+
+    ##############################################################################################################################
+    # Method Name: getBestMove
+
+    # Purpose: This method is used to get the best move for the given player with a fixed depth search.
+
+    #function Arguments:
+    #boardToGetBestMove: The current state of the game.
+    #player: The player for whom we are calculating the score W or B.
+    #depth: The depth of the game tree.
+    ##############################################################################################################################
+
+    def getBestMove(boardToGetBestMove : ReversiBoard,player,depth):
+        bestMove, completedDepth = LazySMPStrategy.__search(boardToGetBestMove,player,depth,None,None,None)
+        return bestMove
+
+    ##############################################################################################################################
+    # Method Name: getBestMoveIterative
+
+    # Purpose: This method is used to get the best move for the given player within a time (and nodes) budget.
+    # It takes the same arguments as AlphaBetaPruningStrategy.getBestMoveIterative, and maxNodes only limits the main search.
+
+    # Returns the best move and the depth of the last completed search.
+    ##############################################################################################################################
+
+    def getBestMoveIterative(boardToGetBestMove : ReversiBoard,player,timeLimit,maxNodes = None,maxDepth = None):
+        return LazySMPStrategy.__search(boardToGetBestMove,player,maxDepth,timeLimit,maxNodes,maxDepth)
+
+    ##############################################################################################################################
+    # Method Name: search
+
+    # Purpose: This method starts the helpers, runs the main search and stops the helpers when it is done.
+
+    # Method Description:
+    # The helpers are given the position and search it until the stop flag is set.
+    # The main search uses the shared transposition table instead of the one of AlphaBetaPruningStrategy while it runs.
+    # With a time limit, the main search is an iterative deepening search, otherwise a fixed depth search.
+    ##############################################################################################################################
+
+    def __search(boardToGetBestMove : ReversiBoard,player,depth,timeLimit,maxNodes,maxDepth):
+
+        emptySquares = 64 - boardToGetBestMove.getScore("W") - boardToGetBestMove.getScore("B")
+        helpersDepth = depth if timeLimit is None else maxDepth
+        if(helpersDepth is None or helpersDepth > emptySquares):
+            helpersDepth = max(emptySquares,1)
+
+        # The main search runs in this process, with the shared table and without the root splitting of AlphaBetaPruningStrategy.
+        ownTable = AlphaBetaPruningStrategy.transpositionTable
+        parallelWorkers = AlphaBetaPruningStrategy.parallelWorkers
+        if(LazySMPStrategy.sharedTable is not None):
+            AlphaBetaPruningStrategy.transpositionTable = LazySMPStrategy.sharedTable
+        AlphaBetaPruningStrategy.parallelWorkers = 0
+
+        futures = []
+        try:
+            # The helpers only help if there is a position to search.
+            # They search with the settings of the main search (the weights of the heuristics, the lazy evaluation, ...),
+            # since the main search reads the scores that they store in the table. The settings are taken with the shared table in place.
+            if(LazySMPStrategy.workersCount > 0 and not boardToGetBestMove.isGameOver() and boardToGetBestMove.getValidMoves(player) != []):
+                board = boardToGetBestMove.getBoard()
+                settings = getParallelSettings()
+                for helperIndex in range(LazySMPStrategy.workersCount):
+                    futures.append(LazySMPStrategy.pool.submit(searchInHelper,board,boardToGetBestMove.whoseTurn,player,helperIndex,helpersDepth,AlphaBetaPruningStrategy.difficulty,settings))
+
+            if(timeLimit is None):
+                bestMove = AlphaBetaPruningStrategy.getBestMove(boardToGetBestMove,player,depth)
+                completedDepth = depth if bestMove is not None else 0
+            else:
+                bestMove, completedDepth = AlphaBetaPruningStrategy.getBestMoveIterative(boardToGetBestMove,player,timeLimit,maxNodes,maxDepth)
+        finally:
+            AlphaBetaPruningStrategy.transpositionTable = ownTable
+            AlphaBetaPruningStrategy.parallelWorkers = parallelWorkers
+
+            # Stop the helpers and wait for them, so that none of them is still running when the next search starts.
+            if(futures != []):
+                LazySMPStrategy.stopSignal.value = 1
+                helperNodes = sum(future.result() for future in futures)
+                LazySMPStrategy.stopSignal.value = 0
+            else:
+                helperNodes = 0
+
+        LazySMPStrategy.searchStats = dict(AlphaBetaPruningStrategy.searchStats)
+        LazySMPStrategy.searchStats["helperNodes"] = helperNodes
+
+        return bestMove, completedDepth
+
+    ##############################################################################################################################
+
+    # Method Name: setDifficulty
+    # The evaluation function depends on the difficulty, so the stored scores are not valid anymore when it changes.
+
+    def setDifficulty(difficulty):
+        if(difficulty != AlphaBetaPruningStrategy.difficulty and LazySMPStrategy.sharedTable is not None):
+            LazySMPStrategy.sharedTable.clear()
+        AlphaBetaPruningStrategy.setDifficulty(difficulty)
+
+    # Method Name: setWorkers
+    # Sets the number of helper processes and the size of the shared transposition table in megabytes.
+    # The helpers are started once and kept for the next searches, and so is the table (it is cleared).
+
+    def setWorkers(workersCount,maxMemoryMB = 32):
+        if(workersCount < 0):
+            raise ValueError("The number of workers cannot be negative")
+
+        LazySMPStrategy.shutdown()
+
+        if(workersCount > 0):
+            LazySMPStrategy.sharedTable = SharedTranspositionTable(maxMemoryMB)
+            LazySMPStrategy.stopSignal = multiprocessing.RawValue("b", 0)
+            LazySMPStrategy.pool = ProcessPoolExecutor(max_workers = workersCount, initializer = initHelper, initargs = (LazySMPStrategy.sharedTable.name,maxMemoryMB,LazySMPStrategy.stopSignal))
+
+        LazySMPStrategy.workersCount = workersCount
+
+    # Method Name: shutdown
+    # Stops the helper processes and frees the shared transposition table.
+
+    def shutdown():
+        if(LazySMPStrategy.pool is not None):
+            LazySMPStrategy.pool.shutdown()
+            LazySMPStrategy.pool = None
+        if(LazySMPStrategy.sharedTable is not None):
+            LazySMPStrategy.sharedTable.close()
+            LazySMPStrategy.sharedTable = None
+        LazySMPStrategy.stopSignal = None
+        LazySMPStrategy.workersCount = 0
+
+
+# The shared memory must be freed even if the game is closed without calling shutdown.
+atexit.register(LazySMPStrategy.shutdown)
+
+
+
+
+##############################################################################################################################
+# The following functions run in the helper processes.
+##############################################################################################################################
+
+# This function is called once when a helper process starts.
+# The helper attaches to the shared transposition table and uses it for all its searches, and it stops when the stop flag is set.
+def initHelper(tableName, maxMemoryMB, stopSignal):
+    AlphaBetaPruningStrategy.transpositionTable = SharedTranspositionTable(maxMemoryMB, tableName)
+    AlphaBetaPruningStrategy.stopSignal = stopSignal
+    AlphaBetaPruningStrategy.parallelWorkers = 0
+
+    # The table belongs to the main process, the helper must not free it when it exits.
+    atexit.unregister(LazySMPStrategy.shutdown)
+    LazySMPStrategy.sharedTable = None
+    LazySMPStrategy.pool = None
+
+
+# This function searches the position in a helper until the stop flag is set, and returns the number of nodes it visited.
+# The helpers are kept apart from the main search and from each other:
+# Every other helper starts one depth deeper (and goes one depth further), and each one rotates the root moves by its index.
+# settings are the settings of the main search (see getParallelSettings).
+def searchInHelper(board, whoseTurn, player, helperIndex, maxDepth, difficulty, settings):
+    applyParallelSettings(settings)
+
+    # The difficulty is set directly, the table is cleared by the main process.
+    AlphaBetaPruningStrategy.difficulty = difficulty
+
+    # The budget checks of the search (and so the stop flag) only run when there is a deadline.
+    AlphaBetaPruningStrategy.deadline = math.inf
+
+    reversiBoard = ReversiBoard()
+    reversiBoard.board = board
+    reversiBoard.whoseTurn = whoseTurn
+
+    rootMoves = list(reversiBoard.getValidMoves(player))
+    shift = helperIndex % len(rootMoves)
+    rootMoves = rootMoves[shift:] + rootMoves[:shift]
+
+    nodes = 0
+    try:
+        for depth in range(1 + helperIndex % 2, maxDepth + 1 + helperIndex % 2):
+            if(AlphaBetaPruningStrategy.stopSignal.value):
+                break
+            try:
+                AlphaBetaPruningStrategy.getBestMove(reversiBoard,player,depth,rootMoves)
+            finally:
+                nodes += AlphaBetaPruningStrategy.searchStats["nodes"]
+    except SearchTimeout:
+        pass
+    finally:
+        AlphaBetaPruningStrategy.deadline = None
+
+    return nodes
@@ -0,0 +1,327 @@
+##############################################################################################################################
+# Project Name :  Othello                                                                                                    #
+# File Name    :  monteCarloTreeSearch.py                                                                                    #
+# Description  :  This file contains the class that implements the Monte Carlo Tree Search (UCT). The class inherits from   #
+#                 the Strategy interface.                                                                                    #
+# Date         :  10/18/2026                                                                                                 #
+#                                                                                                                            #
+##############################################################################################################################
+
+# Monte Carlo Tree Search does not need a heuristic: it plays many games to the end (playouts) and keeps the moves that win the most.
+# Every iteration has 4 steps:
+# - Selection: from the root, go down the tree by choosing the child with the best UCT value,
+#   the win rate of the child plus an exploration term that grows for the children that were rarely visited.
+# - Expansion: add one of the moves that are not in the tree yet as a new child.
+# - Playout: play the game to the end from the new child, with random (or lightly guided) moves.
+# - Backpropagation: add the result to every node on the path, for the player who made the move into the node.
+# The search can be stopped after any iteration, so it gives a usable move for any time limit. The move played is the most visited child of the root.
+
+# The tree is kept in a pool of parallel lists (one list per field, indexed by the node number) that is allocated once and reused by every search,
+# so no object is created per node. The children of a node are a linked list (first child, next sibling).
+# The playouts work directly on the bitboards (the player to move and the opponent), they never touch a ReversiBoard.
+
+from board import ReversiBoard, generateMoves, computeFlips, popCount
+from strategy import Strategy
+import math
+import random
+import time
+
+
+# The move number of a pass, and its bit in the untried moves of a node (it is outside the board, so it cannot clash with a square).
+PASS = 64
+PASS_BIT = 1 << PASS
+
+# The corners, and the X squares (the squares diagonal to the corners, which usually give the corner away).
+CORNERS = 0x8100000000000081
+X_SQUARES = 0x0042000000004200
+
+# The node number of the root, and the value that means "no node".
+ROOT = 0
+NO_NODE = -1
+
+
+class MonteCarloTreeSearchStrategy(Strategy):
+
+    # The exploration constant of UCT: the higher it is, the more the rarely visited moves are tried.
+    explorationConstant = 1.4
+
+    # The budget of a search: the number of iterations and the time in milliseconds (None means no limit).
+    # The search stops at the first limit that is reached, so at least one of them must be set.
+    iterationsLimit = 5000
+    timeLimitMs = None
+
+    # The playouts: "random" plays a random move, "heuristic" plays a corner when it can and avoids the X squares.
+    playoutPolicy = "heuristic"
+
+    # The maximum number of nodes of the tree. When the pool is full, the search goes on without adding nodes.
+    maxNodes = 200000
+
+    # The node pool: the parent, the first child and the next sibling of each node, the move that led to it,
+    # the discs of the player to move and of the opponent, the moves that are not expanded yet (a bitboard),
+    # the number of visits and the sum of the results for the player who made the move into the node (1 for a win, 0.5 for a draw).
+    nodeParent = []
+    nodeFirstChild = []
+    nodeNextSibling = []
+    nodeMove = []
+    nodeOwn = []
+    nodeOpp = []
+    nodeUntried = []
+    nodeVisits = []
+    nodeWins = []
+    nodesCount = 0
+
+    randomGenerator = random.Random()
+
+    # Statistics of the last search: the number of iterations, the number of nodes of the tree and the playouts per second.
+    searchStats = {"iterations": 0, "nodes": 0, "playoutsPerSecond": 0}
+
+
+    ##############################################################################################################################
+    # Method Name: getBestMove
+
+    # Purpose: This method is used to get the best move for the given player with the budget of the strategy (see setBudget).
+    # depth is not used, the playouts always go to the end of the game.
+    ##############################################################################################################################
+
+    def getBestMove(boardToGetBestMove : ReversiBoard,player,depth = None):
+        return MonteCarloTreeSearchStrategy.search(boardToGetBestMove,player,MonteCarloTreeSearchStrategy.iterationsLimit,MonteCarloTreeSearchStrategy.timeLimitMs)
+
+    ##############################################################################################################################
+    # Method Name: search
+
+    # Purpose: This method is used to get the best move for the given player with the given budget.
+
+    #function Arguments:
+    #boardToSearch: The current state of the game.
+    #player: The player for whom we are searching W or B.
+    #iterations: The maximum number of iterations (None means no limit).
+    #milliseconds: The maximum time of the search in milliseconds (None means no limit).
+
+    # Returns the most visited move of the root, or None if the player has no move.
+    ##############################################################################################################################
+
+    def search(boardToSearch : ReversiBoard,player,iterations = None,milliseconds = None):
+
+        if(iterations is None and milliseconds is None):
+            raise ValueError("The search needs a number of iterations or a time limit")
+
+        MonteCarloTreeSearchStrategy.searchStats = {"iterations": 0, "nodes": 0, "playoutsPerSecond": 0}
+
+        validMoves = boardToSearch.getValidMoves(player)
+        if(validMoves == []):
+            return None
+        if(len(validMoves) == 1):
+            return validMoves[0]
+
+        startTime = time.time()
+        deadline = None if milliseconds is None else startTime + milliseconds / 1000
+
+        own = boardToSearch.blackBits if player == "B" else boardToSearch.whiteBits
+        opp = boardToSearch.whiteBits if player == "B" else boardToSearch.blackBits
+        MonteCarloTreeSearchStrategy.__resetPool()
+        MonteCarloTreeSearchStrategy.__addNode(NO_NODE,PASS,own,opp)
+
+        # At least one iteration is run, so the root has a child to choose even when the budget is already spent.
+        iterationsCount = 0
+        while(iterationsCount == 0 or ((iterations is None or iterationsCount < iterations) and (deadline is None or time.time() < deadline))):
+            MonteCarloTreeSearchStrategy.__runIteration()
+            iterationsCount += 1
+
+        elapsedTime = time.time() - startTime
+        MonteCarloTreeSearchStrategy.searchStats = {
+            "iterations": iterationsCount,
+            "nodes": MonteCarloTreeSearchStrategy.nodesCount,
+            "playoutsPerSecond": iterationsCount / elapsedTime if elapsedTime > 0 else 0,
+        }
+
+        # The most visited child is the most reliable one (its win rate is based on the most playouts).
+        nodeVisits = MonteCarloTreeSearchStrategy.nodeVisits
+        bestChild = NO_NODE
+        child = MonteCarloTreeSearchStrategy.nodeFirstChild[ROOT]
+        while child != NO_NODE:
+            if(bestChild == NO_NODE or nodeVisits[child] > nodeVisits[bestChild]):
+                bestChild = child
+            child = MonteCarloTreeSearchStrategy.nodeNextSibling[child]
+
+        # The root has no child when the pool could not hold one (see setMaxNodes).
+        if(bestChild == NO_NODE):
+            return validMoves[0]
+
+        square = MonteCarloTreeSearchStrategy.nodeMove[bestChild]
+        return [square >> 3, square & 7]
+
+    ##############################################################################################################################
+    # Method Name: runIteration (private)
+
+    # Purpose: This method runs one iteration of the search: selection, expansion, playout and backpropagation.
+    ##############################################################################################################################
+
+    def __runIteration():
+
+        nodeFirstChild = MonteCarloTreeSearchStrategy.nodeFirstChild
+        nodeNextSibling = MonteCarloTreeSearchStrategy.nodeNextSibling
+        nodeUntried = MonteCarloTreeSearchStrategy.nodeUntried
+        nodeVisits = MonteCarloTreeSearchStrategy.nodeVisits
+        nodeWins = MonteCarloTreeSearchStrategy.nodeWins
+        explorationConstant = MonteCarloTreeSearchStrategy.explorationConstant
+
+        # Selection: go down while every move of the node is expanded.
+        node = ROOT
+        while nodeUntried[node] == 0 and nodeFirstChild[node] != NO_NODE:
+            logVisits = math.log(nodeVisits[node])
+            bestValue = -math.inf
+            child = nodeFirstChild[node]
+            while child != NO_NODE:
+                childVisits = nodeVisits[child]
+                value = nodeWins[child] / childVisits + explorationConstant * math.sqrt(logVisits / childVisits)
+                if(value > bestValue):
+                    bestValue = value
+                    node = child
+                child = nodeNextSibling[child]
+
+        # Expansion: add one untried move (a random one), unless the pool is full.
+        if(nodeUntried[node] != 0 and MonteCarloTreeSearchStrategy.nodesCount < MonteCarloTreeSearchStrategy.maxNodes):
+            untried = nodeUntried[node]
+            moveBit = MonteCarloTreeSearchStrategy.__chooseBit(untried)
+            nodeUntried[node] = untried ^ moveBit
+
+            own = MonteCarloTreeSearchStrategy.nodeOwn[node]
+            opp = MonteCarloTreeSearchStrategy.nodeOpp[node]
+            square = moveBit.bit_length() - 1
+            if(square == PASS):
+                node = MonteCarloTreeSearchStrategy.__addNode(node,PASS,opp,own)
+            else:
+                flips = computeFlips(own,opp,square)
+                node = MonteCarloTreeSearchStrategy.__addNode(node,square,opp & ~flips,own | flips | moveBit)
+
+        # Playout: the result is for the player to move at the node, so the player who made the move into the node gets the opposite.
+        result = 1 - MonteCarloTreeSearchStrategy.__playout(MonteCarloTreeSearchStrategy.nodeOwn[node],MonteCarloTreeSearchStrategy.nodeOpp[node])
+
+        # Backpropagation: the players alternate on the path (a pass is a node too), so the result is flipped at every step.
+        nodeParent = MonteCarloTreeSearchStrategy.nodeParent
+        while node != NO_NODE:
+            nodeVisits[node] += 1
+            nodeWins[node] += result
+            result = 1 - result
+            node = nodeParent[node]
+
+    ##############################################################################################################################
+    # Method Name: playout (private)
+
+    # Purpose: This method plays the game to the end from the given position, with the moves of the playout policy.
+    # Returns 1 if the player to move wins, 0.5 for a draw and 0 for a loss.
+    ##############################################################################################################################
+
+    def __playout(own,opp):
+
+        isHeuristic = MonteCarloTreeSearchStrategy.playoutPolicy == "heuristic"
+        chooseBit = MonteCarloTreeSearchStrategy.__chooseBit
+
+        # isSwapped is True when "own" holds the discs of the opponent of the player to move at the start.
+        isSwapped = False
+        passed = False
+        while True:
+            moves = generateMoves(own,opp)
+            if(moves == 0):
+                if(passed):
+                    break
+                own, opp = opp, own
+                isSwapped = not isSwapped
+                passed = True
+                continue
+            passed = False
+
+            if(isHeuristic):
+                if(moves & CORNERS):
+                    moves &= CORNERS
+                elif(moves & ~X_SQUARES):
+                    moves &= ~X_SQUARES
+
+            moveBit = chooseBit(moves)
+            flips = computeFlips(own,opp,moveBit.bit_length() - 1)
+            own, opp = opp & ~flips, own | flips | moveBit
+            isSwapped = not isSwapped
+
+        discsDifference = popCount(own) - popCount(opp)
+        if(isSwapped):
+            discsDifference = -discsDifference
+        return 1 if discsDifference > 0 else (0 if discsDifference < 0 else 0.5)
+
+    ##############################################################################################################################
+
+    # This private method returns one of the set bits of the given bitboard, chosen at random.
+    def __chooseBit(bits):
+        for index in range(MonteCarloTreeSearchStrategy.randomGenerator.randrange(popCount(bits))):
+            bits &= bits - 1
+        return bits & -bits
+
+    # This private method empties the node pool, and allocates it the first time (or when maxNodes changed).
+    def __resetPool():
+        if(len(MonteCarloTreeSearchStrategy.nodeParent) != MonteCarloTreeSearchStrategy.maxNodes):
+            maxNodes = MonteCarloTreeSearchStrategy.maxNodes
+            MonteCarloTreeSearchStrategy.nodeParent = [NO_NODE] * maxNodes
+            MonteCarloTreeSearchStrategy.nodeFirstChild = [NO_NODE] * maxNodes
+            MonteCarloTreeSearchStrategy.nodeNextSibling = [NO_NODE] * maxNodes
+            MonteCarloTreeSearchStrategy.nodeMove = [PASS] * maxNodes
+            MonteCarloTreeSearchStrategy.nodeOwn = [0] * maxNodes
+            MonteCarloTreeSearchStrategy.nodeOpp = [0] * maxNodes
+            MonteCarloTreeSearchStrategy.nodeUntried = [0] * maxNodes
+            MonteCarloTreeSearchStrategy.nodeVisits = [0] * maxNodes
+            MonteCarloTreeSearchStrategy.nodeWins = [0] * maxNodes
+        MonteCarloTreeSearchStrategy.nodesCount = 0
+
+    # This private method adds a node for the position (own to move) reached from the parent with the given move, and returns its number.
+    # Its untried moves are the moves of the player, or a pass if only the opponent can move, or nothing if the game is over.
+    def __addNode(parent,move,own,opp):
+        node = MonteCarloTreeSearchStrategy.nodesCount
+        MonteCarloTreeSearchStrategy.nodesCount += 1
+
+        untried = generateMoves(own,opp)
+        if(untried == 0 and generateMoves(opp,own) != 0):
+            untried = PASS_BIT
+
+        MonteCarloTreeSearchStrategy.nodeParent[node] = parent
+        MonteCarloTreeSearchStrategy.nodeFirstChild[node] = NO_NODE
+        MonteCarloTreeSearchStrategy.nodeMove[node] = move
+        MonteCarloTreeSearchStrategy.nodeOwn[node] = own
+        MonteCarloTreeSearchStrategy.nodeOpp[node] = opp
+        MonteCarloTreeSearchStrategy.nodeUntried[node] = untried
+        MonteCarloTreeSearchStrategy.nodeVisits[node] = 0
+        MonteCarloTreeSearchStrategy.nodeWins[node] = 0
+
+        # The new node becomes the first child of its parent.
+        if(parent != NO_NODE):
+            MonteCarloTreeSearchStrategy.nodeNextSibling[node] = MonteCarloTreeSearchStrategy.nodeFirstChild[parent]
+            MonteCarloTreeSearchStrategy.nodeFirstChild[parent] = node
+        else:
+            MonteCarloTreeSearchStrategy.nodeNextSibling[node] = NO_NODE
+        return node
+
+    ##############################################################################################################################
+
+    # Method Name: setBudget
+    # Sets the budget of getBestMove: the number of iterations and the time in milliseconds (None means no limit, but one must be set).
+
+    def setBudget(iterations = None,milliseconds = None):
+        if(iterations is None and milliseconds is None):
+            raise ValueError("The search needs a number of iterations or a time limit")
+        if((iterations is not None and iterations <= 0) or (milliseconds is not None and milliseconds <= 0)):
+            raise ValueError("The budget must be positive")
+        MonteCarloTreeSearchStrategy.iterationsLimit = iterations
+        MonteCarloTreeSearchStrategy.timeLimitMs = milliseconds
+
+    # Method Name: setPlayoutPolicy
+    # Sets the moves of the playouts: "random" or "heuristic".
+
+    def setPlayoutPolicy(playoutPolicy):
+        if(playoutPolicy not in ["random", "heuristic"]):
+            raise ValueError("Invalid playout policy")
+        MonteCarloTreeSearchStrategy.playoutPolicy = playoutPolicy
+
+    # Method Name: setMaxNodes
+    # Sets the maximum number of nodes of the tree (the pool is allocated again by the next search).
+
+    def setMaxNodes(maxNodes):
+        if(maxNodes <= 0):
+            raise ValueError("The number of nodes must be positive")
+        MonteCarloTreeSearchStrategy.maxNodes = maxNodes
@@ -0,0 +1,72 @@
+##############################################################################################################################
+# Project Name :  Othello                                                                                                    #
+# File Name    :  moveOrdering.py                                                                                            #
+# Description  :  This file contains the move ordering used by the search strategies to search the best moves first.        #
+# Date         :  10/18/2026                                                                                                 #
+#                                                                                                                            #
+##############################################################################################################################
+
+# Alpha-beta pruning prunes the most when the best move of every node is searched first,
+# so the moves are sorted before being searched, using (in order of priority):
+# 1. The hash move: the best move stored in the transposition table for the position.
+# 2. The killer moves: the last 2 moves that caused a cutoff in another node of the same ply.
+# 3. The history table: how many (and how deep) cutoffs each move caused so far, for each color.
+# 4. The static weight of the square (corners first, the squares next to the corners last).
+
+from heuristics import board_static_weights
+
+
+class MoveOrdering:
+
+    # The constructor:
+    # The killer moves are kept per ply and the history table per color, so the ordering learns from the previous searches of the game.
+    def __init__(self):
+        self.clear()
+
+    # This method forgets all the killer moves and the history table.
+    def clear(self):
+        # The ply of a node is the number of empty squares, which goes down by 1 with every move.
+        # (Unlike the depth, it does not depend on where the search started, so the killer moves stay valid between the moves of a game)
+        self.killers = [[None, None] for ply in range(65)]
+        self.history = {"B": [[0] * 8 for row in range(8)], "W": [[0] * 8 for row in range(8)]}
+
+    # This method is called at the start of each search.
+    # It halves the history table, so the cutoffs of the previous searches count less than the new ones.
+    def newSearch(self):
+        for color in ["B", "W"]:
+            for row in self.history[color]:
+                for col in range(8):
+                    row[col] >>= 1
+
+    # This method returns the given moves sorted from the most to the least promising one.
+    # moves: The valid moves of the player.
+    # player: The player that makes the moves, W or B.
+    # ply: The number of empty squares on the board.
+    # hashMove: The best move of the transposition table entry of the position, None if there is no entry.
+    def orderMoves(self, moves, player : str, ply : int, hashMove = None):
+        killers = self.killers[ply]
+        history = self.history[player]
+
+        def moveKey(move):
+            if(move == hashMove):
+                return (3, 0, 0)
+            if(move == killers[0]):
+                return (2, 1, 0)
+            if(move == killers[1]):
+                return (2, 0, 0)
+            return (1, history[move[0]][move[1]], board_static_weights[move[0]][move[1]])
+
+        # sorted is stable, so the moves that are equally promising stay in the order of getValidMoves
+        return sorted(moves, key = moveKey, reverse = True)
+
+    # This method is called when a move causes a cutoff, to search it earlier next time.
+    # move: The move that caused the cutoff.
+    # player: The player that made the move, W or B.
+    # ply: The number of empty squares on the board.
+    # depth: The remaining depth of the node (the deeper the node, the more the cutoff saved).
+    def recordCutoff(self, move, player : str, ply : int, depth : int):
+        killers = self.killers[ply]
+        if(move != killers[0]):
+            killers[1] = killers[0]
+            killers[0] = move
+        self.history[player][move[0]][move[1]] += depth * depth
@@ -0,0 +1,130 @@
+##############################################################################################################################
+# Project Name :  Othello                                                                                                    #
+# File Name    :  patternEvaluator.py                                                                                        #
+# Description  :  This file contains the pattern evaluator, which scores a position with tables learned for the patterns   #
+#                 of the board (edges, corners and diagonals).                                                              #
+# Date         :  10/18/2026                                                                                                 #
+#                                                                                                                            #
+##############################################################################################################################
+
+# Instead of hand-coded heuristics, the pattern evaluator looks every pattern instance of the board up in a table:
+# The index of an instance is the base-3 number of its squares (see computePatternIndices in board.py), and the table of its pattern
+# gives the value of that configuration. The score of the position is the sum of the values of all the instances (34 lookups),
+# which is the expected final disc difference for the player to move.
+
+# The board keeps the indices up to date in makeMove and undoMove once enablePatternIndices was called,
+# so a leaf costs the lookups only. The tables are learned by trainPatterns.py, one set per game phase,
+# and stored in a compact binary file:
+# The header (magic, version, number of phases, scale) followed by the zlib-compressed values of every table as 16-bit integers
+# (the value times the scale), phase by phase in the order of PATTERN_TYPES.
+# The tables are from the point of view of black, the tables of white are the same tables with the colors of the indices swapped.
+
+from board import ReversiBoard, PATTERN_TYPES, PATTERN_INSTANCES
+from array import array
+import os
+import struct
+import zlib
+
+
+# The file of the tables written by trainPatterns.py (next to this file).
+PATTERN_TABLES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "patternTables.bin")
+
+# The header of the file: the magic bytes, the version, the number of phases and the scale of the values.
+FILE_MAGIC = b"OTPT"
+FILE_VERSION = 1
+HEADER_FORMAT = "<4sHHH"
+
+# The number of game phases (each one has its own tables), and the number of configurations of each pattern.
+PHASES_COUNT = 4
+PATTERN_SIZES = [3 ** len(squares) for name, squares in PATTERN_TYPES]
+
+# The pattern type of every instance.
+INSTANCE_TYPES = [patternType for patternType, squares in PATTERN_INSTANCES]
+
+
+# This function returns the game phase of a position from its number of empty squares (0 at the start of the game).
+def getPatternPhase(emptySquares : int):
+    return min(PHASES_COUNT - 1, (60 - emptySquares) * PHASES_COUNT // 60)
+
+
+# This function returns, for every index of a pattern of the given length, the index of the same configuration with the colors swapped.
+def buildSwappedIndices(length : int):
+    swappedIndices = []
+    for index in range(3 ** length):
+        swappedIndex, power = 0, 1
+        while index:
+            digit = index % 3
+            swappedIndex += (3 - digit if digit else 0) * power
+            index //= 3
+            power *= 3
+        swappedIndices.append(swappedIndex)
+    return swappedIndices
+
+
+# This function writes the tables (tables[phase][pattern type] is a list of values in discs) to a file in the format of the evaluator.
+def savePatternTables(tables, fileName : str = PATTERN_TABLES_FILE, scale : int = 256):
+    values = array("h")
+    for phaseTables in tables:
+        for table in phaseTables:
+            values.extend(max(-32768, min(32767, round(value * scale))) for value in table)
+    with open(fileName, "wb") as tablesFile:
+        tablesFile.write(struct.pack(HEADER_FORMAT, FILE_MAGIC, FILE_VERSION, len(tables), scale))
+        tablesFile.write(zlib.compress(values.tobytes(), 9))
+
+
+class PatternEvaluator():
+
+    # The constructor loads the tables from the given file (see loadTables).
+    def __init__(self, fileName : str = PATTERN_TABLES_FILE):
+        self.loadTables(fileName)
+
+
+    #this method loads the tables from a file written by savePatternTables
+    #it raises a ValueError if the file is not a tables file of this version, or if its size does not match the patterns
+    def loadTables(self, fileName : str = PATTERN_TABLES_FILE):
+        with open(fileName, "rb") as tablesFile:
+            data = tablesFile.read()
+
+        headerSize = struct.calcsize(HEADER_FORMAT)
+        magic, version, phasesCount, scale = struct.unpack(HEADER_FORMAT, data[:headerSize])
+        if(magic != FILE_MAGIC or version != FILE_VERSION):
+            raise ValueError("The file is not a pattern tables file of version " + str(FILE_VERSION))
+        if(phasesCount != PHASES_COUNT):
+            raise ValueError("The file has " + str(phasesCount) + " phases instead of " + str(PHASES_COUNT))
+
+        values = array("h")
+        values.frombytes(zlib.decompress(data[headerSize:]))
+        if(len(values) != PHASES_COUNT * sum(PATTERN_SIZES)):
+            raise ValueError("The size of the tables does not match the patterns")
+
+        #the tables of both colors, as one table per instance (the instances of a pattern share the same list)
+        swappedIndices = {}
+        self.blackTables = []
+        self.whiteTables = []
+        offset = 0
+        for phase in range(PHASES_COUNT):
+            blackPhaseTables = []
+            whitePhaseTables = []
+            for (name, squares), size in zip(PATTERN_TYPES, PATTERN_SIZES):
+                if(len(squares) not in swappedIndices):
+                    swappedIndices[len(squares)] = buildSwappedIndices(len(squares))
+                table = [value / scale for value in values[offset:offset + size]]
+                blackPhaseTables.append(table)
+                whitePhaseTables.append([table[swappedIndex] for swappedIndex in swappedIndices[len(squares)]])
+                offset += size
+            self.blackTables.append([blackPhaseTables[patternType] for patternType in INSTANCE_TYPES])
+            self.whiteTables.append([whitePhaseTables[patternType] for patternType in INSTANCE_TYPES])
+
+
+    #returns the score of the board for the given player: the sum of the values of the pattern instances,
+    #or the exact disc difference if the game is over
+    #the board starts keeping its pattern indices the first time it is evaluated, so the next positions of a search only cost the lookups
+    def evaluate(self, board : ReversiBoard, player):
+        opponent = "W" if player == "B" else "B"
+        if(board.isGameOver()):
+            return board.getScore(player) - board.getScore(opponent)
+
+        indices = board.getPatternIndices()
+        phase = getPatternPhase(64 - board.getScore(player) - board.getScore(opponent))
+        tables = self.blackTables[phase] if player == "B" else self.whiteTables[phase]
+        return sum([table[index] for table, index in zip(tables, indices)])
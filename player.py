@@ -10,8 +10,8 @@
 
 # Importing the necessary modules
 from board import ReversiBoard
-from MinMax import MinMaxStrategy
-from alphaBetaPruning import AlphaBetaPruningStrategy
+from principalVariationSearch import PrincipalVariationSearchStrategy
+from endgameSolver import EndgameSolver
 
 ############################################################################################################################################################################
 #                                                    Player Class                                                                                                          #
@@ -133,25 +133,32 @@ class AIPlayer(Player):
         #FIXME: Call the AI strategy object here
         validMoves = self.board.getValidMoves(self.color)
 
-        difficultyToDepthMap = {"easy": 1, "medium": 3, "hard": 5}
-
-        import time
-
-        minimum_execution_time = 1 # The minimum execution time in seconds
-
-        # Get the current time
-        start_time = time.time()
-    
-        bestMove = AlphaBetaPruningStrategy.getBestMove(self.board, self.color, difficultyToDepthMap[self.difficulty])
-        print("difficulty = ", self.difficulty, "depth = ", difficultyToDepthMap[self.difficulty], "bestMove = ", bestMove, "validMoves = ", validMoves, "color = ", self.color, "board = ", self.board, sep = "\n")
-        end_time = time.time()
-
-        # Calculate the execution time
-        execution_time = end_time - start_time
-        
-        # If the execution time is less than the minimum execution time, sleep for the difference
-        if(execution_time < minimum_execution_time):
-            time.sleep(minimum_execution_time - execution_time)
+        # Each difficulty is a search budget for every move: the time in seconds and the maximum number of nodes (None means no limit)
+        # The search goes as deep as it can within the budget (iterative deepening)
+        difficultyToBudgetMap = {"easy": (0.5, 300), "medium": (1, None), "hard": (3, None)}
+
+        difficulty = self.difficulty.lower()
+        timeLimit, maxNodes = difficultyToBudgetMap[difficulty]
+
+        # The easy difficulty uses a simpler evaluation function
+        PrincipalVariationSearchStrategy.setDifficulty(difficulty)
+
+        # Near the end of the game, the medium and hard difficulties solve the game exactly instead of searching with the heuristics
+        # A few moves earlier, they only solve whether the game is won, drawn or lost, and play the move that wins or draws
+        # (if the game is lost anyway, the heuristics give the best chances that the opponent makes a mistake)
+        bestMove = None
+        if(difficulty != "easy" and EndgameSolver.canSolve(self.board)):
+            bestMove, score = EndgameSolver.solve(self.board, self.color)
+            depth = 64 - self.board.getScore("W") - self.board.getScore("B")
+        elif(difficulty != "easy" and EndgameSolver.canSolveWLD(self.board)):
+            move, result = EndgameSolver.solveWLD(self.board, self.color)
+            if(result >= 0):
+                bestMove = move
+                depth = 64 - self.board.getScore("W") - self.board.getScore("B")
+
+        if(bestMove is None):
+            bestMove, depth = PrincipalVariationSearchStrategy.getBestMoveIterative(self.board, self.color, timeLimit, maxNodes)
+        print("difficulty = ", self.difficulty, "depth = ", depth, "bestMove = ", bestMove, "validMoves = ", validMoves, "color = ", self.color, "board = ", self.board, sep = "\n")
         
         self.board.makeMove(self.color, bestMove[0], bestMove[1])
 
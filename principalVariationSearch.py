@@ -0,0 +1,600 @@
+##############################################################################################################################
+# Project Name :  Othello                                                                                                    #
+# File Name    :  principalVariationSearch.py                                                                                #
+# Description  :  This file contains the class that implements the principal variation search (negamax form). The class    #
+#                 inherits from the Strategy interface.                                                                      #
+# Date         :  10/18/2026                                                                                                 #
+#                                                                                                                            #
+##############################################################################################################################
+
+# Negamax:
+# The score of a position is always given for the player to move, and the game is zero-sum (the heuristics of one player are minus the
+# heuristics of the other), so the score of a move is minus the score of the next position for the opponent.
+# There is only one branch for both players, and no global maximizing player.
+
+# Principal variation search (NegaScout):
+# With a good move ordering, the first move of a node is usually the best one. It is searched with the full window (alpha, beta),
+# and every other move is only tested with a null window (alpha, alpha + NULL_WINDOW) to prove that it is not better than alpha.
+# A null window search prunes much more than a full one. Only if the test fails high (the move is better than alpha)
+# the move is searched again to get its exact score, with the window from the bound that the test returned up to beta.
+
+# The principal variation (the line that both players are expected to play) is kept in a triangular table:
+# Row ply holds the best line from the node at that ply, made of its best move followed by the row of the child (ply + 1).
+
+# Multi-ProbCut (selective search):
+# The score of a deep search is well predicted by the score of a shallow search of the same position: deep = slope * shallow + offset,
+# with an error of standard deviation sigma. So before searching a null window node deeply, a shallow search checks if the deep score
+# is very likely (threshold * sigma) to be above beta or below alpha, and if it is the node is cut without the deep search.
+# The parameters are fitted for every game phase and depth by calibrateProbCut.py, and stored in probCutParameters.json.
+
+from board import ReversiBoard
+from strategy import Strategy
+from transpositionTable import TranspositionTable, EXACT, LOWER_BOUND, UPPER_BOUND
+from moveOrdering import MoveOrdering
+from alphaBetaPruning import SearchTimeout, ASPIRATION_MAX_WINDOW
+from patternEvaluator import PatternEvaluator, PATTERN_TABLES_FILE
+import json
+import math
+import os
+import time
+from heuristics import gameHeuristics
+
+
+# The width of the null window. The scores are floats, so the window is not 1 like with integer scores,
+# a score above alpha + NULL_WINDOW is only a bound, so any score above alpha is searched again.
+NULL_WINDOW = 1e-6
+
+
+# This function tells whether (alpha, beta) is a null window.
+# The windows are built with float arithmetic ((-alpha - NULL_WINDOW, -alpha), (bound - NULL_WINDOW, bound), ...), so their width
+# is only NULL_WINDOW up to rounding, and it is compared with a tolerance (every other window is far wider).
+def isNullWindow(alpha, beta):
+    return beta - alpha <= 2 * NULL_WINDOW
+
+# The maximum number of moves in a game (the passes do not add a ply).
+MAX_PLY = 64
+
+# The file of the Multi-ProbCut parameters, written by calibrateProbCut.py.
+PROBCUT_PARAMETERS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "probCutParameters.json")
+
+
+# The deepest depth that Multi-ProbCut is used at.
+MAX_PROBCUT_DEPTH = 20
+
+
+# This function returns the shallow depth that is used to predict the score of a deep depth in Multi-ProbCut:
+# about half of it, with the same parity (the scores of the odd and even depths are far apart).
+def getProbCutShallowDepth(depth : int):
+    return depth - 2 * ((depth + 1) // 4)
+
+
+# This function returns the game phase of a position from its number of empty squares, from 0 (opening) to 3 (endgame).
+# The Multi-ProbCut parameters are fitted separately for every phase.
+def getGamePhase(emptySquares : int):
+    return min(3, max(0, 60 - emptySquares) // 15)
+
+
+class PrincipalVariationSearchStrategy(Strategy):
+
+    difficulty = None
+
+    # The transposition table and the move ordering of this engine (see transpositionTable.py and moveOrdering.py).
+    transpositionTable = TranspositionTable()
+    useTranspositionTable = True
+    moveOrdering = MoveOrdering()
+
+    # Statistics of the last search, with the same names as the ones of AlphaBetaPruningStrategy, and:
+    # reSearches: The number of moves that failed high on the null window and were searched again.
+    # probCuts: The number of nodes that were cut by Multi-ProbCut.
+    # evaluations, lazySkips, lazyMobilitySkips: The evaluations of the leaves (with the heuristics or the pattern tables) and the lazy ones that skipped heuristics, like in AlphaBetaPruningStrategy.
+    searchStats = {"nodes": 0, "ttCutoffs": 0, "cutoffs": 0, "firstMoveCutoffs": 0, "reSearches": 0, "probCuts": 0, "evaluations": 0, "lazySkips": 0, "lazyMobilitySkips": 0}
+
+    # The half width of the aspiration window of each difficulty, like in AlphaBetaPruningStrategy. Changed with setAspirationWindow.
+    aspirationWindows = {"easy": 2, "medium": 8, "hard": 8}
+
+    # Multi-ProbCut: the parameters as {phase: {depth: (shallow depth, slope, offset, sigma)}} (see loadProbCutParameters),
+    # the difficulties that use it (it is made for the heuristics, not for the discs of easy),
+    # and the number of sigmas that the predicted score must be outside of the window by.
+    probCutParameters = {}
+    probCutDifficulties = {"easy": False, "medium": False, "hard": True}
+    probCutThreshold = 1.5
+
+    # When True, the leaves are evaluated lazily with the window of the search, like in AlphaBetaPruningStrategy (see GameHeuristics.evaluateLazy).
+    # It is off by default: the bounds of the skipped leaves are looser than their scores, which costs this engine
+    # about as many extra nodes (in the re-searches of the null window) as the skipped heuristics save.
+    lazyEvaluation = False
+
+    # The evaluator of the medium and hard difficulties: "heuristics" (GameHeuristics) or "patterns" (the tables of PatternEvaluator,
+    # loaded by setEvaluator). The Multi-ProbCut parameters were fitted with the heuristics, so it is only used with them.
+    evaluator = "heuristics"
+    patternEvaluator = None
+
+    # The budget of the running search (see getBestMoveIterative).
+    deadline = None
+    nodesLimit = None
+
+    # The scores of the root moves of the last getBestMove call, as a list of (move, score) in the order they were searched.
+    rootScores = []
+
+    # The triangular principal variation table: pvTable[ply][ply:pvLength[ply]] is the best line from the node at that ply.
+    pvTable = [[None] * (MAX_PLY + 1) for ply in range(MAX_PLY + 1)]
+    pvLength = [0] * (MAX_PLY + 1)
+
+
+    ##############################################################################################################################
+
+    # Method Name: evaluateBoard
+
+    # Purpose: This method is used to evaluate the board for the given player (the player to move in the search).
+    # The easy difficulty uses the difference between the number of discs of the players, the others use the combined heuristics
+    # (computed by the fused evaluator of GameHeuristics, which gives the same value in one pass).
+    # With a window (alpha, beta), the value is only exact inside it: the evaluation is lazy and may return a bound outside of it.
+    # With the pattern evaluator, the score is the expected final disc difference from the pattern tables.
+
+    ##############################################################################################################################
+
+    def evaluateBoard(board : ReversiBoard,player,alpha = -math.inf,beta = math.inf):
+        if(PrincipalVariationSearchStrategy.difficulty == "easy"):
+            return board.getScore(player) - board.getScore(board.getOpponent(player))
+
+        searchStats = PrincipalVariationSearchStrategy.searchStats
+        searchStats["evaluations"] += 1
+
+        # The search board keeps its pattern indices from its first evaluation on, so the next leaves only cost the table lookups.
+        if(PrincipalVariationSearchStrategy.evaluator == "patterns"):
+            return PrincipalVariationSearchStrategy.patternEvaluator.evaluate(board,player)
+        if(not PrincipalVariationSearchStrategy.lazyEvaluation):
+            return gameHeuristics.evaluate(board,player)
+
+        value, skippedSteps = gameHeuristics.evaluateLazy(board,player,alpha,beta)
+        if(skippedSteps > 0):
+            searchStats["lazySkips"] += 1
+            if(skippedSteps == 2):
+                searchStats["lazyMobilitySkips"] += 1
+        return value
+
+    ##############################################################################################################################
+    # Method Name: getBestMove
+
+    # Purpose: This method is used to get the best move for the given player using the principal variation search.
+
+    # Method Description:
+    # The root moves are searched like the other nodes: the first one with the full window and the other ones with a null window.
+    # The best move is the first move with the best score, so it is the same move as the one of AlphaBetaPruningStrategy with the same move order.
+
+    #function Arguments:
+    #boardToGetBestMove: The current state of the game.
+    #player: The player for whom we are calculating the score W or B.
+    #depth: The depth of the game tree.
+    #rootMoves: The valid moves in the order they should be searched (by default, the order of the move ordering).
+    #alpha, beta: The window of the root (by default the full window). The best score is only exact if it is inside the window,
+    #             like in AlphaBetaPruningStrategy.getBestMove.
+    ##############################################################################################################################
+
+    def getBestMove(boardToGetBestMove : ReversiBoard,player,depth,rootMoves = None,alpha = -math.inf,beta = math.inf):
+
+        PrincipalVariationSearchStrategy.searchStats = {"nodes": 0, "ttCutoffs": 0, "cutoffs": 0, "firstMoveCutoffs": 0, "reSearches": 0, "probCuts": 0, "evaluations": 0, "lazySkips": 0, "lazyMobilitySkips": 0}
+        PrincipalVariationSearchStrategy.rootScores = []
+        PrincipalVariationSearchStrategy.pvLength[0] = 0
+
+        moveOrdering = PrincipalVariationSearchStrategy.moveOrdering
+        if(moveOrdering is not None):
+            moveOrdering.newSearch()
+
+        if(boardToGetBestMove.isGameOver()):
+            return None
+
+        validMoves = boardToGetBestMove.getValidMoves(player)
+        if(validMoves == []):
+            return None
+
+        if(rootMoves is not None):
+            validMoves = rootMoves
+        elif(moveOrdering is not None):
+            validMoves = moveOrdering.orderMoves(validMoves,player,64 - boardToGetBestMove.getScore("W") - boardToGetBestMove.getScore("B"))
+
+        searchStats = PrincipalVariationSearchStrategy.searchStats
+        opponent = boardToGetBestMove.getOpponent(player)
+
+        # The search makes and undoes the moves on a single copy of the board, so the game board is never modified.
+        board = boardToGetBestMove.getCopy()
+
+        bestMove = None
+        bestScore = -math.inf
+        for move in validMoves:
+            board.makeMove(player,move[0],move[1])
+            if(bestMove is None):
+                score = -PrincipalVariationSearchStrategy.__pvs(board,opponent,depth - 1,-beta,-alpha,1)
+            else:
+                moveAlpha = max(alpha,bestScore)
+                score = -PrincipalVariationSearchStrategy.__pvs(board,opponent,depth - 1,-moveAlpha - NULL_WINDOW,-moveAlpha,1)
+                if(score > moveAlpha and score < beta):
+                    searchStats["reSearches"] += 1
+                    score = -PrincipalVariationSearchStrategy.__pvs(board,opponent,depth - 1,-beta,-score + NULL_WINDOW,1)
+            board.undoMove()
+
+            PrincipalVariationSearchStrategy.rootScores.append((move,score))
+
+            if(bestMove is None or score > bestScore):
+                bestScore = score
+                bestMove = move
+                PrincipalVariationSearchStrategy.__updatePrincipalVariation(0,move)
+
+            # The search failed high, the other moves do not matter.
+            if(bestScore >= beta):
+                break
+
+        PrincipalVariationSearchStrategy.__completePrincipalVariation(board,player,depth)
+
+        return bestMove
+
+    # This private method completes the principal variation with the hash moves of the transposition table,
+    # when the line was cut short by a score from the table.
+    def __completePrincipalVariation(board : ReversiBoard,player,depth):
+        pvTable = PrincipalVariationSearchStrategy.pvTable
+        pvLength = PrincipalVariationSearchStrategy.pvLength
+
+        # Play the line on the board, skipping the passes.
+        movesMade = 0
+        while movesMade < depth and not board.isGameOver():
+            validMoves = board.getValidMoves(player)
+            if(validMoves == []):
+                player = board.getOpponent(player)
+                continue
+
+            if(movesMade < pvLength[0]):
+                move = pvTable[0][movesMade]
+            else:
+                entry = PrincipalVariationSearchStrategy.transpositionTable.probe(board.getHash(player)) if PrincipalVariationSearchStrategy.useTranspositionTable else None
+                if(entry is None or entry[4] not in validMoves):
+                    break
+                move = entry[4]
+                pvTable[0][movesMade] = move
+                pvLength[0] = movesMade + 1
+
+            board.makeMove(player,move[0],move[1])
+            player = board.getOpponent(player)
+            movesMade += 1
+
+        for undoCount in range(movesMade):
+            board.undoMove()
+
+    ##############################################################################################################################
+    # Method Name: getBestMoveIterative
+
+    # Purpose: This method is used to get the best move for the given player within a time (and nodes) budget.
+    # It works like AlphaBetaPruningStrategy.getBestMoveIterative: depth 1, 2, 3, ... until the budget runs out,
+    # each depth searching the root moves in the order of the scores of the previous one,
+    # with an aspiration window around the score of two depths before (see aspirationWindows).
+
+    # Returns the best move and the depth of the last completed search.
+    ##############################################################################################################################
+
+    def getBestMoveIterative(boardToGetBestMove : ReversiBoard,player,timeLimit,maxNodes = None,maxDepth = None):
+
+        deadline = time.time() + timeLimit
+        emptySquares = 64 - boardToGetBestMove.getScore("W") - boardToGetBestMove.getScore("B")
+        if(maxDepth is None or maxDepth > emptySquares):
+            maxDepth = max(emptySquares,1)
+
+        bestMove = None
+        completedDepth = 0
+        rootMoves = None
+        totalNodes = 0
+        totalStats = {}
+        principalVariation = []
+        depthScores = {}
+
+        try:
+            for depth in range(1, maxDepth + 1):
+
+                # Stop when the budget ran out between two depths.
+                if(depth > 1 and (time.time() >= deadline or (maxNodes is not None and totalNodes >= maxNodes))):
+                    break
+
+                # The first depth has no budget, so that there is always a move.
+                if(depth > 1):
+                    PrincipalVariationSearchStrategy.deadline = deadline
+
+                window = PrincipalVariationSearchStrategy.aspirationWindows.get(PrincipalVariationSearchStrategy.difficulty)
+                if(depth <= 2 or window is None):
+                    alpha, beta = -math.inf, math.inf
+                else:
+                    alpha, beta = depthScores[depth - 2] - window, depthScores[depth - 2] + window
+
+                # Search again with a wider window (on the side that failed) until the score is inside the window.
+                while True:
+                    # Every search of the depth (the re-searches too) only gets the nodes that are left of the budget.
+                    if(depth > 1 and maxNodes is not None):
+                        if(totalNodes >= maxNodes):
+                            raise SearchTimeout()
+                        PrincipalVariationSearchStrategy.nodesLimit = maxNodes - totalNodes
+                    try:
+                        move = PrincipalVariationSearchStrategy.getBestMove(boardToGetBestMove,player,depth,rootMoves,alpha,beta)
+                    finally:
+                        totalNodes += PrincipalVariationSearchStrategy.searchStats["nodes"]
+                        for statName, value in PrincipalVariationSearchStrategy.searchStats.items():
+                            totalStats[statName] = totalStats.get(statName, 0) + value
+
+                    if(move is None):
+                        break
+                    score = max(moveScore for rootMove, moveScore in PrincipalVariationSearchStrategy.rootScores)
+                    if(score > alpha and score < beta):
+                        depthScores[depth] = score
+                        break
+
+                    window *= 2
+                    if(score <= alpha):
+                        totalStats["aspirationFailLows"] = totalStats.get("aspirationFailLows", 0) + 1
+                        alpha = score - window if window < ASPIRATION_MAX_WINDOW else -math.inf
+                    else:
+                        totalStats["aspirationFailHighs"] = totalStats.get("aspirationFailHighs", 0) + 1
+                        beta = score + window if window < ASPIRATION_MAX_WINDOW else math.inf
+
+                if(move is None):
+                    return None, 0
+
+                bestMove = move
+                completedDepth = depth
+                principalVariation = PrincipalVariationSearchStrategy.getPrincipalVariation()
+
+                rootMoves = [move for move, score in sorted(PrincipalVariationSearchStrategy.rootScores, key = lambda moveScore: -moveScore[1])]
+        except SearchTimeout:
+            pass
+        finally:
+            PrincipalVariationSearchStrategy.deadline = None
+            PrincipalVariationSearchStrategy.nodesLimit = None
+
+        # The statistics of all the depths are added up, and the principal variation is the one of the last completed depth.
+        totalStats["depth"] = completedDepth
+        PrincipalVariationSearchStrategy.searchStats = totalStats
+        PrincipalVariationSearchStrategy.pvTable[0][:len(principalVariation)] = principalVariation
+        PrincipalVariationSearchStrategy.pvLength[0] = len(principalVariation)
+
+        return bestMove, completedDepth
+
+    ##############################################################################################################################
+    # Method Name: pvs (private)
+
+    # Purpose: This method is the negamax principal variation search.
+
+    # function Arguments:
+    # board: The current state of the game.
+    # player: The player to move, the score is for this player.
+    # depth: The remaining depth.
+    # alpha, beta: The window of the search.
+    # ply: The number of moves from the root, the row of the principal variation table.
+    ##############################################################################################################################
+
+    def __pvs(board : ReversiBoard,player,depth,alpha,beta,ply):
+
+        searchStats = PrincipalVariationSearchStrategy.searchStats
+        searchStats["nodes"] += 1
+        pvLength = PrincipalVariationSearchStrategy.pvLength
+        pvLength[ply] = ply
+
+        # Check the budget of the search every 256 nodes.
+        if(searchStats["nodes"] & 255 == 0 and PrincipalVariationSearchStrategy.deadline is not None):
+            if(time.time() >= PrincipalVariationSearchStrategy.deadline):
+                raise SearchTimeout()
+            if(PrincipalVariationSearchStrategy.nodesLimit is not None and searchStats["nodes"] >= PrincipalVariationSearchStrategy.nodesLimit):
+                raise SearchTimeout()
+
+        if(depth == 0 or board.isGameOver()):
+            return PrincipalVariationSearchStrategy.evaluateBoard(board,player,alpha,beta)
+
+        opponent = board.getOpponent(player)
+        validMoves = board.getValidMoves(player)
+
+        # The player has to pass: the opponent plays from the same position (and the same row of the table, a pass is not a move).
+        if(validMoves == []):
+            return -PrincipalVariationSearchStrategy.__pvs(board,opponent,depth,-beta,-alpha,ply)
+
+        # Look the position up in the transposition table (only an entry of the same depth gives a score, like in AlphaBetaPruningStrategy).
+        # A score from the table cuts the principal variation short, getBestMove completes it with the hash moves.
+        useTranspositionTable = PrincipalVariationSearchStrategy.useTranspositionTable
+        hashMove = None
+        if(useTranspositionTable):
+            key = board.getHash(player)
+            entry = PrincipalVariationSearchStrategy.transpositionTable.probe(key)
+            if(entry is not None):
+                hashMove = entry[4]
+
+            if(entry is not None and entry[1] == depth):
+                score, boundType = entry[2], entry[3]
+                if(boundType == EXACT):
+                    searchStats["ttCutoffs"] += 1
+                    return score
+                elif(boundType == LOWER_BOUND):
+                    alpha = max(alpha,score)
+                else:
+                    beta = min(beta,score)
+
+                if(beta <= alpha):
+                    searchStats["ttCutoffs"] += 1
+                    return score
+
+        emptySquares = 64 - board.getScore("W") - board.getScore("B")
+
+        # Multi-ProbCut, only in the null window nodes (the principal variation is always searched fully).
+        if(isNullWindow(alpha,beta) and PrincipalVariationSearchStrategy.evaluator == "heuristics" and PrincipalVariationSearchStrategy.probCutDifficulties.get(PrincipalVariationSearchStrategy.difficulty)):
+            parameters = PrincipalVariationSearchStrategy.probCutParameters.get(getGamePhase(emptySquares), {}).get(depth)
+            if(parameters is not None):
+                shallowDepth, slope, offset, sigma = parameters
+                margin = PrincipalVariationSearchStrategy.probCutThreshold * sigma
+
+                # The deep score is very likely at least beta if the shallow score is at least this bound.
+                bound = (beta + margin - offset) / slope
+                if(PrincipalVariationSearchStrategy.__pvs(board,player,shallowDepth,bound - NULL_WINDOW,bound,ply) >= bound):
+                    searchStats["probCuts"] += 1
+                    return beta
+
+                # The deep score is very likely at most alpha if the shallow score is at most this bound.
+                bound = (alpha - margin - offset) / slope
+                if(PrincipalVariationSearchStrategy.__pvs(board,player,shallowDepth,bound,bound + NULL_WINDOW,ply) <= bound):
+                    searchStats["probCuts"] += 1
+                    return alpha
+
+        searchAlpha = alpha
+        bestMove = None
+        bestScore = -math.inf
+
+        moveOrdering = PrincipalVariationSearchStrategy.moveOrdering
+        if(moveOrdering is not None):
+            validMoves = moveOrdering.orderMoves(validMoves,player,emptySquares,hashMove)
+
+        for move in validMoves:
+            board.makeMove(player,move[0],move[1])
+
+            if(bestMove is None):
+                # The first move is searched with the full window.
+                score = -PrincipalVariationSearchStrategy.__pvs(board,opponent,depth - 1,-beta,-alpha,ply + 1)
+            else:
+                # The other moves are tested with a null window, and searched again only if they may be better than alpha.
+                # A leaf is evaluated exactly whatever the window (unless the evaluation is lazy), so its score never needs a re-search.
+                score = -PrincipalVariationSearchStrategy.__pvs(board,opponent,depth - 1,-alpha - NULL_WINDOW,-alpha,ply + 1)
+                if(score > alpha and score < beta and (depth > 1 or PrincipalVariationSearchStrategy.lazyEvaluation)):
+                    searchStats["reSearches"] += 1
+                    score = -PrincipalVariationSearchStrategy.__pvs(board,opponent,depth - 1,-beta,-score + NULL_WINDOW,ply + 1)
+
+            board.undoMove()
+
+            if(score > bestScore):
+                bestScore = score
+                bestMove = move
+                if(score > alpha):
+                    alpha = score
+                    PrincipalVariationSearchStrategy.__updatePrincipalVariation(ply,move)
+
+            if(alpha >= beta):
+                searchStats["cutoffs"] += 1
+                if(move is validMoves[0]):
+                    searchStats["firstMoveCutoffs"] += 1
+                if(moveOrdering is not None):
+                    moveOrdering.recordCutoff(move,player,emptySquares,depth)
+                break
+
+        if(useTranspositionTable):
+            if(bestScore <= searchAlpha):
+                boundType = UPPER_BOUND
+            elif(bestScore >= beta):
+                boundType = LOWER_BOUND
+            else:
+                boundType = EXACT
+            PrincipalVariationSearchStrategy.transpositionTable.store(key,depth,bestScore,boundType,bestMove)
+
+        return bestScore
+
+    # This private method makes the move the first move of the principal variation of the ply, followed by the one of the child.
+    def __updatePrincipalVariation(ply,move):
+        pvTable = PrincipalVariationSearchStrategy.pvTable
+        pvLength = PrincipalVariationSearchStrategy.pvLength
+
+        pvTable[ply][ply] = move
+        childLength = pvLength[ply + 1]
+        pvTable[ply][ply + 1:childLength] = pvTable[ply + 1][ply + 1:childLength]
+        pvLength[ply] = max(childLength,ply + 1)
+
+    ##############################################################################################################################
+
+    # Method Name: getPrincipalVariation
+    # Returns the principal variation of the last search: the best move followed by the expected replies.
+
+    def getPrincipalVariation():
+        return PrincipalVariationSearchStrategy.pvTable[0][:PrincipalVariationSearchStrategy.pvLength[0]]
+
+    # Method Name: getCutoffRate
+    # Returns the share of the cutoffs of the last search that were caused by the first move searched (between 0 and 1).
+
+    def getCutoffRate():
+        searchStats = PrincipalVariationSearchStrategy.searchStats
+        if(searchStats.get("cutoffs", 0) == 0):
+            return 0
+        return searchStats["firstMoveCutoffs"] / searchStats["cutoffs"]
+
+    # Method Name: getLazySkipRate
+    # Returns the share of the heuristic evaluations of the last search that skipped the expensive heuristics (between 0 and 1).
+
+    def getLazySkipRate():
+        searchStats = PrincipalVariationSearchStrategy.searchStats
+        if(searchStats.get("evaluations", 0) == 0):
+            return 0
+        return searchStats["lazySkips"] / searchStats["evaluations"]
+
+    # Method Name: getDifficulty
+    def getDifficulty():
+        return PrincipalVariationSearchStrategy.difficulty
+
+    # Method Name: setDifficulty
+    # The evaluation function depends on the difficulty, so the stored scores are not valid anymore when it changes.
+
+    def setDifficulty(difficulty):
+        if(difficulty != PrincipalVariationSearchStrategy.difficulty):
+            PrincipalVariationSearchStrategy.transpositionTable.clear()
+        PrincipalVariationSearchStrategy.difficulty = difficulty
+
+    # Method Name: setAspirationWindow
+    # Sets the half width of the aspiration window of the difficulty, None to search every depth with the full window.
+
+    def setAspirationWindow(difficulty,window):
+        if(window is not None and window <= 0):
+            raise ValueError("The aspiration window must be positive")
+        PrincipalVariationSearchStrategy.aspirationWindows[difficulty] = window
+
+    # Method Name: setEvaluator
+    # Sets the evaluator of the medium and hard difficulties: "heuristics" or "patterns" (the tables are loaded from the given file the first time).
+    # The stored scores of the other evaluator are not valid anymore, so the transposition table is cleared.
+
+    def setEvaluator(evaluator,fileName = PATTERN_TABLES_FILE):
+        if(evaluator not in ["heuristics", "patterns"]):
+            raise ValueError("Invalid evaluator")
+        if(evaluator == "patterns" and PrincipalVariationSearchStrategy.patternEvaluator is None):
+            PrincipalVariationSearchStrategy.patternEvaluator = PatternEvaluator(fileName)
+        if(evaluator != PrincipalVariationSearchStrategy.evaluator):
+            PrincipalVariationSearchStrategy.transpositionTable.clear()
+        PrincipalVariationSearchStrategy.evaluator = evaluator
+
+    # Method Name: setLazyEvaluation
+    # Turns the lazy evaluation of the leaves on or off (see lazyEvaluation).
+
+    def setLazyEvaluation(isLazy):
+        PrincipalVariationSearchStrategy.lazyEvaluation = isLazy
+
+    # Method Name: setProbCut
+    # Turns Multi-ProbCut on or off for the difficulty (see probCutDifficulties).
+    # The scores of a selective search are not the ones of an exact search, so the stored scores are not valid anymore when it changes.
+
+    def setProbCut(difficulty,isEnabled):
+        if(PrincipalVariationSearchStrategy.probCutDifficulties.get(difficulty) != isEnabled):
+            PrincipalVariationSearchStrategy.transpositionTable.clear()
+        PrincipalVariationSearchStrategy.probCutDifficulties[difficulty] = isEnabled
+
+    # Method Name: loadProbCutParameters
+    # Loads the Multi-ProbCut parameters from the file written by calibrateProbCut.py.
+    # Without the file there are no parameters, and the search is not selective.
+    # The depths deeper than the calibrated ones use the parameters of the deepest calibrated depth of the same parity
+    # (the searches of the calibration are too slow to fit them, and the parameters change slowly with the depth).
+
+    def loadProbCutParameters(fileName = PROBCUT_PARAMETERS_FILE):
+        probCutParameters = {}
+        if(os.path.exists(fileName)):
+            with open(fileName) as parametersFile:
+                # The keys of JSON objects are strings.
+                for phase, depths in json.load(parametersFile).items():
+                    probCutParameters[int(phase)] = {int(depth): tuple(parameters) for depth, parameters in depths.items()}
+
+        for depths in probCutParameters.values():
+            for depth in range(max(depths) + 1, MAX_PROBCUT_DEPTH + 1):
+                if(depth - 2 in depths):
+                    shallowDepth, slope, offset, sigma = depths[depth - 2]
+                    depths[depth] = (getProbCutShallowDepth(depth), slope, offset, sigma)
+        PrincipalVariationSearchStrategy.probCutParameters = probCutParameters
+
+    # Method Name: setTranspositionTableSize
+    # Sets the memory cap of the transposition table in megabytes (the table is cleared).
+
+    def setTranspositionTableSize(maxMemoryMB):
+        PrincipalVariationSearchStrategy.transpositionTable.setMaxMemory(maxMemoryMB)
+
+
+PrincipalVariationSearchStrategy.loadProbCutParameters()
@@ -0,0 +1,265 @@
+##############################################################################################################################
+# Project Name :  Othello                                                                                                    #
+# File Name    :  proofNumberSearch.py                                                                                       #
+# Description  :  This file contains the class that implements the proof-number search, used to prove wins and losses at   #
+#                 the end of the game. The class inherits from the Strategy interface.                                      #
+# Date         :  10/18/2026                                                                                                 #
+#                                                                                                                            #
+##############################################################################################################################
+
+# Proof-number search does not score the positions, it proves a goal: "the attacker ends the game with at least N more discs".
+# Every node has two numbers:
+# The proof number: the smallest number of leaves that must be shown to reach the goal to prove that the goal is reached from the node.
+# The disproof number: the same for showing that the goal is not reached.
+# The search always expands the most proving node, the one that the smallest proof (or disproof) goes through,
+# so it goes deep in the narrow parts of the tree and leaves the wide parts for later, which alpha-beta with a bad move order cannot do.
+
+# This is the depth-first version (df-pn): the numbers are kept in a table instead of a tree in memory,
+# and every node is searched until its numbers reach thresholds given by its parent.
+# Each node uses the numbers of the player to move: phi is the proof number for that player and delta the disproof number,
+# so the phi of a node is the smallest delta of its children, and its delta is the sum of the phi of its children.
+
+# The table is bounded: when it is full, the entries with the smallest subtrees (the cheapest to search again) are removed.
+
+from board import ReversiBoard
+from strategy import Strategy
+from alphaBetaPruning import SearchTimeout
+
+
+# The proof and disproof numbers of a position that is proven or disproven.
+PN_INFINITY = 1 << 30
+
+# The 1+epsilon trick: a child is searched until its delta is more than (1 + EPSILON) times the delta of the second best child,
+# instead of just more than it, so the search does not keep switching between two children with close numbers
+# (each switch searches the other child again from its table entry, and the entries may have been removed).
+EPSILON = 0.25
+
+# The goals: the attacker must win (end with at least 1 more disc) or at least draw (end with at least 0 more discs).
+WIN_GOAL = 1
+DRAW_GOAL = 0
+
+
+class ProofNumberSearchStrategy(Strategy):
+
+    # The table of the search: the hash of a position (with the player to move) -> [phi, delta, work].
+    # work is the number of nodes that were searched under the position, used to choose the entries to remove.
+    table = {}
+
+    # The maximum number of entries of the table, and the share of the entries removed when it is full.
+    maxTableSize = 200000
+    gcFraction = 0.5
+
+    # The maximum number of nodes of a solve (None means no limit), the search gives up when it is reached.
+    nodesLimit = 2000000
+
+    # The player that tries to reach the goal, and the goal (the number of discs that the attacker must be ahead by).
+    attacker = None
+    goal = WIN_GOAL
+
+    # The best move of the root found by the last proof.
+    rootBestMove = None
+
+    # Statistics of the last solve: the number of nodes searched, the number of garbage collections and the size of the table.
+    searchStats = {"nodes": 0, "gcRuns": 0, "tableSize": 0}
+
+
+    ##############################################################################################################################
+    # Method Name: getBestMove
+
+    # Purpose: This method is used to get a move that wins (or else draws) for the given player.
+    # depth is not used, the search always goes to the end of the game.
+    # If the game is lost, or cannot be solved within the nodes limit, the most promising move of the search is returned.
+    ##############################################################################################################################
+
+    def getBestMove(boardToGetBestMove : ReversiBoard,player,depth = None):
+        bestMove, result = ProofNumberSearchStrategy.solve(boardToGetBestMove,player)
+        if(bestMove is None and result is None):
+            bestMove = ProofNumberSearchStrategy.rootBestMove
+        return bestMove
+
+    ##############################################################################################################################
+    # Method Name: solve
+
+    # Purpose: This method is used to know if the game is won, lost or drawn for the given player, and a move that keeps that result.
+
+    # Method Description:
+    # The search first tries to prove a win. If it is disproven, it tries to prove a draw, and if that is disproven too the game is lost.
+
+    # Returns the move (None if the player has no move) and the result: 1 for a win, 0 for a draw and -1 for a loss,
+    # or None and None if the nodes limit was reached first.
+    ##############################################################################################################################
+
+    def solve(boardToSolve : ReversiBoard,player):
+
+        ProofNumberSearchStrategy.searchStats = {"nodes": 0, "gcRuns": 0, "tableSize": 0}
+
+        try:
+            isProven, bestMove = ProofNumberSearchStrategy.prove(boardToSolve,player,WIN_GOAL)
+            if(isProven):
+                return bestMove, 1
+
+            isProven, bestMove = ProofNumberSearchStrategy.prove(boardToSolve,player,DRAW_GOAL)
+            if(isProven):
+                return bestMove, 0
+
+            return bestMove, -1
+        except SearchTimeout:
+            return None, None
+        finally:
+            ProofNumberSearchStrategy.searchStats["tableSize"] = len(ProofNumberSearchStrategy.table)
+
+    ##############################################################################################################################
+    # Method Name: prove
+
+    # Purpose: This method is used to prove or disprove that the given player ends the game with at least goal more discs.
+
+    # Returns True if it is proven and False if it is disproven, and the best move of the root (the proving move if it is proven).
+    # It raises a SearchTimeout if the nodes limit is reached.
+    ##############################################################################################################################
+
+    def prove(boardToProve : ReversiBoard,player,goal):
+
+        ProofNumberSearchStrategy.attacker = player
+        ProofNumberSearchStrategy.goal = goal
+        ProofNumberSearchStrategy.rootBestMove = None
+        ProofNumberSearchStrategy.table.clear()
+
+        if(boardToProve.isGameOver()):
+            return ProofNumberSearchStrategy.__isGoalReached(boardToProve), None
+
+        # The search makes and undoes the moves on a copy of the board.
+        board = boardToProve.getCopy()
+        phi, delta = ProofNumberSearchStrategy.__mid(board,player,PN_INFINITY,PN_INFINITY,True)
+
+        return phi == 0, ProofNumberSearchStrategy.rootBestMove
+
+    ##############################################################################################################################
+    # Method Name: mid (private)
+
+    # Purpose: This method searches a node until its phi or delta reaches the given thresholds (Multiple Iterative Deepening).
+
+    # Method Description:
+    # The children of the node are looked up in the table (a child that was never searched is estimated from its number of moves).
+    # The node searches its most proving child (the one with the smallest delta) with thresholds that make the child return
+    # as soon as another child becomes more proving, or as soon as the node itself reaches its thresholds.
+
+    #function Arguments:
+    #board: The current state of the game, which is not over.
+    #player: The player to move.
+    #thresholdPhi, thresholdDelta: The thresholds of the node.
+    #isRoot: True for the root, to remember its best move.
+
+    # Returns phi and delta of the node.
+    ##############################################################################################################################
+
+    def __mid(board : ReversiBoard,player,thresholdPhi,thresholdDelta,isRoot = False):
+
+        searchStats = ProofNumberSearchStrategy.searchStats
+        searchStats["nodes"] += 1
+        startNodes = searchStats["nodes"]
+        if(ProofNumberSearchStrategy.nodesLimit is not None and startNodes >= ProofNumberSearchStrategy.nodesLimit):
+            raise SearchTimeout()
+
+        table = ProofNumberSearchStrategy.table
+        opponent = board.getOpponent(player)
+
+        # The player has to pass: the only child is the same position with the opponent to move.
+        moves = board.getValidMoves(player)
+        if(moves == []):
+            moves = [None]
+
+        # The keys of the children, and the numbers of the children where the game is over.
+        # A child that is not in the table starts with phi 1 and delta the number of moves of the opponent:
+        # To disprove it, every move of the opponent must be disproven, so the moves that leave the fewest replies are searched first.
+        childKeys = []
+        childNumbers = []
+        for move in moves:
+            if(move is not None):
+                board.makeMove(player,move[0],move[1])
+            childKey = board.getHash(opponent)
+            if(childKey not in table and board.isGameOver()):
+                table[childKey] = ProofNumberSearchStrategy.__terminalEntry(board,opponent)
+            childNumbers.append((1, max(1,len(board.getValidMoves(opponent)))))
+            if(move is not None):
+                board.undoMove()
+            childKeys.append(childKey)
+
+        while True:
+            # phi is the smallest delta of the children, and delta the sum of their phi.
+            delta = 0
+            bestIndex = 0
+            bestDelta = PN_INFINITY + 1
+            bestPhi = 1
+            secondDelta = PN_INFINITY
+            for index, childKey in enumerate(childKeys):
+                entry = table.get(childKey)
+                childPhi, childDelta = childNumbers[index] if entry is None else (entry[0], entry[1])
+                delta += childPhi
+                if(childDelta < bestDelta):
+                    secondDelta = min(secondDelta,bestDelta)
+                    bestDelta, bestPhi, bestIndex = childDelta, childPhi, index
+                elif(childDelta < secondDelta):
+                    secondDelta = childDelta
+            phi = bestDelta
+            delta = min(delta,PN_INFINITY)
+
+            if(phi >= thresholdPhi or delta >= thresholdDelta):
+                break
+
+            # The child is searched until it is clearly not the most proving child anymore (secondDelta, see EPSILON),
+            # or until the node reaches its delta threshold.
+            childThresholdPhi = min(thresholdDelta + bestPhi - delta,PN_INFINITY)
+            childThresholdDelta = min(thresholdPhi,int(secondDelta * (1 + EPSILON)) + 1)
+
+            move = moves[bestIndex]
+            if(move is not None):
+                board.makeMove(player,move[0],move[1])
+            ProofNumberSearchStrategy.__mid(board,opponent,childThresholdPhi,childThresholdDelta)
+            if(move is not None):
+                board.undoMove()
+
+        if(isRoot):
+            ProofNumberSearchStrategy.rootBestMove = moves[bestIndex]
+
+        # Store the numbers of the node, with the work done under it.
+        key = board.getHash(player)
+        work = searchStats["nodes"] - startNodes + 1
+        entry = table.get(key)
+        if(entry is not None):
+            work += entry[2]
+        if(entry is None and len(table) >= ProofNumberSearchStrategy.maxTableSize):
+            ProofNumberSearchStrategy.__collectGarbage()
+        table[key] = [phi, delta, work]
+
+        return phi, delta
+
+    ##############################################################################################################################
+
+    # This private method returns True if the attacker reached the goal, on a board where the game is over.
+    def __isGoalReached(board : ReversiBoard):
+        attacker = ProofNumberSearchStrategy.attacker
+        return board.getScore(attacker) - board.getScore(board.getOpponent(attacker)) >= ProofNumberSearchStrategy.goal
+
+    # This private method returns the table entry of a position where the game is over, with the given player to move.
+    def __terminalEntry(board : ReversiBoard,player):
+        isGoalReached = ProofNumberSearchStrategy.__isGoalReached(board)
+        if(isGoalReached == (player == ProofNumberSearchStrategy.attacker)):
+            return [0, PN_INFINITY, 0]
+        return [PN_INFINITY, 0, 0]
+
+    # This private method removes the entries with the smallest subtrees from the table, to make room for the new ones.
+    def __collectGarbage():
+        table = ProofNumberSearchStrategy.table
+        ProofNumberSearchStrategy.searchStats["gcRuns"] += 1
+
+        removedCount = max(1,int(len(table) * ProofNumberSearchStrategy.gcFraction))
+        for key in sorted(table, key = lambda key: table[key][2])[:removedCount]:
+            del table[key]
+
+    # Method Name: setMaxTableSize
+    # Sets the maximum number of entries of the table.
+
+    def setMaxTableSize(maxTableSize):
+        if(maxTableSize <= 0):
+            raise ValueError("The size of the table must be positive")
+        ProofNumberSearchStrategy.maxTableSize = maxTableSize
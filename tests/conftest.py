@@ -0,0 +1,36 @@
+##############################################################################################################################
+# Project Name :  Othello                                                                                                    #
+# File Name    :  conftest.py                                                                                                #
+# Description  :  This file makes the modules of the game importable from the tests, and holds the helpers they share.      #
+# Date         :  10/18/2026                                                                                                 #
+#                                                                                                                            #
+##############################################################################################################################
+
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from board import ReversiBoard
+
+
+# This function returns a board after the given number of random moves (fewer if the game ends first).
+def playRandomMoves(movesCount : int, randomGenerator : random.Random):
+    board = ReversiBoard()
+    for moveIndex in range(movesCount):
+        if(board.isGameOver()):
+            break
+        board.makeMove(board.whoseTurn, *randomGenerator.choice(board.getValidMoves(board.whoseTurn)))
+    return board
+
+
+# This function returns positions from random games with the given number of empty squares, as (board, player to move).
+def getEndgamePositions(emptiesCount : int, positionsCount : int, seed : int):
+    randomGenerator = random.Random(seed)
+    positions = []
+    while len(positions) < positionsCount:
+        board = playRandomMoves(60 - emptiesCount, randomGenerator)
+        if(board.whoseTurn != " "):
+            positions.append((board, board.whoseTurn))
+    return positions
@@ -0,0 +1,255 @@
+##############################################################################################################################
+# Project Name :  Othello                                                                                                    #
+# File Name    :  test_board.py                                                                                              #
+# Description  :  This file checks the bitboard board against a plain 2D array implementation of the rules.                 #
+# Date         :  10/18/2026                                                                                                 #
+#                                                                                                                            #
+##############################################################################################################################
+
+import random
+
+import pytest
+
+from board import ReversiBoard, STATIC_WEIGHTS, computePatternIndices
+
+
+DIRECTIONS = [(0,1),(1,0),(0,-1),(-1,0),(1,1),(-1,-1),(1,-1),(-1,1)]
+
+
+# The reference implementation: the discs flipped by a move on a 2D array, walking every direction square by square.
+def referenceFlips(grid, color, row, col):
+    opponent = "W" if color == "B" else "B"
+    if(grid[row][col] != " "):
+        return []
+    flips = []
+    for rowStep, colStep in DIRECTIONS:
+        line = []
+        r, c = row + rowStep, col + colStep
+        while 0 <= r < 8 and 0 <= c < 8 and grid[r][c] == opponent:
+            line.append((r, c))
+            r, c = r + rowStep, c + colStep
+        if(line and 0 <= r < 8 and 0 <= c < 8 and grid[r][c] == color):
+            flips.extend(line)
+    return flips
+
+
+def referenceMoves(grid, color):
+    return sorted((row, col) for row in range(8) for col in range(8) if referenceFlips(grid, color, row, col))
+
+
+def test_initial_position():
+    board = ReversiBoard()
+    assert board.getScore("B") == 2 and board.getScore("W") == 2
+    assert board.whoseTurn == "B"
+    assert sorted(map(tuple, board.getValidMoves("B"))) == referenceMoves(board.getBoard(), "B")
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_random_games_match_the_reference(seed):
+    randomGenerator = random.Random(seed)
+    board = ReversiBoard()
+    grid = board.getBoard()
+
+    while board.whoseTurn != " ":
+        color = board.whoseTurn
+        opponent = "W" if color == "B" else "B"
+        assert sorted(map(tuple, board.getValidMoves("B"))) == referenceMoves(grid, "B")
+        assert sorted(map(tuple, board.getValidMoves("W"))) == referenceMoves(grid, "W")
+
+        row, col = randomGenerator.choice(board.getValidMoves(color))
+        for r, c in referenceFlips(grid, color, row, col):
+            grid[r][c] = color
+        grid[row][col] = color
+        board.makeMove(color, row, col)
+
+        assert board.getBoard() == grid
+        assert board.getScore("B") == sum(line.count("B") for line in grid)
+        assert board.getScore("W") == sum(line.count("W") for line in grid)
+
+        # The opponent plays next, unless it has to pass (then the same player plays again) or nobody can move.
+        if(referenceMoves(grid, opponent)):
+            assert board.whoseTurn == opponent
+        elif(referenceMoves(grid, color)):
+            assert board.whoseTurn == color
+        else:
+            assert board.whoseTurn == " "
+            assert board.isGameOver()
+
+
+def test_invalid_moves_are_rejected():
+    board = ReversiBoard()
+    with pytest.raises(Exception):
+        board.makeMove("B", 0, 0)
+    with pytest.raises(Exception):
+        board.makeMove("W", 2, 4)
+
+
+def test_setting_the_board_keeps_the_position():
+    board = ReversiBoard()
+    board.makeMove("B", 2, 3)
+    copy = ReversiBoard()
+    copy.board = board.getBoard()
+    assert copy.getBoard() == board.getBoard()
+    assert copy.getScore("B") == board.getScore("B") and copy.getScore("W") == board.getScore("W")
+
+
+# Everything that a move changes on the board, so two snapshots are equal only if the positions and the counters are the same.
+def snapshot(board):
+    return (board.blackBits, board.whiteBits, board.whoseTurn, board.getScore("B"), board.getScore("W"),
+            board.frontierBits, board.getHash(), board.getStaticWeightSum("B"), board.getStaticWeightSum("W"),
+            sorted(map(tuple, board.getValidMoves("B"))), sorted(map(tuple, board.getValidMoves("W"))))
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_undo_restores_every_position_of_a_game(seed):
+    randomGenerator = random.Random(seed)
+    board = ReversiBoard()
+    snapshots = []
+    while board.whoseTurn != " ":
+        snapshots.append(snapshot(board))
+        board.makeMove(board.whoseTurn, *randomGenerator.choice(board.getValidMoves(board.whoseTurn)))
+
+    while snapshots:
+        board.undoMove()
+        assert snapshot(board) == snapshots.pop()
+
+    with pytest.raises(Exception):
+        board.undoMove()
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_make_undo_round_trip_at_every_node(seed):
+    randomGenerator = random.Random(seed)
+    board = ReversiBoard()
+    while board.whoseTurn != " ":
+        before = snapshot(board)
+        for move in board.getValidMoves(board.whoseTurn):
+            board.makeMove(board.whoseTurn, move[0], move[1])
+            board.undoMove()
+            assert snapshot(board) == before
+        board.makeMove(board.whoseTurn, *randomGenerator.choice(board.getValidMoves(board.whoseTurn)))
+
+
+
+# The running sums of the static weights must be the sums of STATIC_WEIGHTS over the discs of the 2D array, whatever the moves made and undone.
+def assertWeightSums(board):
+    grid = board.getBoard()
+    for color in ["B", "W"]:
+        weightSum = sum(STATIC_WEIGHTS[row][col] for row in range(8) for col in range(8) if grid[row][col] == color)
+        assert board.getStaticWeightSum(color) == weightSum
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_static_weight_sums_match_a_full_rescan(seed):
+    randomGenerator = random.Random(seed)
+    board = ReversiBoard()
+    assertWeightSums(board)
+
+    while board.whoseTurn != " ":
+        # A few moves are made and undone at every position, like in a search.
+        validMoves = board.getValidMoves(board.whoseTurn)
+        for move in randomGenerator.sample(validMoves, min(3, len(validMoves))):
+            board.makeMove(board.whoseTurn, move[0], move[1])
+            assertWeightSums(board)
+            board.undoMove()
+            assertWeightSums(board)
+
+        # A copy keeps its own sums.
+        if(randomGenerator.random() < 0.2):
+            copy = board.getCopy()
+            copy.makeMove(copy.whoseTurn, *copy.getValidMoves(copy.whoseTurn)[0])
+            assertWeightSums(copy)
+            assertWeightSums(board)
+
+        board.makeMove(board.whoseTurn, *randomGenerator.choice(validMoves))
+        assertWeightSums(board)
+
+    # A board set from a 2D array and a restarted board start from their own sums.
+    rebuilt = ReversiBoard()
+    rebuilt.board = board.getBoard()
+    assertWeightSums(rebuilt)
+    board.restart()
+    assertWeightSums(board)
+
+def test_copy_is_independent():
+    board = ReversiBoard()
+    board.makeMove("B", 2, 3)
+    copy = board.getCopy()
+    before = snapshot(board)
+    copy.makeMove(copy.whoseTurn, *copy.getValidMoves(copy.whoseTurn)[0])
+    assert snapshot(board) == before
+    copy.undoMove()
+    assert snapshot(copy) == before
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_incremental_hash_matches_a_board_built_from_the_2d_array(seed):
+    randomGenerator = random.Random(seed)
+    board = ReversiBoard()
+    while board.whoseTurn != " ":
+        board.makeMove(board.whoseTurn, *randomGenerator.choice(board.getValidMoves(board.whoseTurn)))
+
+        rebuilt = ReversiBoard()
+        rebuilt.board = board.getBoard()
+        assert rebuilt.discsHash == board.discsHash
+        assert rebuilt.getHash("B") == board.getHash("B") and rebuilt.getHash("W") == board.getHash("W")
+
+
+def test_hash_depends_on_the_position_and_the_side_to_move():
+    # The same position reached with the moves in a different order (a transposition) has the same hash.
+    first = ReversiBoard()
+    for color, row, col in [("B", 2, 3), ("W", 2, 2), ("B", 3, 2), ("W", 2, 4)]:
+        first.makeMove(color, row, col)
+    second = ReversiBoard()
+    for color, row, col in [("B", 3, 2), ("W", 2, 2), ("B", 2, 3), ("W", 2, 4)]:
+        second.makeMove(color, row, col)
+    assert first.getBoard() == second.getBoard()
+    assert first.getHash() == second.getHash()
+
+    assert first.getHash("B") != first.getHash("W")
+    assert first.getHash() != ReversiBoard().getHash()
+
+
+# The pattern indices are updated by makeMove and undoMove once they are enabled, and must always be the ones computed from scratch.
+def assertPatternIndices(board):
+    assert board.patternIndices == computePatternIndices(board.blackBits, board.whiteBits)
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_incremental_pattern_indices_match_the_indices_from_scratch(seed):
+    randomGenerator = random.Random(seed)
+    board = ReversiBoard()
+    board.enablePatternIndices()
+    assertPatternIndices(board)
+
+    movesCount = 0
+    while board.whoseTurn != " ":
+        # A few moves are made and undone at every position, like in a search.
+        validMoves = board.getValidMoves(board.whoseTurn)
+        for move in randomGenerator.sample(validMoves, min(3, len(validMoves))):
+            board.makeMove(board.whoseTurn, move[0], move[1])
+            assertPatternIndices(board)
+            board.undoMove()
+            assertPatternIndices(board)
+
+        # A copy keeps its own indices.
+        if(randomGenerator.random() < 0.2):
+            copy = board.getCopy()
+            assertPatternIndices(copy)
+            copy.makeMove(copy.whoseTurn, *copy.getValidMoves(copy.whoseTurn)[0])
+            assertPatternIndices(copy)
+            assertPatternIndices(board)
+
+        board.makeMove(board.whoseTurn, *randomGenerator.choice(validMoves))
+        movesCount += 1
+        assertPatternIndices(board)
+
+    # Back to the start of the game, then a new game.
+    for moveIndex in range(movesCount):
+        board.undoMove()
+        assertPatternIndices(board)
+    board.makeMove("B", 2, 3)
+    board.restart()
+    assertPatternIndices(board)
+    board.makeMove("B", 2, 3)
+    assertPatternIndices(board)
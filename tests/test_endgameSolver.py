@@ -0,0 +1,73 @@
+##############################################################################################################################
+# Project Name :  Othello                                                                                                    #
+# File Name    :  test_endgameSolver.py                                                                                      #
+# Description  :  This file checks the endgame solver against a brute-force search on positions with few empty squares.     #
+# Date         :  10/18/2026                                                                                                 #
+#                                                                                                                            #
+##############################################################################################################################
+
+import pytest
+
+from conftest import getEndgamePositions
+from endgameSolver import EndgameSolver
+
+
+# The reference: a plain negamax over every move to the end of the game, with the same scoring as the solver
+# (the discs of the player minus the discs of the opponent, the empty squares are not counted).
+def bruteForceScore(board, player):
+    opponent = "W" if player == "B" else "B"
+    moves = board.getValidMoves(player)
+    if(moves == []):
+        if(board.getValidMoves(opponent) == []):
+            return board.getScore(player) - board.getScore(opponent)
+        return -bruteForceScore(board, opponent)
+
+    bestScore = -64
+    for move in list(moves):
+        board.makeMove(player, move[0], move[1])
+        bestScore = max(bestScore, -bruteForceScore(board, opponent))
+        board.undoMove()
+    return bestScore
+
+
+ENDGAME_POSITIONS = getEndgamePositions(7, 12, 2023)
+
+
+@pytest.mark.parametrize("board, player", ENDGAME_POSITIONS)
+def test_solve_matches_brute_force(board, player):
+    expectedScore = bruteForceScore(board.getCopy(), player)
+    bestMove, score = EndgameSolver.solve(board, player)
+    assert score == expectedScore
+
+    # The best move reaches that score.
+    child = board.getCopy()
+    child.makeMove(player, bestMove[0], bestMove[1])
+    opponent = "W" if player == "B" else "B"
+    assert -bruteForceScore(child, opponent) == expectedScore
+
+
+@pytest.mark.parametrize("board, player", ENDGAME_POSITIONS[:6])
+def test_solve_with_a_window_gives_bounds(board, player):
+    exactScore = EndgameSolver.solve(board, player)[1]
+    for alpha, beta in [(exactScore - 3, exactScore + 3), (exactScore, exactScore + 2), (exactScore - 2, exactScore), (exactScore + 1, exactScore + 5)]:
+        score = EndgameSolver.solve(board, player, alpha, beta)[1]
+        if(score <= alpha):
+            assert exactScore <= alpha
+        elif(score >= beta):
+            assert exactScore >= beta
+        else:
+            assert score == exactScore
+
+
+@pytest.mark.parametrize("board, player", ENDGAME_POSITIONS)
+def test_win_loss_draw_matches_the_exact_score(board, player):
+    exactScore = EndgameSolver.solve(board, player)[1]
+    bestMove, result = EndgameSolver.solveWLD(board, player)
+    assert result == (exactScore > 0) - (exactScore < 0)
+
+    # The move keeps the result (it wins, draws or loses like the position).
+    child = board.getCopy()
+    child.makeMove(player, bestMove[0], bestMove[1])
+    opponent = "W" if player == "B" else "B"
+    childScore = -bruteForceScore(child, opponent)
+    assert (childScore > 0) - (childScore < 0) == result
@@ -0,0 +1,199 @@
+##############################################################################################################################
+# Project Name :  Othello                                                                                                    #
+# File Name    :  test_engines.py                                                                                            #
+# Description  :  This file checks that the exact search engines agree on the score of a position at the same depth.       #
+# Date         :  10/18/2026                                                                                                 #
+#                                                                                                                            #
+##############################################################################################################################
+
+import math
+import multiprocessing
+import random
+
+import pytest
+
+from conftest import playRandomMoves
+from board import ReversiBoard
+from alphaBetaPruning import AlphaBetaPruningStrategy, searchRootMoveInWorker, getParallelSettings
+from principalVariationSearch import PrincipalVariationSearchStrategy
+from moveOrdering import MoveOrdering
+
+
+def getPositions(positionsCount : int, seed : int):
+    randomGenerator = random.Random(seed)
+    positions = []
+    while len(positions) < positionsCount:
+        board = playRandomMoves(randomGenerator.randint(4, 40), randomGenerator)
+        if(board.whoseTurn != " "):
+            positions.append((board, board.whoseTurn))
+    return positions
+
+
+# Every engine starts with an empty transposition table and a new move ordering, and Multi-ProbCut (which is not exact) is off.
+@pytest.fixture(params = ["easy", "hard"])
+def difficulty(request):
+    isProbCut = PrincipalVariationSearchStrategy.probCutDifficulties.get(request.param)
+    AlphaBetaPruningStrategy.setDifficulty(request.param)
+    PrincipalVariationSearchStrategy.setDifficulty(request.param)
+    PrincipalVariationSearchStrategy.setProbCut(request.param, False)
+    yield request.param
+    PrincipalVariationSearchStrategy.setProbCut(request.param, isProbCut)
+
+
+def resetEngines():
+    for engine in [AlphaBetaPruningStrategy, PrincipalVariationSearchStrategy]:
+        engine.transpositionTable.clear()
+        engine.moveOrdering = MoveOrdering()
+
+
+@pytest.mark.parametrize("depth", [1, 2, 3, 4])
+@pytest.mark.parametrize("board, player", getPositions(6, 2023))
+def test_engines_find_the_same_score(difficulty, depth, board, player):
+    resetEngines()
+    alphaBetaMove = AlphaBetaPruningStrategy.getBestMove(board, player, depth)
+    alphaBetaScore = max(score for move, score in AlphaBetaPruningStrategy.rootScores)
+
+    resetEngines()
+    pvsMove = PrincipalVariationSearchStrategy.getBestMove(board, player, depth)
+    pvsScore = dict((tuple(move), score) for move, score in PrincipalVariationSearchStrategy.rootScores)[tuple(pvsMove)]
+    assert PrincipalVariationSearchStrategy.getPrincipalVariation()[0] == pvsMove
+
+    resetEngines()
+    mtdfMove, mtdfScore = AlphaBetaPruningStrategy.getBestMoveMTDF(board, player, depth)
+
+    assert pvsScore == pytest.approx(alphaBetaScore, abs = 1e-9)
+    assert mtdfScore == pytest.approx(alphaBetaScore, abs = 1e-9)
+
+    # The best moves of alpha-beta and PVS are the first moves with the best score in the same move order.
+    assert pvsMove == alphaBetaMove
+    assert pvsMove in board.getValidMoves(player) and mtdfMove in board.getValidMoves(player)
+
+
+# The parallel root search keeps its workers (and their transposition tables) between the searches,
+# so it is compared with the serial search over a whole game, on the same root move order.
+def test_parallel_search_matches_the_serial_search():
+    AlphaBetaPruningStrategy.setDifficulty("hard")
+    AlphaBetaPruningStrategy.setParallelWorkers(4)
+    randomGenerator = random.Random(0)
+    board = ReversiBoard()
+    try:
+        for position in range(40):
+            if(board.whoseTurn == " "):
+                break
+            player = board.whoseTurn
+            validMoves = board.getValidMoves(player)
+            for depth in [2, 3, 4]:
+                AlphaBetaPruningStrategy.parallelWorkers = 0
+                serialMove = AlphaBetaPruningStrategy.getBestMove(board, player, depth, list(validMoves))
+                serialScore = max(score for move, score in AlphaBetaPruningStrategy.rootScores)
+
+                AlphaBetaPruningStrategy.parallelWorkers = 4
+                parallelMove = AlphaBetaPruningStrategy.getBestMove(board, player, depth, list(validMoves))
+                parallelScore = max(score for move, score in AlphaBetaPruningStrategy.rootScores)
+
+                assert parallelMove == serialMove
+                assert parallelScore == pytest.approx(serialScore, abs = 1e-9)
+            board.makeMove(player, *randomGenerator.choice(validMoves))
+    finally:
+        AlphaBetaPruningStrategy.setParallelWorkers(0)
+
+
+# The workers raise their alpha to the shared alpha while they search, at any time. This is done here in this process:
+# the shared alpha is raised at random nodes (never above the best root score, like the real one),
+# and every root move must still get a correct bound (its exact score when the worker says it is exact).
+def test_worker_bounds_stay_correct_when_the_shared_alpha_rises(monkeypatch):
+    AlphaBetaPruningStrategy.setDifficulty("hard")
+    AlphaBetaPruningStrategy.transpositionTable.clear()
+    monkeypatch.setattr(AlphaBetaPruningStrategy, "useTranspositionTable", True)
+    sharedAlpha = multiprocessing.RawValue("d", -math.inf)
+    randomGenerator = random.Random(5)
+    bestRootScore = [-math.inf]
+
+    alphaBetaPruning = AlphaBetaPruningStrategy.alphaBetaPruning
+    def alphaBetaPruningWithRisingAlpha(*arguments):
+        if(AlphaBetaPruningStrategy.sharedAlpha is not None and randomGenerator.random() < 0.01):
+            sharedAlpha.value = min(bestRootScore[0], max(sharedAlpha.value, bestRootScore[0] - 5) + randomGenerator.random() * 3)
+        return alphaBetaPruning(*arguments)
+    monkeypatch.setattr(AlphaBetaPruningStrategy, "alphaBetaPruning", alphaBetaPruningWithRisingAlpha)
+
+    board = ReversiBoard()
+    for position in range(20):
+        player = board.whoseTurn
+        validMoves = board.getValidMoves(player)
+        for depth in [2, 3, 4]:
+            # The exact scores are searched without the transposition table, which only holds what the worker stored.
+            AlphaBetaPruningStrategy.useTranspositionTable = False
+            exactScores = []
+            for move in validMoves:
+                AlphaBetaPruningStrategy.getBestMove(board, player, depth, [move])
+                exactScores.append(AlphaBetaPruningStrategy.rootScores[0][1])
+            AlphaBetaPruningStrategy.useTranspositionTable = True
+            bestRootScore[0] = max(exactScores)
+
+            monkeypatch.setattr(AlphaBetaPruningStrategy, "sharedAlpha", sharedAlpha)
+            sharedAlpha.value = -math.inf
+            for move, exactScore in zip(validMoves, exactScores):
+                score, isExact, workerStats = searchRootMoveInWorker(board.getBoard(), board.whoseTurn, player, move, depth, "hard", None, None, getParallelSettings())
+                assert score >= exactScore - 1e-9
+                if(isExact):
+                    assert score == pytest.approx(exactScore, abs = 1e-9)
+            monkeypatch.setattr(AlphaBetaPruningStrategy, "sharedAlpha", None)
+        board.makeMove(player, *randomGenerator.choice(validMoves))
+
+
+# With a tiny aspiration window, the searches of the depths fail low or high and are searched again with wider windows,
+# which must end with the score of the full window search of the same depth.
+@pytest.mark.parametrize("engine", [AlphaBetaPruningStrategy, PrincipalVariationSearchStrategy])
+def test_aspiration_windows_find_the_full_window_score(engine, monkeypatch):
+    isProbCut = PrincipalVariationSearchStrategy.probCutDifficulties.get("hard")
+    engine.setDifficulty("hard")
+    PrincipalVariationSearchStrategy.setProbCut("hard", False)
+    monkeypatch.setitem(engine.aspirationWindows, "hard", 0.01)
+
+    failLows = failHighs = 0
+    try:
+        for board, player in getPositions(8, 11):
+            resetEngines()
+            engine.getBestMoveIterative(board, player, 1000, maxDepth = 4)
+            assert engine.searchStats["depth"] == 4
+            aspirationScore = max(score for move, score in engine.rootScores)
+            failLows += engine.searchStats.get("aspirationFailLows", 0)
+            failHighs += engine.searchStats.get("aspirationFailHighs", 0)
+
+            resetEngines()
+            engine.getBestMove(board, player, 4)
+            fullWindowScore = max(score for move, score in engine.rootScores)
+
+            assert aspirationScore == pytest.approx(fullWindowScore, abs = 1e-9)
+    finally:
+        PrincipalVariationSearchStrategy.setProbCut("hard", isProbCut)
+
+    # Both re-search paths were taken.
+    assert failLows > 0 and failHighs > 0
+
+
+# The nodes budget is checked every 256 nodes (and the first depth has no budget), so a search visits less than 256 nodes more than it.
+# The move returned is the one of the last completed depth: the same as the one of a search that stops at that depth.
+@pytest.mark.parametrize("maxNodes", [300, 1000, 4000])
+@pytest.mark.parametrize("engine", [AlphaBetaPruningStrategy, PrincipalVariationSearchStrategy])
+def test_iterative_deepening_keeps_the_nodes_budget(engine, maxNodes):
+    isProbCut = PrincipalVariationSearchStrategy.probCutDifficulties.get("hard")
+    engine.setDifficulty("hard")
+    PrincipalVariationSearchStrategy.setProbCut("hard", False)
+    try:
+        for board, player in getPositions(4, 13):
+            resetEngines()
+            bestMove, depth = engine.getBestMoveIterative(board, player, 1000, maxNodes)
+            assert engine.searchStats["depth"] == depth
+            assert engine.searchStats["nodes"] < maxNodes + 256
+            assert 1 <= depth < 64 - board.getScore("B") - board.getScore("W")
+
+            # The next depth needs more nodes than the budget, so the budget is what stopped the search.
+            resetEngines()
+            engine.getBestMoveIterative(board, player, 1000, maxDepth = depth + 1)
+            assert engine.searchStats["nodes"] >= maxNodes
+
+            resetEngines()
+            assert engine.getBestMoveIterative(board, player, 1000, maxDepth = depth) == (bestMove, depth)
+    finally:
+        PrincipalVariationSearchStrategy.setProbCut("hard", isProbCut)
@@ -0,0 +1,110 @@
+##############################################################################################################################
+# Project Name :  Othello                                                                                                    #
+# File Name    :  test_evaluationCache.py                                                                                    #
+# Description  :  This file checks the LRU eviction, the counters and the keys of the evaluation cache.                     #
+# Date         :  10/18/2026                                                                                                 #
+#                                                                                                                            #
+##############################################################################################################################
+
+import random
+
+import pytest
+
+from conftest import playRandomMoves
+from alphaBetaPruning import AlphaBetaPruningStrategy
+from board import ReversiBoard
+from evaluationCache import EvaluationCache
+from heuristics import GameHeuristics, gameHeuristics
+
+
+# A cache that holds the given number of entries.
+def getCache(entriesCount : int):
+    cache = EvaluationCache(entriesCount * EvaluationCache.bytesPerEntry / (1024 * 1024))
+    assert cache.maxEntries == entriesCount
+    return cache
+
+
+def test_the_least_recently_used_entry_is_evicted():
+    cache = getCache(3)
+    for key in [1, 2, 3]:
+        assert cache.probe(key) is None
+        cache.store(key, key * 10)
+
+    # A probe makes the entry the most recently used one, so 2 is now the oldest.
+    assert cache.probe(1) == 10
+    cache.store(4, 40)
+    assert cache.getSize() == 3 and cache.evictions == 1
+    assert cache.probe(2) is None
+    assert [cache.probe(key) for key in [3, 4, 1]] == [30, 40, 10]
+
+    # The order is now 3, 4, 1 (1 was probed last).
+    cache.store(5, 50)
+    cache.store(6, 60)
+    assert cache.evictions == 3
+    assert cache.probe(3) is None and cache.probe(4) is None
+    assert [cache.probe(key) for key in [1, 5, 6]] == [10, 50, 60]
+
+
+def test_hits_and_misses_are_counted():
+    cache = getCache(10)
+    assert cache.getHitRate() == 0
+
+    assert cache.probe(1) is None
+    cache.store(1, 0.5)
+    assert cache.probe(1) == 0.5
+    assert cache.probe(1) == 0.5
+    assert cache.probe(2) is None
+    assert (cache.hits, cache.misses) == (2, 2)
+    assert cache.getHitRate() == 0.5
+
+    cache.clear()
+    assert (cache.hits, cache.misses, cache.evictions, cache.getSize()) == (0, 0, 0, 0)
+
+    with pytest.raises(ValueError):
+        cache.setMaxMemory(0)
+
+
+def test_the_key_depends_on_the_player_and_the_weights(monkeypatch):
+    cache = getCache(10)
+    board = ReversiBoard()
+    mobilityWeight = GameHeuristics.mobility_weight
+    blackKey = cache.getKey(board, "B", gameHeuristics.getConfiguration())
+    assert cache.getKey(board, "W", gameHeuristics.getConfiguration()) != blackKey
+
+    monkeypatch.setattr(GameHeuristics, "mobility_weight", mobilityWeight + 0.1)
+    changedKey = cache.getKey(board, "B", gameHeuristics.getConfiguration())
+    assert changedKey != blackKey
+
+    # Going back to the first weights gives the first key again.
+    monkeypatch.setattr(GameHeuristics, "mobility_weight", mobilityWeight)
+    assert cache.getKey(board, "B", gameHeuristics.getConfiguration()) == blackKey
+    assert cache.getKey(board, "B", ("other evaluator",)) not in [blackKey, changedKey]
+
+
+# The leaves cached with some weights are not used after the weights change: the scores are the ones of a search without the cache.
+def test_no_stale_scores_after_the_weights_change(monkeypatch):
+    monkeypatch.setattr(AlphaBetaPruningStrategy, "lazyEvaluation", False)
+    monkeypatch.setattr(AlphaBetaPruningStrategy, "useTranspositionTable", False)
+    AlphaBetaPruningStrategy.setDifficulty("hard")
+    AlphaBetaPruningStrategy.evaluationCache.clear()
+    board = playRandomMoves(12, random.Random(3))
+    player = board.whoseTurn
+
+    AlphaBetaPruningStrategy.getBestMove(board, player, 2)
+    assert AlphaBetaPruningStrategy.evaluationCache.getSize() > 0
+
+    monkeypatch.setattr(GameHeuristics, "coinParity_weight", 0.3)
+    monkeypatch.setattr(GameHeuristics, "mobility_weight", 0.2)
+    AlphaBetaPruningStrategy.getBestMove(board, player, 2)
+    cachedScores = list(AlphaBetaPruningStrategy.rootScores)
+
+    monkeypatch.setattr(AlphaBetaPruningStrategy, "useEvaluationCache", False)
+    AlphaBetaPruningStrategy.getBestMove(board, player, 2)
+    assert cachedScores == AlphaBetaPruningStrategy.rootScores
+
+    # The second search of the same position with the new weights finds its leaves in the cache.
+    monkeypatch.setattr(AlphaBetaPruningStrategy, "useEvaluationCache", True)
+    hitsCount = AlphaBetaPruningStrategy.evaluationCache.hits
+    AlphaBetaPruningStrategy.getBestMove(board, player, 2)
+    assert AlphaBetaPruningStrategy.evaluationCache.hits > hitsCount
+    assert cachedScores == AlphaBetaPruningStrategy.rootScores
@@ -0,0 +1,78 @@
+##############################################################################################################################
+# Project Name :  Othello                                                                                                    #
+# File Name    :  test_lazySMP.py                                                                                            #
+# Description  :  This file checks the Lazy SMP search against the alpha-beta search, and that its helpers stop with it.     #
+# Date         :  10/18/2026                                                                                                 #
+#                                                                                                                            #
+##############################################################################################################################
+
+import random
+import time
+
+import pytest
+
+from conftest import playRandomMoves
+from alphaBetaPruning import AlphaBetaPruningStrategy
+from board import ReversiBoard
+from heuristics import GameHeuristics
+from lazySMP import LazySMPStrategy
+from moveOrdering import MoveOrdering
+
+
+# The helpers are started once for all the tests of the file, by a first search with the default settings.
+@pytest.fixture(scope = "module")
+def helpers():
+    LazySMPStrategy.setWorkers(2, 4)
+    LazySMPStrategy.setDifficulty("hard")
+    LazySMPStrategy.getBestMove(ReversiBoard(), "B", 2)
+    yield
+    LazySMPStrategy.shutdown()
+
+
+def getPositions(positionsCount : int, seed : int):
+    randomGenerator = random.Random(seed)
+    positions = []
+    while len(positions) < positionsCount:
+        board = playRandomMoves(randomGenerator.randint(4, 30), randomGenerator)
+        if(board.whoseTurn != " "):
+            positions.append((board, board.whoseTurn))
+    return positions
+
+
+# The weights of the heuristics are changed in this process after the helpers started: the helpers must search with them too,
+# otherwise the scores that they store in the shared table do not match the ones of the main search.
+@pytest.mark.parametrize("board, player", getPositions(6, 7))
+def test_lazy_smp_matches_alpha_beta(helpers, monkeypatch, board, player):
+    monkeypatch.setattr(GameHeuristics, "coinParity_weight", 0.3)
+    monkeypatch.setattr(GameHeuristics, "mobility_weight", 0.2)
+    LazySMPStrategy.setDifficulty("hard")
+
+    AlphaBetaPruningStrategy.transpositionTable.clear()
+    AlphaBetaPruningStrategy.moveOrdering = MoveOrdering()
+    alphaBetaMove = AlphaBetaPruningStrategy.getBestMove(board, player, 4)
+    alphaBetaScore = max(score for move, score in AlphaBetaPruningStrategy.rootScores)
+
+    # The helpers first fill the shared table for a while, then the main search reads it at a fixed depth.
+    LazySMPStrategy.sharedTable.clear()
+    LazySMPStrategy.getBestMoveIterative(board, player, 0.3, maxDepth = 5)
+    AlphaBetaPruningStrategy.moveOrdering = MoveOrdering()
+    lazySMPMove = LazySMPStrategy.getBestMove(board, player, 4)
+    lazySMPScore = max(score for move, score in AlphaBetaPruningStrategy.rootScores)
+
+    assert lazySMPMove == alphaBetaMove
+    assert lazySMPScore == pytest.approx(alphaBetaScore, abs = 1e-9)
+
+
+# The helpers search up to the end of the game, so they only stop because the main search tells them to.
+def test_helpers_stop_with_the_main_search(helpers):
+    LazySMPStrategy.setDifficulty("hard")
+    board = playRandomMoves(6, random.Random(11))
+
+    startTime = time.time()
+    bestMove, completedDepth = LazySMPStrategy.getBestMoveIterative(board, board.whoseTurn, 0.3)
+    assert time.time() - startTime < 10
+
+    assert bestMove in board.getValidMoves(board.whoseTurn) and completedDepth >= 1
+    assert LazySMPStrategy.searchStats["helperNodes"] > 0
+    assert LazySMPStrategy.stopSignal.value == 0
+
@@ -0,0 +1,68 @@
+##############################################################################################################################
+# Project Name :  Othello                                                                                                    #
+# File Name    :  test_monteCarloTreeSearch.py                                                                               #
+# Description  :  This file checks that the Monte Carlo Tree Search always returns a legal move, whatever its budget.        #
+# Date         :  10/18/2026                                                                                                 #
+#                                                                                                                            #
+##############################################################################################################################
+
+import random
+
+import pytest
+
+from conftest import playRandomMoves
+from board import ReversiBoard
+from monteCarloTreeSearch import MonteCarloTreeSearchStrategy
+
+
+def getPositions(positionsCount : int, seed : int):
+    randomGenerator = random.Random(seed)
+    positions = []
+    while len(positions) < positionsCount:
+        board = playRandomMoves(randomGenerator.randint(0, 58), randomGenerator)
+        if(board.whoseTurn != " "):
+            positions.append((board, board.whoseTurn))
+    return positions
+
+
+@pytest.fixture(autouse = True)
+def restoreSettings():
+    maxNodes, playoutPolicy = MonteCarloTreeSearchStrategy.maxNodes, MonteCarloTreeSearchStrategy.playoutPolicy
+    yield
+    MonteCarloTreeSearchStrategy.setMaxNodes(maxNodes)
+    MonteCarloTreeSearchStrategy.setPlayoutPolicy(playoutPolicy)
+
+
+@pytest.mark.parametrize("playoutPolicy", ["heuristic", "random"])
+@pytest.mark.parametrize("board, player", getPositions(10, 2023))
+def test_search_returns_a_legal_move(playoutPolicy, board, player):
+    MonteCarloTreeSearchStrategy.setPlayoutPolicy(playoutPolicy)
+    move = MonteCarloTreeSearchStrategy.search(board, player, iterations = 50)
+    assert move in board.getValidMoves(player)
+
+
+@pytest.mark.parametrize("board, player", getPositions(5, 7))
+def test_spent_budgets_still_return_a_legal_move(board, player):
+    move = MonteCarloTreeSearchStrategy.search(board, player, milliseconds = 1e-7)
+    assert move in board.getValidMoves(player)
+    assert MonteCarloTreeSearchStrategy.searchStats["iterations"] >= 1
+
+    MonteCarloTreeSearchStrategy.setMaxNodes(1)
+    move = MonteCarloTreeSearchStrategy.search(board, player, iterations = 5)
+    assert move in board.getValidMoves(player)
+
+
+def test_player_without_moves_gets_none():
+    # A position from a random game where the player who just moved plays again, because the other player has to pass.
+    randomGenerator = random.Random(2023)
+    while True:
+        board = playRandomMoves(58, randomGenerator)
+        opponent = "W" if board.whoseTurn == "B" else "B"
+        if(board.whoseTurn != " " and board.getValidMoves(opponent) == []):
+            break
+    assert MonteCarloTreeSearchStrategy.search(board, opponent, iterations = 10) is None
+
+
+def test_search_needs_a_budget():
+    with pytest.raises(ValueError):
+        MonteCarloTreeSearchStrategy.search(ReversiBoard(), "B")
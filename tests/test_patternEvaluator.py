@@ -0,0 +1,64 @@
+##############################################################################################################################
+# Project Name :  Othello                                                                                                    #
+# File Name    :  test_patternEvaluator.py                                                                                   #
+# Description  :  This file checks that the pattern tables are read back from their binary file as they were written.       #
+# Date         :  10/18/2026                                                                                                 #
+#                                                                                                                            #
+##############################################################################################################################
+
+import random
+import struct
+
+import pytest
+
+from board import PATTERN_TYPES, PATTERN_INSTANCES
+from patternEvaluator import PatternEvaluator, savePatternTables, buildSwappedIndices, PATTERN_SIZES, PHASES_COUNT, HEADER_FORMAT
+
+
+# Random tables whose values are multiples of 1/256, the scale of the file, so they are written exactly.
+def getRandomTables(seed : int):
+    randomGenerator = random.Random(seed)
+    return [[[(randomGenerator.getrandbits(13) - 4096) / 256 for index in range(size)] for size in PATTERN_SIZES] for phase in range(PHASES_COUNT)]
+
+
+def test_tables_round_trip(tmp_path):
+    tables = getRandomTables(5)
+    fileName = str(tmp_path / "patternTables.bin")
+    savePatternTables(tables, fileName)
+    evaluator = PatternEvaluator(fileName)
+
+    # The tables of white are the same with the colors of the indices swapped.
+    swappedIndices = [buildSwappedIndices(len(squares)) for name, squares in PATTERN_TYPES]
+    for phase in range(PHASES_COUNT):
+        for instance, (patternType, squares) in enumerate(PATTERN_INSTANCES):
+            assert evaluator.blackTables[phase][instance] == tables[phase][patternType]
+            assert evaluator.whiteTables[phase][instance] == [tables[phase][patternType][swappedIndex] for swappedIndex in swappedIndices[patternType]]
+
+
+def test_values_are_clamped_to_16_bits(tmp_path):
+    tables = getRandomTables(6)
+    tables[0][0][0] = 1000
+    tables[0][0][1] = -1000
+    fileName = str(tmp_path / "patternTables.bin")
+    savePatternTables(tables, fileName)
+    evaluator = PatternEvaluator(fileName)
+    assert evaluator.blackTables[0][0][0] == 32767 / 256
+    assert evaluator.blackTables[0][0][1] == -32768 / 256
+
+
+def test_other_files_are_rejected(tmp_path):
+    fileName = str(tmp_path / "patternTables.bin")
+    savePatternTables(getRandomTables(7), fileName)
+    with open(fileName, "rb") as tablesFile:
+        data = tablesFile.read()
+    headerSize = struct.calcsize(HEADER_FORMAT)
+    magic, version, phasesCount, scale = struct.unpack(HEADER_FORMAT, data[:headerSize])
+
+    badFileName = str(tmp_path / "bad.bin")
+    for header in [struct.pack(HEADER_FORMAT, b"XXXX", version, phasesCount, scale),
+                   struct.pack(HEADER_FORMAT, magic, version + 1, phasesCount, scale),
+                   struct.pack(HEADER_FORMAT, magic, version, phasesCount + 1, scale)]:
+        with open(badFileName, "wb") as badFile:
+            badFile.write(header + data[headerSize:])
+        with pytest.raises(ValueError):
+            PatternEvaluator(badFileName)
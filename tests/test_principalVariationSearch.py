@@ -0,0 +1,66 @@
+##############################################################################################################################
+# Project Name :  Othello                                                                                                    #
+# File Name    :  test_principalVariationSearch.py                                                                           #
+# Description  :  This file checks that Multi-ProbCut can be turned off, and that it cuts with loaded parameters.          #
+# Date         :  10/18/2026                                                                                                 #
+#                                                                                                                            #
+##############################################################################################################################
+
+import json
+import random
+
+import pytest
+
+from conftest import playRandomMoves
+from moveOrdering import MoveOrdering
+from principalVariationSearch import PrincipalVariationSearchStrategy, getGamePhase
+
+
+def getPositions(positionsCount : int, seed : int):
+    randomGenerator = random.Random(seed)
+    positions = []
+    while len(positions) < positionsCount:
+        board = playRandomMoves(randomGenerator.randint(8, 36), randomGenerator)
+        if(board.whoseTurn != " "):
+            positions.append((board, board.whoseTurn))
+    return positions
+
+
+# The search of the tests starts with an empty transposition table, and Multi-ProbCut is turned back to its setting afterwards.
+@pytest.fixture
+def hardSearch():
+    isProbCut = PrincipalVariationSearchStrategy.probCutDifficulties.get("hard")
+    PrincipalVariationSearchStrategy.setDifficulty("hard")
+    yield
+    PrincipalVariationSearchStrategy.setProbCut("hard", isProbCut)
+
+
+def search(board, player, depth):
+    PrincipalVariationSearchStrategy.transpositionTable.clear()
+    PrincipalVariationSearchStrategy.moveOrdering = MoveOrdering()
+    return PrincipalVariationSearchStrategy.getBestMove(board, player, depth)
+
+
+def test_probcut_can_be_turned_off(hardSearch):
+    PrincipalVariationSearchStrategy.setProbCut("hard", False)
+    for board, player in getPositions(6, 3):
+        search(board, player, 5)
+        assert PrincipalVariationSearchStrategy.searchStats["probCuts"] == 0
+
+
+# One parameter set (the shallow score predicts the deep one exactly, within a small sigma) is loaded from a file for every phase,
+# and the loader gives it to the deeper depths of the same parity.
+def test_probcut_cuts_with_loaded_parameters(hardSearch, monkeypatch, tmp_path):
+    parametersFile = tmp_path / "probCutParameters.json"
+    parametersFile.write_text(json.dumps({str(phase): {"3": [1, 1.0, 0.0, 1.0]} for phase in range(4)}))
+    monkeypatch.setattr(PrincipalVariationSearchStrategy, "probCutParameters", {})
+    PrincipalVariationSearchStrategy.loadProbCutParameters(str(parametersFile))
+    assert PrincipalVariationSearchStrategy.probCutParameters[getGamePhase(40)][5] == (3, 1.0, 0.0, 1.0)
+
+    PrincipalVariationSearchStrategy.setProbCut("hard", True)
+    probCuts = 0
+    for board, player in getPositions(6, 3):
+        bestMove = search(board, player, 5)
+        assert bestMove in board.getValidMoves(player)
+        probCuts += PrincipalVariationSearchStrategy.searchStats["probCuts"]
+    assert probCuts > 0
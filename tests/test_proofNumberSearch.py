@@ -0,0 +1,30 @@
+##############################################################################################################################
+# Project Name :  Othello                                                                                                    #
+# File Name    :  test_proofNumberSearch.py                                                                                  #
+# Description  :  This file checks that the proof-number search agrees with the endgame solver.                              #
+# Date         :  10/18/2026                                                                                                 #
+#                                                                                                                            #
+##############################################################################################################################
+
+import pytest
+
+from endgameSolver import EndgameSolver
+from proofNumberSearch import ProofNumberSearchStrategy
+from conftest import getEndgamePositions
+
+
+@pytest.mark.parametrize("board, player", getEndgamePositions(9, 12, 7))
+def test_result_matches_the_endgame_solver(board, player):
+    exactScore = EndgameSolver.solve(board, player)[1]
+    bestMove, result = ProofNumberSearchStrategy.solve(board, player)
+    assert result == (exactScore > 0) - (exactScore < 0)
+
+    # A winning or drawing move keeps the result.
+    if(result >= 0):
+        child = board.getCopy()
+        child.makeMove(player, bestMove[0], bestMove[1])
+        if(child.whoseTurn == player or child.whoseTurn == " "):
+            childScore = EndgameSolver.solve(child, player)[1]
+        else:
+            childScore = -EndgameSolver.solve(child, child.whoseTurn)[1]
+        assert (childScore > 0) - (childScore < 0) == result
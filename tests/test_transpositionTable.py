@@ -0,0 +1,86 @@
+##############################################################################################################################
+# Project Name :  Othello                                                                                                    #
+# File Name    :  test_transpositionTable.py                                                                                 #
+# Description  :  This file checks the replacement policy of the transposition tables.                                      #
+# Date         :  10/18/2026                                                                                                 #
+#                                                                                                                            #
+##############################################################################################################################
+
+import pytest
+
+from transpositionTable import TranspositionTable, SharedTranspositionTable, EXACT, LOWER_BOUND, UPPER_BOUND
+
+
+# Both tables with a single bucket, so every key falls in the same bucket and the replacement policy decides what is kept.
+@pytest.fixture(params = ["local", "shared"])
+def table(request):
+    if(request.param == "local"):
+        yield TranspositionTable(1e-6)
+    else:
+        sharedTable = SharedTranspositionTable(1e-6)
+        yield sharedTable
+        sharedTable.close()
+
+
+def test_single_bucket(table):
+    assert table.bucketsCount == 1
+
+
+def test_probe_returns_the_stored_entry(table):
+    assert table.probe(11) is None
+    table.store(11, 4, 1.5, EXACT, [2, 3])
+    key, depth, score, boundType, bestMove = table.probe(11)
+    assert (key, depth, score, boundType, list(bestMove)) == (11, 4, 1.5, EXACT, [2, 3])
+    assert table.getSize() == 1
+
+
+def test_shallower_entry_goes_to_the_always_replace_slot(table):
+    table.store(1, 5, 10.0, EXACT, None)
+    table.store(2, 2, 20.0, LOWER_BOUND, None)
+    assert table.probe(1)[1] == 5
+    assert table.probe(2)[1] == 2
+
+    # The always-replace slot takes the newest shallow entry, the deep one stays.
+    table.store(3, 1, 30.0, UPPER_BOUND, None)
+    assert table.probe(1) is not None
+    assert table.probe(2) is None
+    assert table.probe(3)[2] == 30.0
+    assert table.getSize() == 2
+
+
+def test_deeper_entry_moves_the_old_one_down(table):
+    table.store(1, 5, 10.0, EXACT, None)
+    table.store(2, 2, 20.0, EXACT, None)
+    table.store(3, 6, 30.0, EXACT, None)
+
+    # The new deepest entry is depth-preferred, the previous one replaces the always-replace entry.
+    assert table.probe(3)[1] == 6
+    assert table.probe(1)[1] == 5
+    assert table.probe(2) is None
+
+
+def test_same_key_is_always_updated(table):
+    table.store(1, 5, 10.0, EXACT, None)
+    table.store(1, 2, -4.0, UPPER_BOUND, None)
+    assert table.probe(1)[1:4] == (2, -4.0, UPPER_BOUND)
+    assert table.getSize() == 1
+
+
+def test_clear_removes_every_entry(table):
+    table.store(1, 5, 10.0, EXACT, None)
+    table.clear()
+    assert table.probe(1) is None
+    assert table.getSize() == 0
+
+
+def test_counters():
+    table = TranspositionTable(1)
+    table.store(7, 3, 0.0, EXACT, None)
+    table.probe(7)
+    table.probe(8)
+    assert (table.probes, table.hits, table.stores) == (2, 1, 1)
+
+
+def test_memory_must_be_positive():
+    with pytest.raises(ValueError):
+        TranspositionTable(0)
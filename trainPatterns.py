@@ -0,0 +1,129 @@
+##############################################################################################################################
+# Project Name :  Othello                                                                                                    #
+# File Name    :  trainPatterns.py                                                                                           #
+# Description  :  This file learns the tables of the pattern evaluator from self-play games and writes them to             #
+#                 patternTables.bin.                                                                                         #
+# Date         :  10/18/2026                                                                                                 #
+#                                                                                                                            #
+##############################################################################################################################
+
+# Usage: python trainPatterns.py [games count] [epochs]
+# The principal variation search plays games against itself from random openings (so the games are different)
+# until EXACT_EMPTIES empty squares are left, and the end of the game is solved exactly by the endgame solver.
+# Every position of the game is labeled with the final disc difference for its player to move, and the values of the tables
+# are fitted to the labels by stochastic gradient descent (the score of a position is the sum of the values of its pattern instances).
+
+import random
+import sys
+
+from board import ReversiBoard, PATTERN_INSTANCES
+from endgameSolver import EndgameSolver
+from principalVariationSearch import PrincipalVariationSearchStrategy
+from patternEvaluator import PATTERN_SIZES, PHASES_COUNT, getPatternPhase, buildSwappedIndices, savePatternTables, PATTERN_TABLES_FILE
+
+
+# The engine plays the games with this depth and difficulty, after RANDOM_OPENING_MOVES random moves.
+# (random moves later in the game would make the final result a noisy label for the positions before them)
+GAME_DEPTH = 2
+GAME_DIFFICULTY = "hard"
+RANDOM_OPENING_MOVES = 10
+
+# The end of the game is solved exactly from this number of empty squares (the positions after it are not used,
+# the AI player solves them exactly too).
+EXACT_EMPTIES = 10
+
+# The learning rate of the gradient descent (the error is shared by the 34 instances of a position).
+LEARNING_RATE = 0.002
+
+
+# This function plays the self-play games and returns the samples of every phase, as lists of (features, label).
+# The features of a position are the offsets of its instances in the flat table of the phase (see getFeatures).
+def getSamples(gamesCount : int, randomGenerator : random.Random):
+    PrincipalVariationSearchStrategy.setDifficulty(GAME_DIFFICULTY)
+    swappedIndices = {len(squares): buildSwappedIndices(len(squares)) for patternType, squares in PATTERN_INSTANCES}
+
+    samples = [[] for phase in range(PHASES_COUNT)]
+    for gameIndex in range(gamesCount):
+        board = ReversiBoard()
+        board.enablePatternIndices()
+        positions = []
+        while True:
+            player = board.whoseTurn
+            emptySquares = 64 - board.getScore("W") - board.getScore("B")
+            if(player == " " or emptySquares <= EXACT_EMPTIES):
+                break
+            positions.append((getPatternPhase(emptySquares), getFeatures(board.getPatternIndices(), player, swappedIndices), player))
+
+            if(len(positions) <= RANDOM_OPENING_MOVES):
+                move = randomGenerator.choice(board.getValidMoves(player))
+            else:
+                move = PrincipalVariationSearchStrategy.getBestMove(board, player, GAME_DEPTH)
+            board.makeMove(player, move[0], move[1])
+
+        # The final disc difference for black, with both players playing perfectly from EXACT_EMPTIES.
+        if(board.whoseTurn == " "):
+            blackResult = board.getScore("B") - board.getScore("W")
+        else:
+            move, score = EndgameSolver.solve(board, board.whoseTurn)
+            blackResult = score if board.whoseTurn == "B" else -score
+
+        for phase, features, player in positions:
+            samples[phase].append((features, blackResult if player == "B" else -blackResult))
+
+        if((gameIndex + 1) % 50 == 0):
+            print(f"{gameIndex + 1} games played")
+    return samples
+
+
+# The offset of the table of every pattern type in the flat table of a phase.
+TABLE_OFFSETS = [sum(PATTERN_SIZES[:patternType]) for patternType in range(len(PATTERN_SIZES))]
+
+
+# This function returns the offsets of the instances of a position in the flat table of its phase, for the given player to move
+# (for white, the colors of the indices are swapped, so the tables are always for the player to move, like the ones of black).
+def getFeatures(indices, player : str, swappedIndices):
+    features = []
+    for (patternType, squares), index in zip(PATTERN_INSTANCES, indices):
+        if(player == "W"):
+            index = swappedIndices[len(squares)][index]
+        features.append(TABLE_OFFSETS[patternType] + index)
+    return tuple(features)
+
+
+# This function fits the flat table of a phase to its samples and returns the mean absolute error of the last epoch.
+def fitPhase(weights, samples, epochs : int, randomGenerator : random.Random):
+    meanError = 0
+    for epoch in range(epochs):
+        randomGenerator.shuffle(samples)
+        totalError = 0
+        for features, label in samples:
+            error = label - sum([weights[feature] for feature in features])
+            totalError += abs(error)
+            step = LEARNING_RATE * error
+            for feature in features:
+                weights[feature] += step
+        meanError = totalError / max(1, len(samples))
+    return meanError
+
+
+# This function plays the games, fits the tables of every phase and returns them as tables[phase][pattern type].
+def train(gamesCount : int, epochs : int, seed : int = 2023):
+    randomGenerator = random.Random(seed)
+    samples = getSamples(gamesCount, randomGenerator)
+
+    tables = []
+    for phase in range(PHASES_COUNT):
+        weights = [0.0] * sum(PATTERN_SIZES)
+        meanError = fitPhase(weights, samples[phase], epochs, randomGenerator)
+        print(f"phase {phase}: {len(samples[phase])} positions, mean error {meanError:.2f} discs")
+        tables.append([weights[offset:offset + size] for offset, size in zip(TABLE_OFFSETS, PATTERN_SIZES)])
+    return tables
+
+
+if __name__ == "__main__":
+    gamesCount = int(sys.argv[1]) if len(sys.argv) > 1 else 3000
+    epochs = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    tables = train(gamesCount, epochs)
+
+    savePatternTables(tables)
+    print(f"The tables were written to {PATTERN_TABLES_FILE}")
@@ -0,0 +1,220 @@
+##############################################################################################################################
+# Project Name :  Othello                                                                                                    #
+# File Name    :  transpositionTable.py                                                                                      #
+# Description  :  This file contains the transposition table used by the search strategies to remember the results of the   #
+#                 positions that were already searched.                                                                      #
+# Date         :  10/18/2026                                                                                                 #
+#                                                                                                                            #
+##############################################################################################################################
+
+import struct
+from multiprocessing import shared_memory
+
+# The same position can be reached through different move orders (transpositions), so instead of searching it again
+# the search stores the result of every position in this table, keyed by the Zobrist hash of the position.
+
+# Each entry is a tuple: (key, depth, score, bound type, best move)
+# The bound type tells how the score relates to the real value of the position:
+EXACT = 0        # The score is the real value of the position.
+LOWER_BOUND = 1  # The search failed high (score >= beta), so the real value is at least the score.
+UPPER_BOUND = 2  # The search failed low (score <= alpha), so the real value is at most the score.
+
+
+class TranspositionTable:
+
+    # A rough estimate of the memory used by one entry (the tuple, the integers and the float inside it and the slot pointer).
+    # It is used to turn the memory cap into a number of entries.
+    bytesPerEntry = 200
+
+    ##############################################################################################################################
+    # The constructor:
+    # maxMemoryMB: The maximum memory that the table is allowed to use, in megabytes.
+    ##############################################################################################################################
+    def __init__(self, maxMemoryMB : float = 32):
+        self.setMaxMemory(maxMemoryMB)
+
+    # This method sets the memory cap of the table and clears it.
+    # The table is made of buckets, each holding two entries:
+    # A depth-preferred entry, which is only replaced by a search of the same depth or deeper,
+    # and an always-replace entry, which takes the most recent result that did not fit in the depth-preferred one.
+    # The number of buckets is a power of 2, so the bucket of a key is found with a mask.
+    def setMaxMemory(self, maxMemoryMB : float):
+        if(maxMemoryMB <= 0):
+            raise ValueError("The memory of the transposition table must be positive")
+
+        maxEntries = int(maxMemoryMB * 1024 * 1024) // self.bytesPerEntry
+        bucketsCount = 1
+        while(bucketsCount * 4 <= maxEntries): # Every bucket holds 2 entries
+            bucketsCount *= 2
+
+        self.maxMemoryMB = maxMemoryMB
+        self.bucketsCount = bucketsCount
+        self.mask = bucketsCount - 1
+        self.clear()
+
+    # This method removes all the entries from the table and resets its counters.
+    def clear(self):
+        self.depthPreferred = [None] * self.bucketsCount
+        self.alwaysReplace = [None] * self.bucketsCount
+        self.probes = 0
+        self.hits = 0
+        self.stores = 0
+
+    # This method returns the entry stored for the given key, or None if there is no such entry.
+    def probe(self, key : int):
+        self.probes += 1
+        index = key & self.mask
+
+        entry = self.depthPreferred[index]
+        if(entry is not None and entry[0] == key):
+            self.hits += 1
+            return entry
+
+        entry = self.alwaysReplace[index]
+        if(entry is not None and entry[0] == key):
+            self.hits += 1
+            return entry
+
+        return None
+
+    # This method stores the result of a search in the table.
+    # key: The hash of the position.
+    # depth: The depth that the position was searched to.
+    # score: The score that the search returned.
+    # boundType: EXACT, LOWER_BOUND or UPPER_BOUND.
+    # bestMove: The best move found by the search (or the move that caused the cutoff), None if there is no move.
+    def store(self, key : int, depth : int, score, boundType : int, bestMove):
+        self.stores += 1
+        index = key & self.mask
+        entry = (key, depth, score, boundType, bestMove)
+
+        current = self.depthPreferred[index]
+        if(current is None or current[0] == key or depth >= current[1]):
+            # The old depth-preferred entry is moved down instead of being thrown away
+            if(current is not None and current[0] != key):
+                self.alwaysReplace[index] = current
+            self.depthPreferred[index] = entry
+        else:
+            self.alwaysReplace[index] = entry
+
+    # This method returns the number of entries in the table.
+    def getSize(self):
+        return self.bucketsCount * 2 - self.depthPreferred.count(None) - self.alwaysReplace.count(None)
+
+
+##############################################################################################################################
+# The shared transposition table:
+# The same table, stored in a block of shared memory so that several processes can read and write it at the same time.
+##############################################################################################################################
+
+# Every entry is stored in a slot of 3 unsigned 64-bit integers: (check, data, score bits).
+# data packs the depth (8 bits), the bound type (2 bits) and the best move (7 bits, the square number or 64 for no move),
+# and the score is stored as the bits of its double.
+# There is no lock: check is key ^ data ^ score bits, so an entry that was half written by another process does not match its key and is ignored.
+SLOT_FORMAT = struct.Struct("<QQQ")
+DOUBLE_FORMAT = struct.Struct("<d")
+BITS_FORMAT = struct.Struct("<Q")
+NO_MOVE = 64
+
+
+class SharedTranspositionTable:
+
+    ##############################################################################################################################
+    # The constructor:
+    # maxMemoryMB: The size of the table in megabytes (it is created with this size and cannot be resized).
+    # name: The name of an existing shared table to attach to (used by the other processes), None to create a new one.
+    ##############################################################################################################################
+    def __init__(self, maxMemoryMB : float = 32, name : str = None):
+        bucketsCount = 1
+        while(bucketsCount * 4 * SLOT_FORMAT.size <= maxMemoryMB * 1024 * 1024): # Every bucket holds 2 slots
+            bucketsCount *= 2
+
+        self.maxMemoryMB = maxMemoryMB
+        self.bucketsCount = bucketsCount
+        self.mask = bucketsCount - 1
+        self.isOwner = name is None
+        if(self.isOwner):
+            self.sharedMemory = shared_memory.SharedMemory(create = True, size = bucketsCount * 2 * SLOT_FORMAT.size)
+        else:
+            self.sharedMemory = shared_memory.SharedMemory(name = name)
+        self.name = self.sharedMemory.name
+        self.buffer = self.sharedMemory.buf
+
+        self.probes = 0
+        self.hits = 0
+        self.stores = 0
+        if(self.isOwner):
+            self.clear()
+
+    # The memory of a shared table is fixed when it is created.
+    def setMaxMemory(self, maxMemoryMB : float):
+        raise Exception("The size of a shared transposition table cannot be changed")
+
+    # This method removes all the entries from the table (for all the processes) and resets its counters.
+    def clear(self):
+        self.buffer[:] = bytes(len(self.buffer))
+        self.probes = 0
+        self.hits = 0
+        self.stores = 0
+
+    # This private method reads the slot at the given position and returns its entry if it belongs to the key.
+    def __readSlot(self, slot : int, key : int):
+        check, data, scoreBits = SLOT_FORMAT.unpack_from(self.buffer, slot * SLOT_FORMAT.size)
+        if(check ^ data ^ scoreBits != key):
+            return None
+        square = data >> 10
+        move = None if square == NO_MOVE else [square >> 3, square & 7]
+        score = DOUBLE_FORMAT.unpack(BITS_FORMAT.pack(scoreBits))[0]
+        return (key, data & 0xFF, score, (data >> 8) & 3, move)
+
+    # This method returns the entry stored for the given key, or None if there is no such entry.
+    # The entries have the same form as the ones of TranspositionTable: (key, depth, score, bound type, best move).
+    def probe(self, key : int):
+        self.probes += 1
+        slot = (key & self.mask) * 2
+
+        entry = self.__readSlot(slot, key)
+        if(entry is None):
+            entry = self.__readSlot(slot + 1, key)
+
+        if(entry is not None):
+            self.hits += 1
+        return entry
+
+    # This method stores the result of a search in the table, with the same replacement policy as TranspositionTable:
+    # The first slot of a bucket is depth-preferred and the second one is always replaced.
+    def store(self, key : int, depth : int, score, boundType : int, bestMove):
+        self.stores += 1
+        slot = (key & self.mask) * 2
+
+        square = NO_MOVE if bestMove is None else bestMove[0] * 8 + bestMove[1]
+        data = min(depth, 0xFF) | (boundType << 8) | (square << 10)
+        scoreBits = BITS_FORMAT.unpack(DOUBLE_FORMAT.pack(score))[0]
+
+        currentCheck, currentData, currentScoreBits = SLOT_FORMAT.unpack_from(self.buffer, slot * SLOT_FORMAT.size)
+        currentKey = currentCheck ^ currentData ^ currentScoreBits
+        isEmpty = currentCheck == 0 and currentData == 0 and currentScoreBits == 0
+
+        if(isEmpty or currentKey == key or depth >= currentData & 0xFF):
+            # The old depth-preferred entry is moved down instead of being thrown away
+            if(not isEmpty and currentKey != key):
+                SLOT_FORMAT.pack_into(self.buffer, (slot + 1) * SLOT_FORMAT.size, currentCheck, currentData, currentScoreBits)
+        else:
+            slot += 1
+
+        SLOT_FORMAT.pack_into(self.buffer, slot * SLOT_FORMAT.size, key ^ data ^ scoreBits, data, scoreBits)
+
+    # This method returns the number of entries in the table.
+    def getSize(self):
+        size = 0
+        for slot in range(self.bucketsCount * 2):
+            if(SLOT_FORMAT.unpack_from(self.buffer, slot * SLOT_FORMAT.size) != (0, 0, 0)):
+                size += 1
+        return size
+
+    # This method releases the shared memory. The process that created the table also frees it for the other processes.
+    def close(self):
+        self.buffer.release()
+        self.sharedMemory.close()
+        if(self.isOwner):
+            self.sharedMemory.unlink()